@@ -0,0 +1,83 @@
+"""Tests for streaming aggregation of scan results."""
+
+from __future__ import annotations
+
+import pickle
+
+from xposedornot import BreachAggregator, BreachCatalog
+from xposedornot.models import (
+    Breach,
+    BreachAnalyticsResponse,
+    EmailBreachDetailedResponse,
+    EmailBreachResponse,
+)
+
+from .conftest import (
+    SAMPLE_BREACH_ANALYTICS_RESPONSE,
+    SAMPLE_BREACHES_RESPONSE,
+    SAMPLE_PLUS_CHECK_EMAIL_RESPONSE,
+)
+
+
+def make_catalog() -> BreachCatalog:
+    """Create the sample breach catalog."""
+    return BreachCatalog(Breach.from_dict(b) for b in SAMPLE_BREACHES_RESPONSE["exposedBreaches"])
+
+
+class TestBreachAggregator:
+    """Tests for BreachAggregator."""
+
+    def test_free_results_use_catalog(self) -> None:
+        """Test rollups of name-only results enriched from the catalog."""
+        agg = BreachAggregator(catalog=make_catalog())
+        agg.add_all(
+            [
+                EmailBreachResponse(breaches=["Adobe", "LinkedIn"]),
+                EmailBreachResponse(breaches=["Adobe", "Unknown"]),
+                None,
+            ]
+        )
+
+        assert (agg.addresses, agg.exposed_addresses, agg.exposures) == (3, 2, 4)
+        assert agg.by_breach == {"Adobe": 2, "LinkedIn": 1, "Unknown": 1}
+        metrics = agg.metrics()
+        assert metrics.industry == [
+            {"name": "Technology", "count": 2},
+            {"name": "Social", "count": 1},
+        ]
+        assert metrics.yearwise_details == [
+            {"year": 2012, "count": 1},
+            {"year": 2013, "count": 2},
+        ]
+        assert {"name": "Passwords", "count": 3} in metrics.xposed_data
+        assert metrics.passwords_strength == [{"name": "high", "count": 3}]
+
+    def test_plus_and_analytics_results(self) -> None:
+        """Test rollups of detailed results."""
+        agg = BreachAggregator()
+        agg.add(EmailBreachDetailedResponse.from_api_response(SAMPLE_PLUS_CHECK_EMAIL_RESPONSE))
+        agg.add(BreachAnalyticsResponse.from_api_response(SAMPLE_BREACH_ANALYTICS_RESPONSE))
+
+        assert agg.by_breach == {"Poshmark": 1, "Adobe": 2}
+        assert agg.by_year == {2018: 1, 2013: 2}
+        assert agg.by_industry == {"Technology": 1}
+        assert agg.by_password_risk["easytocrack"] == 1
+
+    def test_merge_across_workers(self) -> None:
+        """Test that pickled partial aggregates merge into the same totals."""
+        results = [
+            EmailBreachResponse(breaches=["Adobe"]),
+            EmailBreachResponse(breaches=["LinkedIn"]),
+        ]
+        whole = BreachAggregator(catalog=make_catalog())
+        whole.add_all(results)
+
+        parts = []
+        for result in results:
+            part = BreachAggregator(catalog=make_catalog())
+            part.add(result)
+            parts.append(pickle.loads(pickle.dumps(part)))
+        merged = BreachAggregator().merge(parts[0]).merge(parts[1])
+
+        assert merged.metrics() == whole.metrics()
+        assert merged.exposures == 2
@@ -0,0 +1,91 @@
+"""Tests for the password audit pipeline."""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+import pytest
+import respx
+from httpx import Response
+
+from xposedornot import XposedOrNot
+from xposedornot.audit import PasswordAuditor, iter_lines
+from xposedornot.utils import hash_password_keccak512, keccak512_digests, keccak512_prefix
+
+from .conftest import SAMPLE_PASSWORD_RESPONSE
+
+PASSWORD_ROUTE = re.compile(r"https://passwords\.xposedornot\.com/api/v1/pass/anon/(?P<prefix>\w+)")
+
+
+class TestIterLines:
+    """Tests for zero-copy line splitting."""
+
+    def test_splits_lines_and_skips_blanks(self) -> None:
+        """Test that blank lines are skipped but still counted."""
+        lines = list(iter_lines(b"alpha\r\n\nbeta\ngamma"))
+
+        assert [(n, off, bytes(v)) for n, off, v in lines] == [
+            (1, 0, b"alpha"),
+            (3, 8, b"beta"),
+            (4, 13, b"gamma"),
+        ]
+
+    def test_lines_are_views(self) -> None:
+        """Test that lines are memoryviews rather than copies."""
+        _, _, line = next(iter_lines(b"alpha\n"))
+        assert isinstance(line, memoryview)
+
+
+class TestBatchHashing:
+    """Tests for the batch Keccak-512 helpers."""
+
+    def test_matches_single_hash(self) -> None:
+        """Test that batch digests give the same prefix as hash_password_keccak512."""
+        digests = keccak512_digests(["password123", b"password123", memoryview(b"password123")])
+
+        assert {keccak512_prefix(d) for d in digests} == {hash_password_keccak512("password123")}
+
+
+class TestPasswordAuditor:
+    """Tests for the PasswordAuditor."""
+
+    @respx.mock
+    def test_audit_reports_each_line(self, tmp_path: Path) -> None:
+        """Test that every line is reported and each prefix looked up once."""
+        exposed = hash_password_keccak512("password123")
+
+        def lookup(request, prefix):  # type: ignore[no-untyped-def]
+            if prefix == exposed:
+                return Response(200, json=SAMPLE_PASSWORD_RESPONSE)
+            return Response(404, json={"Error": "Not found"})
+
+        route = respx.get(PASSWORD_ROUTE).mock(side_effect=lookup)
+
+        wordlist = tmp_path / "wordlist.txt"
+        wordlist.write_bytes(b"password123\nunique-xyz\n\npassword123\n")
+
+        client = XposedOrNot(api_key="test-key")
+        auditor = PasswordAuditor(client, concurrency=2, batch_size=2)
+        records = list(auditor.audit(wordlist))
+
+        assert [r.line_number for r in records] == [1, 2, 4]
+        assert [r.count for r in records] == [12345, 0, 12345]
+        assert [r.duplicate for r in records] == [False, False, True]
+        assert records[0].exposed and not records[1].exposed
+        assert route.call_count == 2
+        assert auditor.stats.lines == 3
+        assert auditor.stats.unique_passwords == 2
+        assert auditor.stats.exposed == 2
+
+    def test_audit_empty_file(self, tmp_path: Path) -> None:
+        """Test that an empty file yields no records."""
+        wordlist = tmp_path / "empty.txt"
+        wordlist.write_bytes(b"")
+
+        assert list(XposedOrNot().audit_passwords(wordlist)) == []
+
+    def test_invalid_concurrency(self) -> None:
+        """Test that concurrency must be positive."""
+        with pytest.raises(ValueError):
+            PasswordAuditor(XposedOrNot(), concurrency=0)
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import time
+
+import pytest
 import respx
 from httpx import Response
 
-from xposedornot import XposedOrNot
+from xposedornot import RateLimiter, ResponseCache, XposedOrNot
+from xposedornot.endpoints import BreachesEndpoint
 from xposedornot.models import Breach
 
 from .conftest import SAMPLE_BREACHES_RESPONSE
@@ -70,3 +74,111 @@ class TestGetBreaches:
         result = client.get_breaches()
 
         assert result == []
+
+
+class TestDomainPlanner:
+    """Tests for answering domain lookups from the full catalog."""
+
+    @respx.mock
+    def test_one_off_lookups_stay_filtered(self) -> None:
+        """Test that a few domain lookups send per-domain requests."""
+        route = respx.get("https://api.xposedornot.com/v1/breaches").mock(
+            return_value=Response(200, json={"status": "success", "exposedBreaches": []})
+        )
+
+        client = XposedOrNot(rate_limiter=RateLimiter(min_interval=0))
+        for domain in ("a.com", "b.com", "c.com"):
+            client.get_breaches(domain=domain)
+
+        assert route.call_count == 3
+        assert all("domain=" in str(call.request.url) for call in route.calls)
+
+    @respx.mock
+    def test_burst_switches_to_catalog(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a burst of distinct domains is served from one catalog fetch."""
+        monkeypatch.setattr(BreachesEndpoint, "BATCH_THRESHOLD", 2)
+        filtered = respx.get(
+            "https://api.xposedornot.com/v1/breaches", params={"domain": "x.com"}
+        ).mock(return_value=Response(200, json={"status": "success", "exposedBreaches": []}))
+        full = respx.get("https://api.xposedornot.com/v1/breaches").mock(
+            return_value=Response(200, json=SAMPLE_BREACHES_RESPONSE)
+        )
+
+        client = XposedOrNot(rate_limiter=RateLimiter(min_interval=0))
+        results = {
+            domain: client.get_breaches(domain=domain)
+            for domain in ("x.com", "x.com", "y.com", "LinkedIn.com", "adobe.com", "z.com")
+        }
+
+        assert filtered.call_count == 2
+        assert full.call_count == 2  # y.com, then the catalog fetch
+        assert [b.breach_id for b in results["LinkedIn.com"]] == ["linkedin"]
+        assert [b.breach_id for b in results["adobe.com"]] == ["adobe"]
+        assert results["z.com"] == []
+
+    @respx.mock
+    def test_fresh_catalog_is_used(self) -> None:
+        """Test that a loaded catalog answers domain lookups."""
+        route = respx.get("https://api.xposedornot.com/v1/breaches").mock(
+            return_value=Response(200, json=SAMPLE_BREACHES_RESPONSE)
+        )
+
+        client = XposedOrNot()
+        catalog = client.get_breach_catalog()
+        result = client.get_breaches(domain="adobe.com")
+
+        assert route.call_count == 1
+        assert len(catalog) == 2
+        assert "Adobe" in catalog
+        assert catalog.get("LINKEDIN").domain == "linkedin.com"
+        assert [b.breach_id for b in result] == ["adobe"]
+
+    @respx.mock
+    def test_cached_catalog_is_used(self) -> None:
+        """Test that a catalog in the response cache answers domain lookups."""
+        route = respx.get("https://api.xposedornot.com/v1/breaches").mock(
+            return_value=Response(200, json=SAMPLE_BREACHES_RESPONSE)
+        )
+        cache = ResponseCache()
+
+        XposedOrNot(cache=cache).get_breaches()
+        result = XposedOrNot(cache=cache).get_breaches(domain="linkedin.com")
+
+        assert route.call_count == 1
+        assert [b.breach_id for b in result] == ["linkedin"]
+
+    @respx.mock
+    def test_stale_catalog_is_refetched(self) -> None:
+        """Test that max_age=0 forces a new catalog fetch."""
+        route = respx.get("https://api.xposedornot.com/v1/breaches").mock(
+            return_value=Response(200, json=SAMPLE_BREACHES_RESPONSE)
+        )
+
+        client = XposedOrNot(rate_limiter=RateLimiter(min_interval=0))
+        first = client.get_breach_catalog()
+        second = client.get_breach_catalog(max_age=0)
+
+        assert route.call_count == 2
+        assert first is not second
+
+    @respx.mock
+    def test_cached_catalog_keeps_its_age(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a catalog built from a cached response is as old as the entry."""
+        route = respx.get("https://api.xposedornot.com/v1/breaches").mock(
+            return_value=Response(200, json=SAMPLE_BREACHES_RESPONSE)
+        )
+        cache = ResponseCache(ttl=2 * BreachesEndpoint.CATALOG_TTL)
+        XposedOrNot(cache=cache).get_breaches()
+        stored_at = time.time()
+
+        # Ten minutes later, the cached response is reused with its own age
+        monkeypatch.setattr("time.time", lambda: stored_at + 600)
+        catalog = XposedOrNot(cache=cache).get_breach_catalog()
+        assert route.call_count == 1
+        assert catalog.age() == pytest.approx(600, abs=5)
+
+        # Past CATALOG_TTL, the cached response is too old to be reused
+        monkeypatch.setattr("time.time", lambda: stored_at + BreachesEndpoint.CATALOG_TTL + 1)
+        catalog = XposedOrNot(cache=cache).get_breach_catalog()
+        assert route.call_count == 2
+        assert catalog.age() == 0
@@ -0,0 +1,207 @@
+"""Tests for per-host circuit breaking."""
+
+from __future__ import annotations
+
+import time
+
+import httpx
+import pytest
+import respx
+
+from xposedornot import (
+    APIError,
+    CircuitBreaker,
+    CircuitOpenError,
+    NotFoundError,
+    QuotaTracker,
+    RateLimiter,
+    ServerError,
+    XposedOrNot,
+)
+
+from .conftest import SAMPLE_BREACHES_RESPONSE
+
+BREACHES_URL = "https://api.xposedornot.com/v1/breaches"
+HOST = "api.xposedornot.com"
+
+
+def trip(breaker: CircuitBreaker, host: str = HOST, calls: int = 4) -> None:
+    """Record enough failures to open a host's circuit."""
+    for _ in range(calls):
+        breaker.record(host, breaker.acquire(host), True, 0.1)
+
+
+class TestCircuitBreaker:
+    """Tests for the breaker's state machine."""
+
+    def test_opens_on_failure_rate(self) -> None:
+        """Test that the circuit opens once the failure rate is reached."""
+        breaker = CircuitBreaker(failure_rate=0.5, min_calls=4)
+        for failed in (False, True, False):
+            breaker.record(HOST, breaker.acquire(HOST), failed, 0.1)
+        assert breaker.status()[0].state == "closed"
+
+        breaker.record(HOST, breaker.acquire(HOST), True, 0.1)
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.acquire(HOST)
+        assert exc_info.value.host == HOST
+        assert exc_info.value.retry_after is not None and exc_info.value.retry_after > 0
+        assert breaker.status()[0].opened == 1
+
+    def test_opens_on_slow_calls(self) -> None:
+        """Test that successful but slow calls open the circuit."""
+        breaker = CircuitBreaker(slow_call_duration=1.0, slow_call_rate=0.5, min_calls=2)
+        breaker.record(HOST, breaker.acquire(HOST), False, 2.0)
+        breaker.record(HOST, breaker.acquire(HOST), False, 3.0)
+
+        with pytest.raises(CircuitOpenError):
+            breaker.check(HOST)
+
+    def test_hosts_are_independent(self) -> None:
+        """Test that one host's failures do not affect another."""
+        breaker = CircuitBreaker(min_calls=4)
+        trip(breaker)
+
+        assert breaker.acquire("passwords.xposedornot.com") is False
+
+    def test_probe_success_closes(self) -> None:
+        """Test that a successful probe closes the circuit."""
+        breaker = CircuitBreaker(min_calls=4, open_for=0.05)
+        trip(breaker)
+        time.sleep(0.06)
+
+        probe = breaker.acquire(HOST)
+        assert probe is True
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire(HOST)  # the only probe slot is taken
+
+        breaker.record(HOST, probe, False, 0.1)
+        assert breaker.status()[0].state == "closed"
+        assert breaker.acquire(HOST) is False
+
+    def test_probe_failure_reopens(self) -> None:
+        """Test that a failed probe opens the circuit again."""
+        breaker = CircuitBreaker(min_calls=4, open_for=0.05)
+        trip(breaker)
+        time.sleep(0.06)
+
+        breaker.record(HOST, breaker.acquire(HOST), True, 0.1)
+
+        status = breaker.status()[0]
+        assert (status.state, status.opened) == ("open", 2)
+
+    def test_abandoned_probe_frees_its_slot(self) -> None:
+        """Test that a probe abandoned before sending is not judged."""
+        breaker = CircuitBreaker(min_calls=4, open_for=0.05)
+        trip(breaker)
+        time.sleep(0.06)
+
+        breaker.record(HOST, breaker.acquire(HOST), None, 0.0)
+
+        assert breaker.status()[0].state == "half_open"
+        assert breaker.acquire(HOST) is True
+
+    def test_invalid_rate(self) -> None:
+        """Test that rates outside (0, 1] are rejected."""
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_rate=0)
+
+
+class TestClientCircuitBreaking:
+    """Tests for circuit breaking through the client."""
+
+    @respx.mock
+    def test_server_errors_open_the_circuit(self) -> None:
+        """Test that calls fail fast once a host keeps returning 5xx."""
+        route = respx.get(BREACHES_URL).mock(return_value=httpx.Response(503))
+        client = XposedOrNot(
+            rate_limiter=RateLimiter(min_interval=0),
+            circuit_breaker=CircuitBreaker(min_calls=3),
+        )
+
+        for _ in range(3):
+            with pytest.raises(ServerError):
+                client.get_breaches()
+        with pytest.raises(CircuitOpenError):
+            client.get_breaches()
+
+        assert route.call_count == 3
+        status = client.circuit_status()
+        assert status is not None and status[0].state == "open"
+
+    @respx.mock
+    def test_connection_errors_open_the_circuit(self) -> None:
+        """Test that connection failures count against the host."""
+        respx.get(BREACHES_URL).mock(side_effect=httpx.ConnectError("refused"))
+        client = XposedOrNot(
+            rate_limiter=RateLimiter(min_interval=0),
+            circuit_breaker=CircuitBreaker(min_calls=2),
+        )
+
+        for _ in range(2):
+            with pytest.raises(APIError) as exc_info:
+                client.get_breaches()
+            assert not isinstance(exc_info.value, CircuitOpenError)
+        with pytest.raises(CircuitOpenError):
+            client.get_breaches()
+
+    @respx.mock
+    def test_open_circuit_spends_no_budget(self) -> None:
+        """Test that a failed-fast call waits for no slot and uses no quota."""
+        respx.get(BREACHES_URL).mock(return_value=httpx.Response(500))
+        breaker = CircuitBreaker(min_calls=4)
+        trip(breaker)
+        quota = QuotaTracker(hourly_limit=10)
+        client = XposedOrNot(
+            rate_limiter=RateLimiter(min_interval=10), quota=quota, circuit_breaker=breaker
+        )
+
+        client._rate_limiter.acquire()
+        start = time.monotonic()
+        with pytest.raises(CircuitOpenError):
+            client.get_breaches()
+
+        assert time.monotonic() - start < 0.5
+        assert quota.status().hourly_used == 0
+
+    @respx.mock
+    def test_not_found_is_healthy(self) -> None:
+        """Test that 404s do not count as failures."""
+        respx.get(BREACHES_URL).mock(return_value=httpx.Response(404))
+        client = XposedOrNot(
+            rate_limiter=RateLimiter(min_interval=0),
+            circuit_breaker=CircuitBreaker(min_calls=2),
+        )
+
+        for _ in range(3):
+            with pytest.raises(NotFoundError):
+                client.get_breaches()
+
+        status = client.circuit_status()
+        assert status is not None
+        assert (status[0].state, status[0].failure_rate) == ("closed", 0.0)
+
+    @respx.mock
+    def test_recovers_after_probe(self) -> None:
+        """Test that the circuit closes once the host answers a probe."""
+        route = respx.get(BREACHES_URL)
+        route.mock(return_value=httpx.Response(500))
+        client = XposedOrNot(
+            rate_limiter=RateLimiter(min_interval=0),
+            circuit_breaker=CircuitBreaker(min_calls=2, open_for=0.05),
+        )
+        for _ in range(2):
+            with pytest.raises(ServerError):
+                client.get_breaches()
+
+        route.mock(return_value=httpx.Response(200, json=SAMPLE_BREACHES_RESPONSE))
+        time.sleep(0.06)
+
+        assert len(client.get_breaches()) == len(SAMPLE_BREACHES_RESPONSE["exposedBreaches"])
+        status = client.circuit_status()
+        assert status is not None and status[0].state == "closed"
+
+    def test_no_status_without_breaker(self) -> None:
+        """Test that circuit_status() is None without a circuit breaker."""
+        assert XposedOrNot().circuit_status() is None
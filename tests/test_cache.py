@@ -0,0 +1,120 @@
+"""Tests for response caching."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+import respx
+from httpx import Response
+
+from xposedornot import NotFoundError, ResponseCache, SharedResponseCache, XposedOrNot
+
+from .conftest import SAMPLE_CHECK_EMAIL_RESPONSE
+
+
+class TestResponseCache:
+    """Tests for the in-process cache."""
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test that the cache stays within max_entries."""
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", 200, {"a": 1})
+        cache.set("b", 200, {"b": 1})
+        cache.get("a")
+        cache.set("c", 200, {"c": 1})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == (200, {"a": 1})
+
+    def test_expired_entries_are_ignored(self) -> None:
+        """Test that entries past their TTL are not returned."""
+        cache = ResponseCache(ttl=0)
+        cache.set("a", 200, {})
+
+        assert cache.get("a") is None
+
+
+class TestSharedResponseCache:
+    """Tests for the SQLite-backed cache."""
+
+    def test_entries_are_shared_between_instances(self, tmp_path: Path) -> None:
+        """Test that two caches on one database see each other's entries."""
+        db = tmp_path / "xon.sqlite"
+        SharedResponseCache(db).set("key", 200, {"breaches": ["Adobe"]})
+
+        assert SharedResponseCache(db).get("key") == (200, {"breaches": ["Adobe"]})
+
+    def test_lookup_reports_when_stored(self, tmp_path: Path) -> None:
+        """Test that entries carry the time they were stored."""
+        cache = SharedResponseCache(tmp_path / "xon.sqlite", ttl=3600)
+        cache.set("key", 200, {})
+
+        entry = SharedResponseCache(tmp_path / "xon.sqlite").lookup("key")
+        assert entry is not None
+        assert entry[0] == pytest.approx(time.time(), abs=5)
+        assert entry[1] == (200, {})
+
+
+class TestClientCaching:
+    """Tests for the client using a cache."""
+
+    @respx.mock
+    def test_repeated_lookup_served_from_cache(self) -> None:
+        """Test that a cached response is not fetched again."""
+        route = respx.get("https://api.xposedornot.com/v1/check-email/test@example.com").mock(
+            return_value=Response(200, json=SAMPLE_CHECK_EMAIL_RESPONSE)
+        )
+
+        client = XposedOrNot(cache=ResponseCache())
+        first = client.check_email("test@example.com")
+        second = client.check_email("test@example.com")
+
+        assert first == second
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_not_found_is_cached(self) -> None:
+        """Test that a 404 is cached and raised again from the cache."""
+        route = respx.get("https://api.xposedornot.com/v1/check-email/clean@example.com").mock(
+            return_value=Response(404, json={"Error": "Not found"})
+        )
+
+        client = XposedOrNot(cache=ResponseCache())
+        for _ in range(2):
+            with pytest.raises(NotFoundError):
+                client.check_email("clean@example.com")
+
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_cache_keys_hide_lookups(self, tmp_path: Path) -> None:
+        """Test that the shared cache does not store looked-up addresses in plaintext."""
+        respx.get("https://api.xposedornot.com/v1/check-email/secret@example.com").mock(
+            return_value=Response(200, json=SAMPLE_CHECK_EMAIL_RESPONSE)
+        )
+        db = tmp_path / "xon.sqlite"
+
+        XposedOrNot(cache=SharedResponseCache(db)).check_email("secret@example.com")
+
+        with sqlite3.connect(db) as conn:
+            keys = [key for (key,) in conn.execute("SELECT key FROM responses")]
+        conn.close()
+        assert len(keys) == 1 and "secret" not in keys[0]
+
+    @respx.mock
+    def test_responses_are_scoped_to_credentials(self) -> None:
+        """Test that a response fetched with one key is not served to another."""
+        route = respx.get("https://api.xposedornot.com/v1/breaches").mock(
+            return_value=Response(200, json={"exposedBreaches": []})
+        )
+        cache = ResponseCache()
+
+        XposedOrNot(api_key="key-a", cache=cache).get_breaches()
+        XposedOrNot(api_key="key-a", cache=cache).get_breaches()
+        XposedOrNot(api_key="key-b", cache=cache).get_breaches()
+        XposedOrNot(cache=cache).get_breaches()
+
+        assert route.call_count == 3
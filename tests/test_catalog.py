@@ -0,0 +1,91 @@
+"""Tests for the breach catalog."""
+
+from __future__ import annotations
+
+import time
+from datetime import date, datetime, timezone
+
+import pytest
+
+from xposedornot import BreachCatalog
+from xposedornot.models import Breach, BreachAnalyticsResponse
+
+from .conftest import SAMPLE_BREACH_ANALYTICS_RESPONSE, SAMPLE_BREACHES_RESPONSE
+
+
+def make_breach(breach_id: str, breached_date: str, domain: str = "") -> Breach:
+    """Create a catalog entry with the fields the indexes use."""
+    return Breach.from_dict(
+        {"breachID": breach_id, "breachedDate": breached_date, "domain": domain}
+    )
+
+
+@pytest.fixture
+def catalog() -> BreachCatalog:
+    """Create a catalog with breaches over several years."""
+    return BreachCatalog(
+        [
+            make_breach("c", "2020-03-01T00:00:00+00:00", "example.com"),
+            make_breach("a", "2012-06-05", "example.com"),
+            make_breach("undated", "", "example.com"),
+            make_breach("b", "2016", "other.org"),
+            make_breach("d", "2021-11-30", "Other.org"),
+        ]
+    )
+
+
+class TestDates:
+    """Tests for parsed dates on the models."""
+
+    def test_breach_dates_are_parsed_once(self) -> None:
+        """Test that breached_at is parsed and cached."""
+        breach = Breach.from_dict(SAMPLE_BREACHES_RESPONSE["exposedBreaches"][0])
+
+        assert breach.breached_at == datetime(2013, 10, 4, tzinfo=timezone.utc)
+        assert breach.breached_at is breach.breached_at
+
+    def test_analytics_dates(self) -> None:
+        """Test parsed dates of analytics responses."""
+        result = BreachAnalyticsResponse.from_api_response(SAMPLE_BREACH_ANALYTICS_RESPONSE)
+
+        assert result.first_breach_at == datetime(2013, 10, 4, tzinfo=timezone.utc)
+        assert result.breaches_details[0].xposed_at == result.first_breach_at
+
+    def test_unparseable_date(self) -> None:
+        """Test that missing dates parse to None."""
+        assert make_breach("x", "").breached_at is None
+
+
+class TestTimeIndex:
+    """Tests for date-range queries."""
+
+    def test_between(self, catalog: BreachCatalog) -> None:
+        """Test half-open range queries with mixed bound types."""
+        ids = [b.breach_id for b in catalog.between("2016-01-01", date(2021, 11, 30))]
+
+        assert ids == ["b", "c"]
+        assert [b.breach_id for b in catalog.between()] == ["a", "b", "c", "d"]
+
+    def test_since_and_recent(self, catalog: BreachCatalog) -> None:
+        """Test open-ended queries."""
+        assert [b.breach_id for b in catalog.since(datetime(2020, 3, 1))] == ["c", "d"]
+        assert catalog.recent(days=30) == []
+
+        fresh = BreachCatalog([make_breach("new", time.strftime("%Y-%m-%d"))])
+        assert [b.breach_id for b in fresh.recent(days=30)] == ["new"]
+
+    def test_first_breach_per_domain(self, catalog: BreachCatalog) -> None:
+        """Test the earliest dated breach of each domain."""
+        first = catalog.first_breach_by_domain()
+
+        assert {domain: b.breach_id for domain, b in first.items()} == {
+            "example.com": "a",
+            "other.org": "b",
+        }
+        assert catalog.first_breach("OTHER.org").breach_id == "b"
+        assert catalog.first_breach("unknown.net") is None
+
+    def test_invalid_date(self, catalog: BreachCatalog) -> None:
+        """Test that bad string bounds are rejected."""
+        with pytest.raises(ValueError):
+            catalog.since("last tuesday")
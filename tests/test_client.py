@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+
+import httpx
 import pytest
 import respx
 from httpx import Response
@@ -13,6 +17,7 @@ from xposedornot import (
     RateLimitError,
     ServerError,
 )
+from xposedornot.models import ResponseMeta
 
 
 class TestClientInitialization:
@@ -149,3 +154,105 @@ class TestAPIKeyHandling:
         assert route.called
         request = route.calls[0].request
         assert "x-api-key" not in request.headers
+
+
+class TestResponseMetadata:
+    """Tests for per-call response metadata."""
+
+    @respx.mock
+    def test_metadata_recorded_and_hooked(self) -> None:
+        """Test that retries, waits and headers are reported for a call."""
+        route = respx.get("https://api.xposedornot.com/v1/breaches")
+        route.side_effect = [
+            Response(429, headers={"Retry-After": "1"}),
+            Response(
+                200,
+                json={"exposedBreaches": []},
+                headers={"X-RateLimit-Remaining": "41", "Cache-Control": "max-age=60"},
+            ),
+        ]
+        seen: list[ResponseMeta] = []
+
+        client = XposedOrNot(api_key="test-key", on_response=seen.append)
+        client.RETRY_BASE_DELAY = 0
+        client.get_breaches()
+
+        meta = client.last_response_meta
+        assert meta is not None
+        assert seen == [meta]
+        assert meta.status_code == 200
+        assert meta.attempts == 2
+        assert meta.retries == 1
+        assert meta.headers == {"x-ratelimit-remaining": "41", "cache-control": "max-age=60"}
+        assert meta.timings.total >= 0
+
+    @respx.mock
+    def test_metadata_on_error(self) -> None:
+        """Test that the hook also sees failed calls."""
+        respx.get("https://api.xposedornot.com/v1/breaches").mock(return_value=Response(500))
+        seen: list[ResponseMeta] = []
+
+        client = XposedOrNot(api_key="test-key", on_response=seen.append)
+        with pytest.raises(ServerError):
+            client.get_breaches()
+
+        assert [m.status_code for m in seen] == [500]
+
+
+class TestWarmup:
+    """Tests for connection pre-warming."""
+
+    @respx.mock
+    def test_warmup_contacts_each_host(self) -> None:
+        """Test that every host the client uses is contacted."""
+        route = respx.head(url__regex=r"https://.*\.xposedornot\.com/$").mock(
+            return_value=Response(404)
+        )
+
+        with XposedOrNot() as client:
+            timings = client.warmup()
+        assert sorted(timings) == [
+            "https://api.xposedornot.com/",
+            "https://passwords.xposedornot.com/",
+        ]
+
+        with XposedOrNot(api_key="test-key") as client:
+            timings = client.warmup(connections=2)
+        assert len(timings["https://plus-api.xposedornot.com/"]) == 2
+        assert route.call_count == 2 + 6
+        assert all("x-api-key" not in call.request.headers for call in route.calls)
+
+    @respx.mock
+    def test_unreachable_host(self) -> None:
+        """Test that a failed warm-up raises."""
+        respx.head(url__regex=r".*").mock(side_effect=httpx.ConnectError("refused"))
+
+        with XposedOrNot() as client, pytest.raises(APIError):
+            client.warmup()
+
+    @respx.mock
+    def test_keepalive_refresher(self) -> None:
+        """Test that the refresher re-warms until the client is closed."""
+        route = respx.head(url__regex=r".*").mock(return_value=Response(200))
+
+        client = XposedOrNot()
+        client.warmup(keepalive=0.01)
+        deadline = time.monotonic() + 5
+        while route.call_count < 6 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        client.close()
+        assert route.call_count >= 6
+
+        calls = route.call_count
+        time.sleep(0.05)
+        assert route.call_count == calls
+
+    @respx.mock
+    def test_async_warmup(self) -> None:
+        """Test warming up from a coroutine."""
+        route = respx.head(url__regex=r".*").mock(return_value=Response(200))
+
+        with XposedOrNot() as client:
+            timings = asyncio.run(client.awarmup())
+        assert len(timings) == 2
+        assert route.call_count == 2
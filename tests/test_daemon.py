@@ -0,0 +1,196 @@
+"""Tests for the local sidecar daemon and its thin client."""
+
+from __future__ import annotations
+
+import os
+import socket
+import stat
+import threading
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+import respx
+from httpx import Response
+
+from xposedornot import (
+    APIError,
+    CircuitOpenError,
+    DeadlineExceeded,
+    NotFoundError,
+    QuotaExceededError,
+    ResponseCache,
+    XposedOrNot,
+)
+from xposedornot.cli import build_parser
+from xposedornot.daemon import DaemonClient, _rebuild_error, create_server
+from xposedornot.models import EmailBreachDetailedResponse, EmailBreachResponse
+
+from .conftest import SAMPLE_CHECK_EMAIL_RESPONSE, SAMPLE_PLUS_CHECK_EMAIL_RESPONSE
+
+
+def _start(client: XposedOrNot) -> Iterator[str]:
+    server = create_server(client, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host, port = server.server_address[:2]  # type: ignore[misc]
+        yield f"http://{host}:{port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def daemon_url() -> Iterator[str]:
+    """Run a daemon around a free-API client with a cache."""
+    yield from _start(XposedOrNot(cache=ResponseCache()))
+
+
+@pytest.fixture
+def plus_daemon_url() -> Iterator[str]:
+    """Run a daemon around a Plus API client."""
+    yield from _start(XposedOrNot(api_key="daemon-key"))
+
+
+class TestDaemonClient:
+    """Tests for requests forwarded through the daemon."""
+
+    def test_check_email_shares_cache(self, daemon_url: str) -> None:
+        """Test that two daemon clients share the daemon's cache."""
+        with respx.mock:
+            respx.route(host="127.0.0.1").pass_through()
+            route = respx.get("https://api.xposedornot.com/v1/check-email/test@example.com").mock(
+                return_value=Response(200, json=SAMPLE_CHECK_EMAIL_RESPONSE)
+            )
+
+            first = DaemonClient(daemon_url).check_email("test@example.com")
+            second = DaemonClient(daemon_url).check_email("test@example.com")
+
+        assert isinstance(first, EmailBreachResponse)
+        assert first == second
+        assert route.call_count == 1
+
+    def test_errors_are_re_raised(self, daemon_url: str) -> None:
+        """Test that upstream errors surface as the same exception types."""
+        with respx.mock:
+            respx.route(host="127.0.0.1").pass_through()
+            respx.get("https://api.xposedornot.com/v1/check-email/clean@example.com").mock(
+                return_value=Response(404, json={"Error": "Not found"})
+            )
+
+            with pytest.raises(NotFoundError):
+                DaemonClient(daemon_url).check_email("clean@example.com")
+
+    def test_plus_mode_follows_daemon(self, plus_daemon_url: str) -> None:
+        """Test that the thin client uses the Plus API when the daemon has a key."""
+        with respx.mock:
+            respx.route(host="127.0.0.1").pass_through()
+            route = respx.get(
+                "https://plus-api.xposedornot.com/v3/check-email/test@example.com"
+            ).mock(return_value=Response(200, json=SAMPLE_PLUS_CHECK_EMAIL_RESPONSE))
+
+            result = DaemonClient(plus_daemon_url).check_email("test@example.com")
+
+        assert isinstance(result, EmailBreachDetailedResponse)
+        assert route.calls[0].request.headers["x-api-key"] == "daemon-key"
+
+    def test_response_meta(self, daemon_url: str) -> None:
+        """Test that last_response_meta reports the daemon's call."""
+        with respx.mock:
+            respx.route(host="127.0.0.1").pass_through()
+            respx.get("https://api.xposedornot.com/v1/check-email/test@example.com").mock(
+                return_value=Response(200, json=SAMPLE_CHECK_EMAIL_RESPONSE)
+            )
+            client = DaemonClient(daemon_url)
+
+            client.check_email("test@example.com")
+            first = client.last_response_meta
+            client.check_email("test@example.com")
+            second = client.last_response_meta
+
+        assert first is not None and second is not None
+        assert first.url == "https://api.xposedornot.com/v1/check-email/test@example.com"
+        assert (first.status_code, first.attempts, first.from_cache) == (200, 1, False)
+        assert second.from_cache
+        assert second.cached_at is not None
+
+
+class TestRebuildError:
+    """Tests for re-creating the daemon's exceptions in the caller."""
+
+    def test_quota_exceeded(self) -> None:
+        """Test that a quota error keeps its type and retry_after."""
+        error = _rebuild_error(
+            {"type": "QuotaExceededError", "message": "Quota used up", "retry_after": 12.5}, 429
+        )
+
+        assert isinstance(error, QuotaExceededError)
+        assert error.retry_after == 12.5
+        assert str(error) == "Quota used up"
+
+    def test_deadline_exceeded(self) -> None:
+        """Test that a deadline error keeps its type."""
+        error = _rebuild_error({"type": "DeadlineExceeded", "message": "Too slow"}, 502)
+
+        assert isinstance(error, DeadlineExceeded)
+        assert str(error) == "Too slow"
+
+    def test_circuit_open_without_host(self) -> None:
+        """Test that a circuit error without a host keeps its type."""
+        error = _rebuild_error(
+            {"type": "CircuitOpenError", "message": "Circuit open", "retry_after": 3}, 502
+        )
+
+        assert isinstance(error, CircuitOpenError)
+        assert error.retry_after == 3
+        assert str(error) == "Circuit open"
+
+
+class TestCLI:
+    """Tests for the `xon` command line."""
+
+    def test_serve_arguments(self) -> None:
+        """Test parsing of `xon serve` options."""
+        args = build_parser().parse_args(["serve", "--port", "9000", "--cache-ttl", "0"])
+
+        assert args.command == "serve"
+        assert args.port == 9000
+        assert args.cache_ttl == 0
+
+
+class TestDaemonSafety:
+    """Tests for the daemon's handling of its socket and bad replies."""
+
+    def test_socket_path_must_be_a_socket(self, tmp_path: Path) -> None:
+        """Test that a regular file at the socket path is not deleted."""
+        path = tmp_path / "notes.txt"
+        path.write_text("keep me")
+
+        with pytest.raises(FileExistsError):
+            create_server(XposedOrNot(), socket_path=str(path))
+        assert path.read_text() == "keep me"
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+    def test_socket_is_private(self, tmp_path: Path) -> None:
+        """Test that the Unix socket is only accessible to its owner."""
+        path = str(tmp_path / "xon.sock")
+        server = create_server(XposedOrNot(), socket_path=path)
+        try:
+            assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        finally:
+            server.server_close()
+
+        # A stale socket left behind is replaced
+        create_server(XposedOrNot(), socket_path=path).server_close()
+
+    @respx.mock
+    def test_non_json_reply(self) -> None:
+        """Test that a non-JSON reply surfaces as APIError."""
+        respx.post("http://127.0.0.1:9/v1/request").mock(
+            return_value=Response(502, text="<html>Bad Gateway</html>")
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            DaemonClient("http://127.0.0.1:9")._request("GET", "/v1/breaches")
+        assert exc_info.value.status_code == 502
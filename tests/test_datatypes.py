@@ -0,0 +1,99 @@
+"""Tests for data type bitmasks."""
+
+from __future__ import annotations
+
+import pytest
+
+from xposedornot import datatypes
+from xposedornot.datatypes import DataTypeRegistry
+from xposedornot.models import Breach, BreachAnalyticsResponse, EmailBreachDetailedResponse
+
+from .conftest import (
+    SAMPLE_BREACH_ANALYTICS_RESPONSE,
+    SAMPLE_BREACHES_RESPONSE,
+    SAMPLE_PLUS_CHECK_EMAIL_RESPONSE,
+)
+
+
+class TestDataTypeRegistry:
+    """Tests for the registry."""
+
+    def test_known_types_have_fixed_bits(self) -> None:
+        """Test that well-known types map to the same bits everywhere."""
+        assert datatypes.mask("Email addresses") == 1
+        assert datatypes.mask("passwords") == 2
+        assert DataTypeRegistry().bit("Phone numbers") == datatypes.registry.bit("Phone Numbers")
+
+    def test_new_types_are_registered(self) -> None:
+        """Test that unseen names get the next free bit."""
+        registry = DataTypeRegistry(["A", "B"])
+
+        assert registry.bit("C") == 2
+        assert registry.bit(" c ") == 2
+        assert registry.names(0b101) == ["A", "C"]
+        assert len(registry) == 3
+
+    def test_counts(self) -> None:
+        """Test aggregation over many masks."""
+        registry = DataTypeRegistry(["A", "B", "C"])
+        masks = [registry.mask(["A", "C"]), registry.mask(["C"]), 0]
+
+        assert registry.counts(masks) == {"A": 1, "C": 2}
+
+    def test_split(self) -> None:
+        """Test splitting joined data type strings."""
+        assert datatypes.split_data_types("Email addresses; Passwords;") == [
+            "Email addresses",
+            "Passwords",
+        ]
+        assert datatypes.split_data_types(None) == []
+
+    def test_queries_do_not_register(self) -> None:
+        """Test that looking names up leaves the registry unchanged."""
+        registry = DataTypeRegistry(["A", "B"])
+
+        assert registry.lookup("b") == 1
+        assert registry.lookup("C") is None
+        assert registry.query(["A", "C"]) == 1
+        assert len(registry) == 2
+
+    def test_mask_rejects_unknown_names(self) -> None:
+        """Test that module-level masks raise on names never registered."""
+        size = len(datatypes.registry)
+
+        with pytest.raises(ValueError):
+            datatypes.mask("Passwords", "Pasword")
+        assert len(datatypes.registry) == size
+
+
+class TestModelBitmasks:
+    """Tests for the data_types field of breach models."""
+
+    def test_breach(self) -> None:
+        """Test the bitmask of a catalog breach."""
+        breach = Breach.from_dict(SAMPLE_BREACHES_RESPONSE["exposedBreaches"][1])
+
+        assert breach.data_types == datatypes.mask("Email addresses", "Passwords")
+        assert breach.exposes_all("Passwords", "Email addresses")
+        assert breach.exposes_any("Passwords", "Phone numbers")
+        assert not breach.exposes_all("Passwords", "Phone numbers")
+        assert breach.exposes_none("Phone numbers", "Some new type")
+        assert breach.exposes_any("Passwords", "Some new type")
+        assert not breach.exposes_all("Passwords", "Some new type")
+        assert "Some new type" not in datatypes.registry
+        assert datatypes.names(breach.data_types) == ["Email addresses", "Passwords"]
+
+    def test_breach_info(self) -> None:
+        """Test the bitmask of Plus API results."""
+        result = EmailBreachDetailedResponse.from_api_response(SAMPLE_PLUS_CHECK_EMAIL_RESPONSE)
+        wanted = datatypes.mask("Passwords", "Password hints")
+
+        matches = [b.breach_id for b in result.breaches if datatypes.has_all(b.data_types, wanted)]
+
+        assert matches == ["Adobe"]
+
+    def test_breach_details(self) -> None:
+        """Test the bitmask of breach analytics details."""
+        result = BreachAnalyticsResponse.from_api_response(SAMPLE_BREACH_ANALYTICS_RESPONSE)
+
+        assert result.breaches_details[0].exposes_all("email", "password")
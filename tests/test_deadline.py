@@ -0,0 +1,161 @@
+"""Tests for per-host timeouts and call deadlines."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from xposedornot import DeadlineExceeded, RateLimiter, SharedRateLimiter, XposedOrNot
+from xposedornot.deadline import remaining_time, request_deadline
+from xposedornot.scheduler import Priority, RequestScheduler
+
+from .conftest import SAMPLE_BREACHES_RESPONSE
+
+BREACHES_URL = "https://api.xposedornot.com/v1/breaches"
+
+
+class TestDeadlineContext:
+    """Tests for nesting deadlines."""
+
+    def test_inner_deadline_only_shortens(self) -> None:
+        """Test that an inner deadline cannot extend an outer one."""
+        assert remaining_time() is None
+        with request_deadline(1.0):
+            with request_deadline(10.0):
+                remaining = remaining_time()
+                assert remaining is not None and remaining <= 1.0
+            with request_deadline(0.1):
+                remaining = remaining_time()
+                assert remaining is not None and remaining <= 0.1
+            with request_deadline(None):
+                remaining = remaining_time()
+                assert remaining is not None and 0.1 < remaining <= 1.0
+        assert remaining_time() is None
+
+
+class TestLimiterTimeouts:
+    """Tests for bounded waits on limiters and the scheduler."""
+
+    def test_rate_limiter_does_not_reserve_on_timeout(self) -> None:
+        """Test that a timed-out acquire leaves the next slot free."""
+        limiter = RateLimiter(min_interval=0.2)
+        limiter.acquire()
+
+        with pytest.raises(TimeoutError):
+            limiter.acquire(timeout=0.01)
+        start = time.monotonic()
+        limiter.acquire(timeout=1.0)
+        assert time.monotonic() - start < 0.3
+
+    def test_shared_rate_limiter_timeout(self, tmp_path: Path) -> None:
+        """Test the timeout of the SQLite-backed limiter."""
+        limiter = SharedRateLimiter(tmp_path / "xon.sqlite", min_interval=10)
+        limiter.acquire()
+
+        with pytest.raises(TimeoutError):
+            limiter.acquire(timeout=0.01)
+
+    def test_scheduler_timeout_leaves_queue(self) -> None:
+        """Test that a request timing out of the scheduler is dequeued."""
+        scheduler = RequestScheduler(RateLimiter(min_interval=10))
+        scheduler.acquire()
+
+        with pytest.raises(TimeoutError):
+            scheduler.acquire(Priority.NORMAL, timeout=0.01)
+        assert scheduler.queued() == dict.fromkeys(Priority, 0)
+
+
+class TestClientDeadlines:
+    """Tests for deadlines and timeouts on client calls."""
+
+    @respx.mock
+    def test_rate_limit_wait_fails_fast(self) -> None:
+        """Test that a call does not wait for a slot past its deadline."""
+        respx.get(BREACHES_URL).mock(
+            return_value=httpx.Response(200, json=SAMPLE_BREACHES_RESPONSE)
+        )
+        client = XposedOrNot(rate_limiter=RateLimiter(min_interval=10))
+        client.get_breaches(domain="adobe.com")
+
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            client.get_breaches(domain="linkedin.com", deadline=0.5)
+        assert time.monotonic() - start < 0.2
+
+    @respx.mock
+    def test_backoff_fails_fast(self) -> None:
+        """Test that no retry is attempted when the deadline cannot cover it."""
+        route = respx.get(BREACHES_URL).mock(return_value=httpx.Response(429))
+        client = XposedOrNot(api_key="test-key")
+
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            client.get_breaches(deadline=0.5)
+
+        assert time.monotonic() - start < 0.2
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_batch_deadline(self) -> None:
+        """Test that one deadline bounds several calls."""
+        respx.get(BREACHES_URL).mock(
+            return_value=httpx.Response(200, json=SAMPLE_BREACHES_RESPONSE)
+        )
+        client = XposedOrNot(rate_limiter=RateLimiter(min_interval=0.1))
+
+        with client.deadline(0.25), pytest.raises(DeadlineExceeded):
+            for _ in range(10):
+                client.get_breaches()
+
+    @respx.mock
+    def test_request_timeout_is_capped(self) -> None:
+        """Test that each attempt's timeouts are capped at the remaining time."""
+        route = respx.get(BREACHES_URL).mock(
+            return_value=httpx.Response(200, json=SAMPLE_BREACHES_RESPONSE)
+        )
+        client = XposedOrNot(api_key="test-key")
+
+        client.get_breaches()
+        client.get_breaches(deadline=2)
+
+        assert route.calls[0].request.extensions["timeout"]["read"] == 30.0
+        assert route.calls[1].request.extensions["timeout"]["read"] <= 2
+
+    @respx.mock
+    def test_timeout_past_deadline(self) -> None:
+        """Test that a timeout caused by the deadline raises DeadlineExceeded."""
+
+        def stall(request: httpx.Request) -> httpx.Response:
+            time.sleep(request.extensions["timeout"]["read"])
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        respx.get(BREACHES_URL).mock(side_effect=stall)
+        client = XposedOrNot(api_key="test-key")
+
+        with pytest.raises(DeadlineExceeded):
+            client.get_breaches(deadline=0.1)
+
+    @respx.mock
+    def test_per_host_timeouts(self) -> None:
+        """Test that per-host timeouts override the default."""
+        route = respx.get(url__regex=r".*").mock(
+            return_value=httpx.Response(200, json={"exposedBreaches": [], "SearchPassAnon": {}})
+        )
+        client = XposedOrNot(
+            api_key="test-key",
+            timeouts={
+                "https://passwords.xposedornot.com/api": httpx.Timeout(5, connect=1),
+                "API.xposedornot.com": 10,
+            },
+        )
+
+        client.get_breaches()
+        client.check_password("password123")
+
+        breaches, passwords = (call.request.extensions["timeout"] for call in route.calls)
+        assert breaches == httpx.Timeout(10).as_dict()
+        assert passwords == httpx.Timeout(5, connect=1).as_dict()
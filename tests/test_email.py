@@ -10,6 +10,7 @@ from xposedornot import XposedOrNot, NotFoundError, ValidationError, Authenticat
 from xposedornot.models import EmailBreachResponse, EmailBreachDetailedResponse, BreachAnalyticsResponse
 
 from .conftest import (
+    SAMPLE_BREACHES_RESPONSE,
     SAMPLE_CHECK_EMAIL_RESPONSE,
     SAMPLE_BREACH_ANALYTICS_RESPONSE,
     SAMPLE_PLUS_CHECK_EMAIL_RESPONSE,
@@ -213,3 +214,59 @@ class TestCheckEmailPlus:
         assert route.called
         assert isinstance(result, EmailBreachResponse)
         assert result.breaches == ["Adobe", "LinkedIn", "Dropbox"]
+
+
+class TestCheckEmailCompact:
+    """Tests for Plus API checks joined against the local breach catalog."""
+
+    @respx.mock
+    def test_details_come_from_catalog(self) -> None:
+        """Test that compact results are filled in from the catalog."""
+        compact = respx.get(
+            "https://plus-api.xposedornot.com/v3/check-email/test@example.com",
+            params={"detailed": "false"},
+        ).mock(return_value=Response(200, json={"status": "success", "breaches": ["Adobe"]}))
+        catalog = respx.get("https://api.xposedornot.com/v1/breaches").mock(
+            return_value=Response(200, json=SAMPLE_BREACHES_RESPONSE)
+        )
+
+        client = XposedOrNot(api_key="test-api-key", compact_results=True)
+        first = client.check_email("test@example.com")
+        second = client.check_email("test@example.com")
+
+        assert compact.call_count == 2
+        assert catalog.call_count == 1
+        assert isinstance(first, EmailBreachDetailedResponse)
+        assert first == second
+        breach = first.breaches[0]
+        assert breach.breach_id == "Adobe"
+        assert breach.domain == "adobe.com"
+        assert breach.xposed_data == "Email addresses;Passwords;Usernames"
+        assert breach.xposed_records == 152000000
+        assert breach.searchable == "Yes"
+
+    @respx.mock
+    def test_unknown_breach_falls_back_to_detailed(self) -> None:
+        """Test that a breach missing from the catalog is fetched in detail."""
+        respx.get(
+            "https://plus-api.xposedornot.com/v3/check-email/test@example.com",
+            params={"detailed": "false"},
+        ).mock(
+            return_value=Response(
+                200, json={"breaches": [{"breach_id": "Poshmark"}, {"breach_id": "Adobe"}]}
+            )
+        )
+        detailed = respx.get(
+            "https://plus-api.xposedornot.com/v3/check-email/test@example.com",
+            params={"detailed": "true"},
+        ).mock(return_value=Response(200, json=SAMPLE_PLUS_CHECK_EMAIL_RESPONSE))
+        catalog = respx.get("https://api.xposedornot.com/v1/breaches").mock(
+            return_value=Response(200, json=SAMPLE_BREACHES_RESPONSE)
+        )
+
+        client = XposedOrNot(api_key="test-api-key", compact_results=True)
+        result = client.check_email("test@example.com")
+
+        assert detailed.call_count == 1
+        assert catalog.call_count == 1  # just fetched; not refreshed again
+        assert result.breaches[0].logo.endswith("Poshmark.png")
@@ -0,0 +1,79 @@
+"""Tests for columnar and streaming export."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from xposedornot import BreachCatalog, export
+from xposedornot.models import Breach, PasswordAuditRecord
+
+from .conftest import SAMPLE_BREACHES_RESPONSE
+
+
+@pytest.fixture
+def breaches() -> list[Breach]:
+    """Create the sample catalog breaches."""
+    return [Breach.from_dict(b) for b in SAMPLE_BREACHES_RESPONSE["exposedBreaches"]]
+
+
+class TestColumns:
+    """Tests for per-field arrays."""
+
+    def test_to_columns(self, breaches: list[Breach]) -> None:
+        """Test that records are transposed into field lists."""
+        columns = BreachCatalog(breaches).to_columns()
+
+        assert list(columns) == export.record_fields(Breach)
+        assert columns["breach_id"] == ["adobe", "linkedin"]
+        assert columns["exposed_records"] == [152000000, 164000000]
+
+    def test_selected_fields_and_generators(self, breaches: list[Breach]) -> None:
+        """Test field selection on a one-shot iterable."""
+        columns = export.to_columns((b for b in breaches), fields=["domain"])
+
+        assert columns == {"domain": ["adobe.com", "linkedin.com"]}
+        assert export.to_columns([], fields=["domain"]) == {"domain": []}
+
+    def test_to_numpy(self, breaches: list[Breach]) -> None:
+        """Test the NumPy structured array export."""
+        np = pytest.importorskip("numpy")
+        array = export.to_numpy(breaches, fields=["breach_id", "exposed_records", "verified"])
+
+        assert array.dtype["exposed_records"] == np.dtype("i8")
+        assert array["verified"].all()
+        assert list(array["breach_id"]) == ["adobe", "linkedin"]
+
+
+class TestWriters:
+    """Tests for the streaming writers."""
+
+    def test_write_csv(self, breaches: list[Breach], tmp_path: Path) -> None:
+        """Test CSV output with joined list fields."""
+        path = tmp_path / "breaches.csv"
+
+        assert export.write_csv(iter(breaches), path) == 2
+
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0]["breach_id"] == "adobe"
+        assert rows[1]["exposed_data"] == "Email addresses;Passwords"
+
+    def test_write_jsonl(self) -> None:
+        """Test JSON Lines output to an open file."""
+        records = [PasswordAuditRecord(line_number=1, offset=0, hash_prefix="abc", count=3)]
+        buffer = io.StringIO()
+
+        assert export.write_jsonl(records, buffer, fields=["line_number", "count"]) == 1
+        assert json.loads(buffer.getvalue()) == {"line_number": 1, "count": 3}
+
+    def test_empty(self, tmp_path: Path) -> None:
+        """Test that empty inputs write empty files."""
+        assert export.write_csv([], tmp_path / "a.csv", fields=["breach_id"]) == 0
+        assert export.write_jsonl([], tmp_path / "a.jsonl") == 0
+        assert (tmp_path / "a.csv").read_text().strip() == "breach_id"
+        assert (tmp_path / "a.jsonl").read_text() == ""
@@ -0,0 +1,167 @@
+"""Tests for hedged requests."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+import httpx
+import pytest
+import respx
+
+from xposedornot import APIKeyPool, HedgePolicy, Priority, QuotaTracker, XposedOrNot
+from xposedornot.models import EmailBreachDetailedResponse
+
+from .conftest import SAMPLE_PLUS_CHECK_EMAIL_RESPONSE
+
+PLUS_URL = "https://plus-api.xposedornot.com/v3/check-email/test@example.com"
+
+
+def slow_first(delay: float = 0.5) -> Callable[[httpx.Request], httpx.Response]:
+    """Respond slowly to the first request and at once to later ones."""
+    calls = []
+    lock = threading.Lock()
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        with lock:
+            calls.append(request)
+            first = len(calls) == 1
+        if first:
+            time.sleep(delay)
+        return httpx.Response(200, json={**SAMPLE_PLUS_CHECK_EMAIL_RESPONSE, "first": first})
+
+    return respond
+
+
+class TestHedgePolicy:
+    """Tests for the policy itself."""
+
+    def test_fast_request_is_not_hedged(self) -> None:
+        """Test that an answer within the delay is used as is."""
+        policy = HedgePolicy(initial_delay=1.0)
+
+        result, hedged = policy.run(lambda: "primary", lambda: lambda: "hedge", bool)
+
+        assert (result, hedged) == ("primary", False)
+        assert policy.stats().hedged == 0
+
+    def test_slow_request_is_hedged(self) -> None:
+        """Test that the hedge's answer is used when the primary stalls."""
+        policy = HedgePolicy(initial_delay=0.01)
+        release = threading.Event()
+
+        def primary() -> str:
+            release.wait(5)
+            return "primary"
+
+        result, hedged = policy.run(primary, lambda: lambda: "hedge", bool)
+        release.set()
+
+        assert (result, hedged) == ("hedge", True)
+        stats = policy.stats()
+        assert (stats.requests, stats.hedged, stats.hedge_wins) == (1, 1, 1)
+
+    def test_no_budget_skips_the_hedge(self) -> None:
+        """Test that the primary is awaited when no hedge can be reserved."""
+        policy = HedgePolicy(initial_delay=0.01)
+
+        def primary() -> str:
+            time.sleep(0.05)
+            return "primary"
+
+        assert policy.run(primary, lambda: None, bool) == ("primary", False)
+        assert policy.stats().skipped == 1
+
+    def test_unacceptable_hedge_falls_back_to_primary(self) -> None:
+        """Test that a failed hedge does not replace the primary's answer."""
+        policy = HedgePolicy(initial_delay=0.01)
+
+        def primary() -> str:
+            time.sleep(0.05)
+            return "primary"
+
+        result, hedged = policy.run(primary, lambda: lambda: "", bool)
+
+        assert (result, hedged) == ("primary", True)
+        assert policy.stats().hedge_wins == 0
+
+    def test_delay_follows_percentile(self) -> None:
+        """Test that the delay is the configured percentile of response times."""
+        policy = HedgePolicy(percentile=90, initial_delay=2.0, min_samples=10)
+        assert policy.delay() == 2.0
+
+        for ms in range(1, 101):
+            policy.observe(ms / 1000)
+
+        assert policy.delay() == pytest.approx(0.090)
+
+    def test_invalid_percentile(self) -> None:
+        """Test that percentiles outside (0, 100) are rejected."""
+        with pytest.raises(ValueError):
+            HedgePolicy(percentile=100)
+
+
+class TestClientHedging:
+    """Tests for hedging through the client."""
+
+    @respx.mock
+    def test_slow_plus_request_is_hedged(self) -> None:
+        """Test that a stalled Plus API request is answered by a hedge."""
+        route = respx.get(PLUS_URL).mock(side_effect=slow_first())
+
+        client = XposedOrNot(api_key="test-key", hedge=HedgePolicy(initial_delay=0.05))
+        start = time.perf_counter()
+        result = client.check_email("test@example.com")
+
+        assert time.perf_counter() - start < 0.4
+        assert isinstance(result, EmailBreachDetailedResponse)
+        meta = client.last_response_meta
+        assert meta is not None and meta.hedged and meta.attempts == 2
+        stats = client.hedge_stats()
+        assert stats is not None and stats.hedge_wins == 1
+        time.sleep(0.6)
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_hedges_count_against_budgets(self) -> None:
+        """Test that a hedge takes a pooled key and is counted by the quota."""
+        respx.get(PLUS_URL).mock(side_effect=slow_first())
+        pool = APIKeyPool(["key-a", "key-b"])
+        quota = QuotaTracker(hourly_limit=100)
+
+        client = XposedOrNot(key_pool=pool, quota=quota, hedge=HedgePolicy(initial_delay=0.05))
+        client.check_email("test@example.com")
+
+        assert sum(usage.requests for usage in pool.usage()) == 2
+        assert quota.status().hourly_used == 2
+
+    @respx.mock
+    def test_exhausted_quota_skips_hedge(self) -> None:
+        """Test that no hedge is sent when the quota has no room for it."""
+        route = respx.get(PLUS_URL).mock(side_effect=slow_first(0.1))
+        quota = QuotaTracker(hourly_limit=1)
+
+        client = XposedOrNot(api_key="test-key", quota=quota, hedge=HedgePolicy(initial_delay=0.01))
+        client.check_email("test@example.com")
+
+        assert route.call_count == 1
+        stats = client.hedge_stats()
+        assert stats is not None and stats.skipped == 1
+
+    @respx.mock
+    def test_bulk_requests_are_not_hedged(self) -> None:
+        """Test that BULK requests wait for their own response."""
+        route = respx.get(PLUS_URL).mock(side_effect=slow_first(0.1))
+
+        client = XposedOrNot(api_key="test-key", hedge=HedgePolicy(initial_delay=0.01))
+        with client.priority(Priority.BULK):
+            client.check_email("test@example.com")
+
+        assert route.call_count == 1
+        stats = client.hedge_stats()
+        assert stats is not None and stats.requests == 0
+
+    def test_no_stats_without_hedging(self) -> None:
+        """Test that hedge_stats() is None when hedging is off."""
+        assert XposedOrNot().hedge_stats() is None
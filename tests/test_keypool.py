@@ -0,0 +1,94 @@
+"""Tests for the multi-key API key pool."""
+
+from __future__ import annotations
+
+import pytest
+import respx
+from httpx import Response
+
+from xposedornot import APIKeyPool, AuthenticationError, XposedOrNot
+from xposedornot.models import EmailBreachDetailedResponse
+
+from .conftest import SAMPLE_PLUS_CHECK_EMAIL_RESPONSE
+
+PLUS_URL = "https://plus-api.xposedornot.com/v3/check-email/test@example.com"
+
+
+class TestAPIKeyPool:
+    """Tests for key selection and book-keeping."""
+
+    def test_acquire_balances_by_remaining_budget(self) -> None:
+        """Test that requests alternate between keys with equal budgets."""
+        pool = APIKeyPool(["key-aaaa-1", "key-bbbb-2"], requests_per_minute=10)
+
+        keys = [pool.acquire() for _ in range(4)]
+
+        assert keys.count("key-aaaa-1") == 2
+        assert keys.count("key-bbbb-2") == 2
+
+    def test_rate_limited_key_is_rested(self) -> None:
+        """Test that a key is skipped while cooling down after a 429."""
+        pool = APIKeyPool({"finance": "key-1", "ops": "key-2"})
+        pool.report("key-1", 429, retry_after=30)
+
+        assert [pool.acquire() for _ in range(3)] == ["key-2"] * 3
+        usage = {u.name: u for u in pool.usage()}
+        assert usage["finance"].status == "cooling"
+        assert usage["finance"].rate_limited == 1
+        assert usage["ops"].requests == 3
+
+    def test_exhausted_budget_times_out(self) -> None:
+        """Test that acquire waits when every key has used its budget."""
+        pool = APIKeyPool(["key-1"], requests_per_minute=1)
+        pool.acquire()
+
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.01)
+
+    def test_all_keys_invalid(self) -> None:
+        """Test that AuthenticationError is raised when no valid key is left."""
+        pool = APIKeyPool(["key-1"])
+        pool.report("key-1", 401)
+
+        with pytest.raises(AuthenticationError):
+            pool.acquire()
+        assert pool.usage()[0].status == "invalid"
+
+
+class TestClientWithKeyPool:
+    """Tests for the client using a key pool."""
+
+    @respx.mock
+    def test_invalid_key_is_dropped_and_request_retried(self) -> None:
+        """Test that a 401 removes the key and the request moves to another key."""
+        route = respx.get(PLUS_URL)
+        route.side_effect = [
+            Response(401, json={"detail": "Invalid API key"}),
+            Response(200, json=SAMPLE_PLUS_CHECK_EMAIL_RESPONSE),
+        ]
+        pool = APIKeyPool(["bad-key", "good-key"])
+
+        client = XposedOrNot(key_pool=pool)
+        result = client.check_email("test@example.com")
+
+        assert isinstance(result, EmailBreachDetailedResponse)
+        sent = [call.request.headers["x-api-key"] for call in route.calls]
+        assert sent == ["bad-key", "good-key"]
+        assert [u.status for u in pool.usage()] == ["invalid", "active"]
+
+    @respx.mock
+    def test_rate_limited_key_rotates_without_backoff(self) -> None:
+        """Test that a 429 switches to another key instead of sleeping."""
+        route = respx.get(PLUS_URL)
+        route.side_effect = [
+            Response(429, headers={"Retry-After": "60"}),
+            Response(200, json=SAMPLE_PLUS_CHECK_EMAIL_RESPONSE),
+        ]
+        pool = APIKeyPool(["key-1", "key-2"])
+
+        client = XposedOrNot(key_pool=pool)
+        client.check_email("test@example.com")
+
+        sent = [call.request.headers["x-api-key"] for call in route.calls]
+        assert sent[0] != sent[1]
+        assert sorted(u.status for u in pool.usage()) == ["active", "cooling"]
@@ -0,0 +1,88 @@
+"""Tests for profiling mode."""
+
+from __future__ import annotations
+
+import io
+import tracemalloc
+
+import httpx
+import pytest
+import respx
+
+from xposedornot import NotFoundError, Profiler, RateLimiter, XposedOrNot
+
+from .conftest import SAMPLE_BREACHES_RESPONSE, SAMPLE_CHECK_EMAIL_RESPONSE
+
+BREACHES_URL = "https://api.xposedornot.com/v1/breaches"
+CHECK_EMAIL_URL = "https://api.xposedornot.com/v1/check-email/test@example.com"
+
+
+class TestProfiler:
+    """Tests for profiling client calls."""
+
+    @respx.mock
+    def test_breakdown_per_endpoint(self) -> None:
+        """Test that calls are grouped by endpoint and split into phases."""
+        respx.get(BREACHES_URL).mock(
+            return_value=httpx.Response(200, json=SAMPLE_BREACHES_RESPONSE)
+        )
+        respx.get(CHECK_EMAIL_URL).mock(return_value=httpx.Response(404))
+        profiler = Profiler()
+        client = XposedOrNot(rate_limiter=RateLimiter(min_interval=0.05), profiler=profiler)
+
+        client.get_breaches(domain="adobe.com")
+        client.get_breaches()
+        with pytest.raises(NotFoundError):
+            client.check_email("test@example.com")
+
+        profiles = {profile.endpoint: profile for profile in profiler.report()}
+        assert set(profiles) == {"get_breaches", "check_email"}
+        breaches = profiles["get_breaches"]
+        assert (breaches.calls, breaches.errors) == (2, 0)
+        assert breaches.rate_limit_wait > 0.02
+        assert breaches.network > 0 and breaches.decode > 0 and breaches.parse > 0
+        assert breaches.allocated is None
+        phases = breaches.rate_limit_wait + breaches.network + breaches.decode + breaches.parse
+        assert phases <= breaches.total
+        assert profiles["check_email"].errors == 1
+
+    @respx.mock
+    def test_profile_block_prints_summary(self) -> None:
+        """Test that profile() only covers its block and prints a table."""
+        respx.get(CHECK_EMAIL_URL).mock(
+            return_value=httpx.Response(200, json=SAMPLE_CHECK_EMAIL_RESPONSE)
+        )
+        client = XposedOrNot(rate_limiter=RateLimiter(min_interval=0))
+        out = io.StringIO()
+
+        with client.profile(file=out) as profiler:
+            client.check_email("test@example.com")
+        client.check_email("test@example.com")
+
+        assert profiler.report()[0].calls == 1
+        header, row = out.getvalue().splitlines()
+        assert header.split()[:3] == ["endpoint", "calls", "errors"]
+        assert row.split()[:3] == ["check_email", "1", "0"]
+
+    @respx.mock
+    def test_trace_allocations(self) -> None:
+        """Test that allocations are recorded and tracemalloc is stopped after."""
+        respx.get(BREACHES_URL).mock(
+            return_value=httpx.Response(200, json=SAMPLE_BREACHES_RESPONSE)
+        )
+        client = XposedOrNot(rate_limiter=RateLimiter(min_interval=0))
+        out = io.StringIO()
+
+        with client.profile(trace_allocations=True, file=out) as profiler:
+            assert tracemalloc.is_tracing()
+            breaches = client.get_breaches()
+
+        assert not tracemalloc.is_tracing()
+        assert breaches
+        allocated = profiler.report()[0].allocated
+        assert allocated is not None and allocated > 0
+        assert "alloc KiB" in out.getvalue()
+
+    def test_empty_summary(self) -> None:
+        """Test that a profiler without calls prints just the header."""
+        assert Profiler().summary().split()[0] == "endpoint"
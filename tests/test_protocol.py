@@ -0,0 +1,114 @@
+"""Tests for the transport-independent protocol layer."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+import respx
+from httpx import Response
+
+from xposedornot import (
+    APIError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+    ValidationError,
+    protocol,
+)
+from xposedornot.models import Breach, EmailBreachDetailedResponse, PasswordCheckResponse
+from xposedornot.utils import hash_password_keccak512
+
+from .conftest import (
+    SAMPLE_BREACHES_RESPONSE,
+    SAMPLE_PASSWORD_RESPONSE,
+    SAMPLE_PLUS_CHECK_EMAIL_RESPONSE,
+)
+
+
+class TestBuildRequest:
+    """Tests for request construction."""
+
+    def test_plus_check_email(self) -> None:
+        """Test that the Plus API request carries the key and detailed flag."""
+        request = protocol.check_email("test@example.com", plus=True).build_request("my-key")
+
+        assert request.url == "https://plus-api.xposedornot.com/v3/check-email/test@example.com"
+        assert request.params == {"detailed": "true"}
+        assert request.headers == {"x-api-key": "my-key"}
+
+    def test_custom_base_url_applies_to_main_api_only(self) -> None:
+        """Test that the default base URL does not override fixed hosts."""
+        breaches = protocol.list_breaches(domain="adobe.com")
+        password = protocol.check_password("password123")
+
+        assert breaches.url("https://custom.api") == "https://custom.api/v1/breaches"
+        assert breaches.params == {"domain": "adobe.com"}
+        assert password.url("https://custom.api").startswith("https://passwords.xposedornot.com")
+        assert password.path.endswith(hash_password_keccak512("password123"))
+
+    def test_invalid_email(self) -> None:
+        """Test that validation happens when the operation is built."""
+        with pytest.raises(ValidationError):
+            protocol.breach_analytics("not-an-email")
+
+
+class TestParseResponse:
+    """Tests for response handling."""
+
+    def test_parses_body(self) -> None:
+        """Test that a successful body becomes the result model."""
+        op = protocol.list_breaches()
+        result = op.parse_response(200, json.dumps(SAMPLE_BREACHES_RESPONSE).encode())
+
+        assert [b.breach_id for b in result] == ["adobe", "linkedin"]
+        assert all(isinstance(b, Breach) for b in result)
+
+    def test_not_modified(self) -> None:
+        """Test that a 304 answers a conditional operation with an empty result."""
+        assert protocol.sync_catalog().parse_response(304, b"") == {}
+
+    @pytest.mark.parametrize("status_code, body", [(200, b""), (200, b"<html></html>"), (304, b"")])
+    def test_invalid_body(self, status_code: int, body: bytes) -> None:
+        """Test that a missing or non-JSON body is not taken as an empty result."""
+        with pytest.raises(APIError):
+            protocol.check_email("test@example.com").parse_response(status_code, body)
+
+    @pytest.mark.parametrize(
+        "status_code, error",
+        [(404, NotFoundError), (429, RateLimitError), (503, ServerError)],
+    )
+    def test_maps_status_codes(self, status_code: int, error: type) -> None:
+        """Test that error statuses raise the matching exceptions."""
+        with pytest.raises(error):
+            protocol.check_password_prefix("abc").parse_response(status_code, b"")
+
+
+class TestCustomTransport:
+    """Tests for driving the protocol with another HTTP client."""
+
+    @respx.mock
+    async def test_async_client(self) -> None:
+        """Test that operations can be sent with httpx.AsyncClient."""
+        respx.get("https://plus-api.xposedornot.com/v3/check-email/test@example.com").mock(
+            return_value=Response(200, json=SAMPLE_PLUS_CHECK_EMAIL_RESPONSE)
+        )
+        respx.get(url__startswith="https://passwords.xposedornot.com/api/v1/pass/anon/").mock(
+            return_value=Response(200, json=SAMPLE_PASSWORD_RESPONSE)
+        )
+
+        results = []
+        async with httpx.AsyncClient() as http:
+            for op in (
+                protocol.check_email("test@example.com", plus=True),
+                protocol.check_password("password123"),
+            ):
+                req = op.build_request("my-key")
+                resp = await http.request(
+                    req.method, req.url, params=req.params, headers=req.headers
+                )
+                results.append(op.parse_response(resp.status_code, resp.content))
+
+        assert isinstance(results[0], EmailBreachDetailedResponse)
+        assert isinstance(results[1], PasswordCheckResponse)
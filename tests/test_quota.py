@@ -0,0 +1,143 @@
+"""Tests for hourly/daily quota accounting."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+import respx
+from httpx import Response
+
+from xposedornot import Priority, QuotaExceededError, QuotaTracker, XposedOrNot
+
+
+class TestQuotaTracker:
+    """Tests for the QuotaTracker."""
+
+    def test_status_counts_requests(self) -> None:
+        """Test that recorded requests reduce the remaining budget."""
+        quota = QuotaTracker(hourly_limit=10, daily_limit=100)
+        quota.record(3)
+
+        status = quota.status()
+
+        assert status.hourly_used == 3
+        assert status.hourly_remaining == 7
+        assert status.daily_remaining == 97
+        assert status.retry_after == 0.0
+
+    def test_exhausted_quota_fails_fast(self) -> None:
+        """Test that non-bulk requests raise once the quota is used up."""
+        quota = QuotaTracker(hourly_limit=2)
+        quota.record(2)
+
+        with pytest.raises(QuotaExceededError) as exc_info:
+            quota.acquire(Priority.NORMAL)
+
+        assert exc_info.value.retry_after is not None
+        assert exc_info.value.retry_after > 0
+
+    def test_bulk_leaves_reserve(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that bulk requests wait instead of using the reserved share."""
+        sleeps: list[float] = []
+        monkeypatch.setattr("xposedornot.quota.time.sleep", sleeps.append)
+        quota = QuotaTracker(hourly_limit=10, reserve=0.1)
+        quota.record(9)
+
+        assert quota.acquire(Priority.NORMAL) == 0.0
+        quota.acquire(Priority.BULK)
+
+        assert sleeps and sleeps[0] > 3000
+
+    def test_bulk_requests_are_paced(self) -> None:
+        """Test that bulk requests are spread across the window."""
+        quota = QuotaTracker(daily_limit=10, reserve=0)
+
+        assert quota._bulk_interval() == pytest.approx(86400 / 10)
+
+    def test_persisted_between_runs(self, tmp_path: Path) -> None:
+        """Test that counters are reloaded from the quota file."""
+        path = tmp_path / "quota.json"
+        quota = QuotaTracker(daily_limit=100, path=path)
+        quota.record(5)
+        quota.save()
+
+        assert QuotaTracker(daily_limit=100, path=path).status().daily_used == 5
+
+    def test_acquire_reserves_the_slot(self) -> None:
+        """Test that concurrent callers cannot all take the last free slot."""
+        quota = QuotaTracker(hourly_limit=5)
+        quota.record(4)
+        admitted: list[bool] = []
+
+        def call() -> None:
+            try:
+                quota.acquire(Priority.NORMAL)
+                admitted.append(True)
+            except QuotaExceededError:
+                admitted.append(False)
+
+        threads = [threading.Thread(target=call) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert admitted.count(True) == 1
+        assert quota.status().hourly_used == 5
+
+    def test_release_gives_the_slot_back(self) -> None:
+        """Test that a reservation that was not used can be released."""
+        quota = QuotaTracker(hourly_limit=1)
+        quota.acquire(Priority.NORMAL)
+        quota.release()
+
+        assert quota.acquire(Priority.NORMAL) == 0.0
+
+    def test_concurrent_saves(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that threads recording at once do not trip over each other's saves."""
+        monkeypatch.setattr(QuotaTracker, "SAVE_INTERVAL", 0.0)
+        path = tmp_path / "quota.json"
+        quota = QuotaTracker(daily_limit=10_000, path=path)
+        errors: list[BaseException] = []
+
+        def record() -> None:
+            try:
+                for _ in range(50):
+                    quota.record()
+            except BaseException as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        quota.save()
+
+        assert errors == []
+        assert QuotaTracker(daily_limit=10_000, path=path).status().daily_used == 400
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestClientQuota:
+    """Tests for the client with quota accounting."""
+
+    @respx.mock
+    def test_requests_are_counted(self) -> None:
+        """Test that each request sent is recorded and reported."""
+        respx.get("https://api.xposedornot.com/v1/breaches").mock(
+            return_value=Response(200, json={"exposedBreaches": []})
+        )
+
+        client = XposedOrNot(api_key="test-key", quota=QuotaTracker(hourly_limit=1))
+        client.get_breaches()
+
+        assert client.remaining_quota().hourly_remaining == 0  # type: ignore[union-attr]
+        with pytest.raises(QuotaExceededError):
+            client.get_breaches()
+
+    def test_no_quota(self) -> None:
+        """Test that remaining_quota() is None without a tracker."""
+        assert XposedOrNot().remaining_quota() is None
@@ -0,0 +1,95 @@
+"""Tests for the in-process and shared rate limiters."""
+
+from __future__ import annotations
+
+import os
+import pickle
+import time
+from pathlib import Path
+
+import pytest
+
+from xposedornot import APIKeyPool, RateLimiter, SharedRateLimiter, XposedOrNot
+
+
+class TestRateLimiter:
+    """Tests for the in-process rate limiter."""
+
+    def test_spaces_requests(self) -> None:
+        """Test that consecutive acquires are spaced by min_interval."""
+        limiter = RateLimiter(min_interval=0.05)
+
+        assert limiter.acquire() == 0.0
+        waited = limiter.acquire()
+
+        assert waited > 0.0
+
+
+class TestSharedRateLimiter:
+    """Tests for the SQLite-backed rate limiter."""
+
+    def test_schedule_is_shared_between_instances(self, tmp_path: Path) -> None:
+        """Test that two limiters on one database share a single schedule."""
+        db = tmp_path / "xon.sqlite"
+        first = SharedRateLimiter(db, min_interval=0.05)
+        second = SharedRateLimiter(db, min_interval=0.05)
+
+        first.acquire()
+        start = time.monotonic()
+        second.acquire()
+
+        assert time.monotonic() - start >= 0.04
+
+    def test_picklable(self, tmp_path: Path) -> None:
+        """Test that the limiter can be sent to worker processes."""
+        limiter = SharedRateLimiter(tmp_path / "xon.sqlite", min_interval=0.01)
+        limiter.acquire()
+
+        clone = pickle.loads(pickle.dumps(limiter))
+
+        assert clone.acquire() >= 0.0
+
+
+class TestForkSafety:
+    """Tests for rebuilding client state in forked children."""
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_child_gets_new_connection_pool(self) -> None:
+        """Test that a forked child does not reuse the parent's httpx client."""
+        client = XposedOrNot()
+        parent_pool = id(client._client)
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            os.close(read_fd)
+            os.write(write_fd, b"1" if id(client._client) != parent_pool else b"0")
+            os._exit(0)
+
+        os.close(write_fd)
+        result = os.read(read_fd, 1)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        assert result == b"1"
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_child_gets_new_key_pool_lock(self) -> None:
+        """Test that a key pool locked at fork time is usable in the child."""
+        client = XposedOrNot(key_pool=APIKeyPool(["key-a"]))
+        assert client._key_pool is not None
+
+        read_fd, write_fd = os.pipe()
+        with client._key_pool._lock:  # e.g. held by another thread
+            pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            os.close(read_fd)
+            os.write(write_fd, client._key_pool.acquire(timeout=1).encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        result = os.read(read_fd, 16)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        assert result == b"key-a"
@@ -0,0 +1,107 @@
+"""Tests for priority scheduling under the rate limit."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import respx
+from httpx import Response
+
+from xposedornot import Priority, RateLimiter, RequestScheduler, XposedOrNot
+from xposedornot.scheduler import current_priority
+
+
+class _GatedLimiter(RateLimiter):
+    """A limiter that records who got each slot and blocks the first caller."""
+
+    def __init__(self) -> None:
+        super().__init__(min_interval=0)
+        self.gate = threading.Event()
+        self.order: list[str] = []
+
+    def acquire(self) -> float:
+        name = threading.current_thread().name
+        self.order.append(name)
+        if len(self.order) == 1:
+            self.gate.wait(5)
+        return 0.0
+
+
+def _wait_until(predicate) -> None:  # type: ignore[no-untyped-def]
+    deadline = time.monotonic() + 5
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def _start(scheduler: RequestScheduler, name: str, priority: Priority) -> threading.Thread:
+    thread = threading.Thread(target=scheduler.acquire, args=(priority,), name=name)
+    thread.start()
+    return thread
+
+
+class TestRequestScheduler:
+    """Tests for the RequestScheduler."""
+
+    def test_interactive_jumps_the_queue(self) -> None:
+        """Test that an interactive request gets the next slot ahead of queued bulk work."""
+        limiter = _GatedLimiter()
+        scheduler = RequestScheduler(limiter)
+
+        threads = [_start(scheduler, "first", Priority.NORMAL)]
+        _wait_until(lambda: limiter.order)
+        threads += [_start(scheduler, f"bulk-{i}", Priority.BULK) for i in range(2)]
+        _wait_until(lambda: scheduler.queued()[Priority.BULK] == 2)
+        threads.append(_start(scheduler, "interactive", Priority.INTERACTIVE))
+        _wait_until(lambda: scheduler.queued()[Priority.INTERACTIVE] == 1)
+
+        limiter.gate.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert limiter.order[:2] == ["first", "interactive"]
+
+    def test_bulk_is_not_starved(self) -> None:
+        """Test that bulk requests get a weighted share while normal requests wait."""
+        limiter = _GatedLimiter()
+        scheduler = RequestScheduler(limiter, weights={Priority.NORMAL: 2, Priority.BULK: 1})
+
+        threads = [_start(scheduler, "first", Priority.NORMAL)]
+        _wait_until(lambda: limiter.order)
+        threads += [_start(scheduler, f"normal-{i}", Priority.NORMAL) for i in range(4)]
+        threads += [_start(scheduler, f"bulk-{i}", Priority.BULK) for i in range(2)]
+        _wait_until(lambda: sum(scheduler.queued().values()) == 6)
+
+        limiter.gate.set()
+        for thread in threads:
+            thread.join(5)
+
+        served = [name.split("-")[0] for name in limiter.order[1:4]]
+        assert "bulk" in served and "normal" in served
+
+
+class TestClientPriority:
+    """Tests for setting request priority on the client."""
+
+    def test_priority_context(self) -> None:
+        """Test that priority() applies only inside its block."""
+        client = XposedOrNot()
+
+        with client.priority(Priority.INTERACTIVE):
+            assert current_priority() is Priority.INTERACTIVE
+        assert current_priority() is Priority.NORMAL
+
+    @respx.mock
+    def test_retries_take_a_new_slot(self) -> None:
+        """Test that a retry after a 429 queues for the rate limiter again."""
+        respx.get("https://api.xposedornot.com/v1/breaches").mock(
+            side_effect=[Response(429), Response(200, json={"exposedBreaches": []})]
+        )
+        limiter = _GatedLimiter()
+        limiter.gate.set()
+        client = XposedOrNot(rate_limiter=limiter)
+        client.RETRY_BASE_DELAY = 0
+
+        client.get_breaches()
+
+        assert len(limiter.order) == 2
@@ -0,0 +1,83 @@
+"""Tests for the full-text breach index."""
+
+from __future__ import annotations
+
+from xposedornot import BreachCatalog
+from xposedornot.models import Breach
+from xposedornot.search import BreachTextIndex
+
+
+def make_breach(breach_id: str, description: str, industry: str = "") -> Breach:
+    """Create a catalog entry with the fields the text index uses."""
+    return Breach.from_dict(
+        {"breachID": breach_id, "exposureDescription": description, "industry": industry}
+    )
+
+
+BREACHES = [
+    make_breach("Clinic", "Patient records and API keys were stored in plaintext.", "Healthcare"),
+    make_breach("Shop", "Passwords stored in plaintext; the key API was exposed.", "Retail"),
+    make_breach("Forum", "Hashed passwords leaked.", "Social"),
+]
+
+
+class TestBreachTextIndex:
+    """Tests for BreachTextIndex."""
+
+    def test_words_and_phrases(self) -> None:
+        """Test that all words must match and phrases must be consecutive."""
+        index = BreachTextIndex()
+        index.update(BREACHES)
+
+        assert index.search("plaintext") == ["Clinic", "Shop"]
+        assert index.search("PLAINTEXT passwords") == ["Shop"]
+        assert index.search('"api keys"') == ["Clinic"]
+        assert index.search('"key api" plaintext') == ["Shop"]
+        assert index.search("healthcare") == ["Clinic"]
+        assert index.search("nothing") == []
+        assert index.search("") == []
+
+    def test_incremental_update(self) -> None:
+        """Test that only changed breaches are re-indexed."""
+        index = BreachTextIndex()
+        assert index.update(BREACHES) == (3, 0)
+
+        changed = [BREACHES[0], make_breach("Shop", "Credit cards leaked.", "Retail")]
+        assert index.update(changed) == (1, 1)
+
+        assert index.search("plaintext") == ["Clinic"]
+        assert index.search("leaked") == ["Shop"]
+        assert "Forum" not in index
+        assert len(index) == 2
+
+    def test_other_documents(self) -> None:
+        """Test indexing texts outside the catalog."""
+        index = BreachTextIndex()
+        index.add("Adobe", "Adobe breach description")
+
+        assert index.add("Adobe", "Adobe breach description") is False
+        assert index.search("breach") == ["Adobe"]
+        index.remove("Adobe")
+        assert index.search("breach") == []
+
+
+class TestCatalogSearch:
+    """Tests for BreachCatalog.search."""
+
+    def test_search_returns_breaches(self) -> None:
+        """Test that catalog search returns Breach objects."""
+        catalog = BreachCatalog(BREACHES)
+
+        assert catalog.search("passwords") == [BREACHES[2], BREACHES[1]]
+
+    def test_index_is_carried_over(self) -> None:
+        """Test that a refreshed catalog reuses the previous index."""
+        old = BreachCatalog(BREACHES)
+        old.search("plaintext")
+        index = old._text_index
+
+        new = BreachCatalog(BREACHES[:2], previous=old)
+
+        assert new._text_index is index
+        assert new.search("passwords") == [BREACHES[1]]
+        assert old.search("passwords") == [BREACHES[2], BREACHES[1]]
@@ -0,0 +1,207 @@
+"""Tests for binary catalog snapshots."""
+
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+import threading
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from xposedornot import BreachCatalog, RateLimiter, SharedBreachCatalog, XposedOrNot, snapshot
+from xposedornot.models import Breach
+from xposedornot.snapshot import MappedBreachCatalog
+
+from .conftest import SAMPLE_BREACHES_RESPONSE
+
+
+@pytest.fixture
+def catalog() -> BreachCatalog:
+    """Create a catalog with breaches over several years."""
+    breaches = [Breach.from_dict(b) for b in SAMPLE_BREACHES_RESPONSE["exposedBreaches"]]
+    breaches += [
+        Breach.from_dict(
+            {
+                "breachID": "Ünïcode",
+                "breachedDate": "2016",
+                "domain": "Example.COM.",
+                "exposedData": ["Emails", "Passwords"],
+                "exposedRecords": 42,
+                "exposureDescription": "Leaked plaintext passwords",
+                "verified": True,
+            }
+        ),
+        Breach.from_dict({"breachID": "undated", "domain": "example.com"}),
+        Breach.from_dict({"breachID": "early", "breachedDate": "2001-02-03"}),
+    ]
+    return BreachCatalog(breaches, fetched_at=1700000000.0)
+
+
+@pytest.fixture
+def mapped(catalog: BreachCatalog) -> MappedBreachCatalog:
+    """Load the catalog back from snapshot bytes."""
+    return MappedBreachCatalog(snapshot.dumps(catalog))
+
+
+class TestSnapshot:
+    """Tests for snapshot round trips."""
+
+    def test_round_trip(self, catalog: BreachCatalog, mapped: MappedBreachCatalog) -> None:
+        """Test that every breach and the fetch time survive."""
+        assert mapped.breaches == catalog.breaches
+        assert len(mapped) == len(catalog)
+        assert mapped.fetched_at == catalog.fetched_at
+
+    def test_lookups(self, catalog: BreachCatalog, mapped: MappedBreachCatalog) -> None:
+        """Test that indexed lookups match the in-memory catalog."""
+        assert mapped.get("ünÏCODE") == catalog.get("Ünïcode")
+        assert mapped.get("missing") is None
+        assert "ÜNÏCODE" in mapped and "missing" not in mapped and 1 not in mapped
+        assert mapped.by_domain("example.com") == catalog.by_domain("example.com")
+        assert mapped.by_domain("nowhere.org") == []
+
+    def test_time_queries(self, catalog: BreachCatalog, mapped: MappedBreachCatalog) -> None:
+        """Test date ranges and first breaches against the in-memory catalog."""
+        assert mapped.between() == catalog.between()
+        assert mapped.between("2010", "2017") == catalog.between("2010", "2017")
+        assert mapped.since("2014") == catalog.since("2014")
+        assert mapped.first_breach_by_domain() == catalog.first_breach_by_domain()
+
+    def test_search(self, catalog: BreachCatalog, mapped: MappedBreachCatalog) -> None:
+        """Test that the text index is rebuilt from the snapshot."""
+        assert mapped.search("plaintext") == catalog.search("plaintext")
+        assert [b.breach_id for b in mapped.search("plaintext")] == ["Ünïcode"]
+
+    def test_empty_catalog(self) -> None:
+        """Test a snapshot of an empty catalog."""
+        mapped = MappedBreachCatalog(snapshot.dumps(BreachCatalog([])))
+
+        assert len(mapped) == 0
+        assert mapped.get("x") is None
+        assert mapped.between() == []
+
+    def test_rejects_other_data(self) -> None:
+        """Test that buffers that are not snapshots are rejected."""
+        with pytest.raises(ValueError):
+            MappedBreachCatalog(b"not a snapshot")
+        with pytest.raises(ValueError):
+            MappedBreachCatalog(bytes(200))
+
+    def test_save_and_load(self, catalog: BreachCatalog, tmp_path: Path) -> None:
+        """Test memory-mapping a snapshot file."""
+        path = tmp_path / "catalog.xon"
+        snapshot.save(catalog, path)
+
+        with snapshot.load(path) as mapped:
+            assert mapped.breaches == catalog.breaches
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_concurrent_saves(self, catalog: BreachCatalog, tmp_path: Path) -> None:
+        """Test that threads saving at once do not trip over each other's files."""
+        path = tmp_path / "catalog.xon"
+        errors: list[BaseException] = []
+
+        def save() -> None:
+            try:
+                for _ in range(20):
+                    snapshot.save(catalog, path)
+            except BaseException as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=save) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert list(tmp_path.iterdir()) == [path]
+
+
+def _domain_lookup(catalog: SharedBreachCatalog, queue: Any) -> None:
+    with catalog:
+        queue.put([b.breach_id for b in catalog.by_domain("example.com")])
+
+
+class TestSharedCatalog:
+    """Tests for catalogs in shared memory."""
+
+    def test_attach(self, catalog: BreachCatalog) -> None:
+        """Test that an attached catalog sees the published one."""
+        shared = SharedBreachCatalog.create(catalog)
+        try:
+            with SharedBreachCatalog.attach(shared.name) as attached:
+                assert attached.breaches == catalog.breaches
+                assert attached.get("linkedin") == catalog.get("linkedin")
+            # Closing an attachment leaves the segment in place
+            with pickle.loads(pickle.dumps(shared)) as again:
+                assert again.name == shared.name
+                assert len(again) == len(catalog)
+        finally:
+            shared.close()
+            shared.unlink()
+
+        with pytest.raises(FileNotFoundError):
+            SharedBreachCatalog.attach(shared.name)
+
+    def test_attach_from_another_process(self, catalog: BreachCatalog) -> None:
+        """Test that a worker process queries the segment by name."""
+        shared = SharedBreachCatalog.create(catalog)
+        try:
+            context = multiprocessing.get_context()
+            queue = context.Queue()
+            process = context.Process(target=_domain_lookup, args=(shared, queue))
+            process.start()
+            assert queue.get(timeout=30) == ["Ünïcode", "undated"]
+            process.join(30)
+            assert process.exitcode == 0
+            # The worker exiting did not remove the segment
+            with SharedBreachCatalog.attach(shared.name) as attached:
+                assert len(attached) == len(catalog)
+        finally:
+            shared.close()
+            shared.unlink()
+
+
+class TestClientSnapshot:
+    """Tests for saving and loading snapshots through the client."""
+
+    @respx.mock
+    def test_loaded_catalog_answers_lookups(self, tmp_path: Path) -> None:
+        """Test that a loaded snapshot is used instead of the API."""
+        route = respx.get("https://api.xposedornot.com/v1/breaches").mock(
+            return_value=httpx.Response(200, json=SAMPLE_BREACHES_RESPONSE)
+        )
+        path = tmp_path / "catalog.xon"
+        with XposedOrNot(rate_limiter=RateLimiter(min_interval=0)) as xon:
+            xon.save_breach_catalog(path)
+        assert route.call_count == 1
+
+        with XposedOrNot(rate_limiter=RateLimiter(min_interval=0)) as xon:
+            catalog = xon.load_breach_catalog(path)
+            assert xon.get_breach_catalog() is catalog
+            assert xon.get_breaches(domain="adobe.com") == catalog.by_domain("adobe.com")
+            catalog.close()
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_shared_catalog(self) -> None:
+        """Test publishing and attaching through clients."""
+        route = respx.get("https://api.xposedornot.com/v1/breaches").mock(
+            return_value=httpx.Response(200, json=SAMPLE_BREACHES_RESPONSE)
+        )
+        with XposedOrNot(rate_limiter=RateLimiter(min_interval=0)) as xon:
+            shared = xon.share_breach_catalog()
+        try:
+            with XposedOrNot(rate_limiter=RateLimiter(min_interval=0)) as xon:
+                catalog = xon.attach_breach_catalog(shared.name)
+                assert xon.get_breaches(domain="linkedin.com") == catalog.by_domain("linkedin.com")
+                catalog.close()
+        finally:
+            shared.close()
+            shared.unlink()
+        assert route.call_count == 1
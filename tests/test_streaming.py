@@ -0,0 +1,96 @@
+"""Tests for streaming email checks."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator
+
+import pytest
+import respx
+from httpx import Response
+
+from xposedornot import ValidationError, XposedOrNot
+from xposedornot.models import BreachAnalyticsResponse, EmailBreachDetailedResponse
+
+from .conftest import SAMPLE_BREACH_ANALYTICS_RESPONSE, SAMPLE_PLUS_CHECK_EMAIL_RESPONSE
+
+PLUS_ROUTE = r"https://plus-api\.xposedornot\.com/v3/check-email/(?P<email>[^?]+)"
+
+
+def _plus_lookup(request, email):  # type: ignore[no-untyped-def]
+    if email.startswith("clean"):
+        return Response(404, json={"detail": "Not found"})
+    return Response(200, json=SAMPLE_PLUS_CHECK_EMAIL_RESPONSE)
+
+
+class TestStreamCheck:
+    """Tests for XposedOrNot.stream_check()."""
+
+    @respx.mock
+    async def test_results_from_async_source(self) -> None:
+        """Test that every address is checked and not-found maps to None."""
+        respx.get(url__regex=PLUS_ROUTE).mock(side_effect=_plus_lookup)
+
+        async def source() -> AsyncIterator[str]:
+            for email in ["a@example.com", "clean@example.com", "b@example.com"]:
+                yield email
+
+        client = XposedOrNot(api_key="test-key")
+        results = {email: result async for email, result in client.stream_check(source())}
+
+        assert set(results) == {"a@example.com", "clean@example.com", "b@example.com"}
+        assert results["clean@example.com"] is None
+        assert isinstance(results["a@example.com"], EmailBreachDetailedResponse)
+
+    @respx.mock
+    async def test_source_pulled_with_backpressure(self) -> None:
+        """Test that no more than max_in_flight addresses are pulled ahead."""
+        respx.get(url__regex=PLUS_ROUTE).mock(side_effect=_plus_lookup)
+        pulled = 0
+
+        async def source() -> AsyncIterator[str]:
+            nonlocal pulled
+            for i in range(100):
+                pulled += 1
+                yield f"user{i}@example.com"
+
+        client = XposedOrNot(api_key="test-key")
+        stream = client.stream_check(source(), max_in_flight=2)
+        await stream.__anext__()
+
+        assert pulled <= 3
+        await stream.aclose()
+
+    async def test_return_exceptions(self) -> None:
+        """Test that per-address errors can be yielded instead of raised."""
+        client = XposedOrNot()
+
+        results = [r async for r in client.stream_check(["bad"], return_exceptions=True)]
+        assert isinstance(results[0][1], ValidationError)
+
+        with pytest.raises(ValidationError):
+            async for _ in client.stream_check(["bad"]):
+                pass
+
+    @respx.mock
+    async def test_stop_drains_in_flight(self) -> None:
+        """Test that setting stop ends the stream after in-flight checks finish."""
+        respx.get("https://api.xposedornot.com/v1/breach-analytics").mock(
+            return_value=Response(200, json=SAMPLE_BREACH_ANALYTICS_RESPONSE)
+        )
+        stop = asyncio.Event()
+
+        async def endless() -> AsyncIterator[str]:
+            i = 0
+            while True:
+                i += 1
+                yield f"user{i}@example.com"
+
+        client = XposedOrNot(api_key="test-key")
+        results = []
+        async for _email, result in client.stream_check(endless(), analytics=True, stop=stop):
+            results.append(result)
+            stop.set()
+
+        assert 1 <= len(results) <= 5
+        assert all(isinstance(r, BreachAnalyticsResponse) for r in results)
@@ -0,0 +1,163 @@
+"""Tests for incremental catalog sync."""
+
+from __future__ import annotations
+
+import copy
+import threading
+from pathlib import Path
+
+import pytest
+import respx
+from httpx import Response
+
+from xposedornot import (
+    CatalogSync,
+    DeadlineExceeded,
+    Profiler,
+    RateLimiter,
+    ResponseCache,
+    XposedOrNot,
+)
+
+from .conftest import SAMPLE_BREACHES_RESPONSE
+
+BREACHES_URL = "https://api.xposedornot.com/v1/breaches"
+
+
+def make_client() -> XposedOrNot:
+    """Create a client without rate-limit delays."""
+    return XposedOrNot(rate_limiter=RateLimiter(min_interval=0))
+
+
+class TestCatalogSync:
+    """Tests for CatalogSync."""
+
+    @respx.mock
+    def test_diff(self) -> None:
+        """Test that added, changed and removed breaches are reported."""
+        updated = copy.deepcopy(SAMPLE_BREACHES_RESPONSE)
+        updated["exposedBreaches"][0]["exposedRecords"] = 153000000
+        updated["exposedBreaches"][1] = dict(
+            SAMPLE_BREACHES_RESPONSE["exposedBreaches"][1], breachID="dropbox"
+        )
+        respx.get(BREACHES_URL).mock(
+            side_effect=[
+                Response(200, json=SAMPLE_BREACHES_RESPONSE),
+                Response(200, json=updated),
+            ]
+        )
+
+        sync = CatalogSync(make_client())
+        first = sync.sync()
+        second = sync.sync()
+
+        assert [b.breach_id for b in first.added] == ["adobe", "linkedin"]
+        assert [b.breach_id for b in second.added] == ["dropbox"]
+        assert [b.exposed_records for b in second.changed] == [153000000]
+        assert [b.breach_id for b in second.removed] == ["linkedin"]
+        assert second.unchanged == 0
+        assert second.has_changes
+
+    @respx.mock
+    def test_conditional_request(self) -> None:
+        """Test that validators are sent and a 304 reports no changes."""
+        route = respx.get(BREACHES_URL).mock(
+            side_effect=[
+                Response(
+                    200,
+                    json=SAMPLE_BREACHES_RESPONSE,
+                    headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+                ),
+                Response(304),
+            ]
+        )
+
+        sync = CatalogSync(make_client())
+        sync.sync()
+        diff = sync.sync()
+
+        assert "if-none-match" not in route.calls[0].request.headers
+        assert route.calls[1].request.headers["if-none-match"] == '"v1"'
+        assert route.calls[1].request.headers["if-modified-since"].startswith("Mon")
+        assert diff.not_modified
+        assert diff.unchanged == 2
+        assert not diff.has_changes
+
+    @respx.mock
+    def test_snapshot_is_persisted(self, tmp_path: Path) -> None:
+        """Test that a new process continues from the saved snapshot."""
+        respx.get(BREACHES_URL).mock(return_value=Response(200, json=SAMPLE_BREACHES_RESPONSE))
+        path = tmp_path / "catalog.json"
+
+        CatalogSync(make_client(), path=path).sync()
+        sync = CatalogSync(make_client(), path=path)
+        diff = sync.sync()
+
+        assert len(sync) == 2
+        assert diff.unchanged == 2
+        assert not diff.has_changes
+
+    @respx.mock
+    def test_sync_is_profiled(self) -> None:
+        """Test that syncs go through the client's call path."""
+        respx.get(BREACHES_URL).mock(return_value=Response(200, json=SAMPLE_BREACHES_RESPONSE))
+        profiler = Profiler()
+        client = XposedOrNot(rate_limiter=RateLimiter(min_interval=0), profiler=profiler)
+
+        CatalogSync(client).sync()
+
+        assert [profile.endpoint for profile in profiler.report()] == ["sync_catalog"]
+
+    def test_sync_deadline(self) -> None:
+        """Test that a spent deadline stops the sync before any request."""
+        with respx.mock(assert_all_called=False) as mock:
+            route = mock.get(BREACHES_URL).mock(return_value=Response(200, json={}))
+
+            with pytest.raises(DeadlineExceeded):
+                CatalogSync(make_client()).sync(deadline=0)
+
+        assert route.call_count == 0
+
+    @respx.mock
+    def test_sync_bypasses_response_cache(self) -> None:
+        """Test that each sync fetches the catalog even with a cache configured."""
+        updated = copy.deepcopy(SAMPLE_BREACHES_RESPONSE)
+        updated["exposedBreaches"].append(
+            dict(SAMPLE_BREACHES_RESPONSE["exposedBreaches"][1], breachID="dropbox")
+        )
+        route = respx.get(BREACHES_URL).mock(
+            side_effect=[
+                Response(200, json=SAMPLE_BREACHES_RESPONSE),
+                Response(200, json=updated),
+            ]
+        )
+        client = XposedOrNot(rate_limiter=RateLimiter(min_interval=0), cache=ResponseCache())
+
+        sync = CatalogSync(client)
+        sync.sync()
+        diff = sync.sync()
+
+        assert route.call_count == 2
+        assert [b.breach_id for b in diff.added] == ["dropbox"]
+
+    def test_concurrent_saves(self, tmp_path: Path) -> None:
+        """Test that threads saving at once do not trip over each other's files."""
+        path = tmp_path / "catalog.json"
+        sync = CatalogSync(make_client(), path=path)
+        errors: list[BaseException] = []
+
+        def save() -> None:
+            try:
+                for _ in range(20):
+                    sync.save()
+            except BaseException as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=save) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert list(tmp_path.iterdir()) == [path]
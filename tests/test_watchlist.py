@@ -0,0 +1,124 @@
+"""Tests for the watchlist monitor."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+import respx
+from httpx import Response
+
+from xposedornot import (
+    RateLimiter,
+    ResponseCache,
+    ValidationError,
+    WatchlistMonitor,
+    XposedOrNot,
+)
+from xposedornot.models import Breach, CatalogDiff
+
+FREE_API = "https://api.xposedornot.com/v1/check-email/"
+
+
+@pytest.fixture
+def monitor(tmp_path: Path) -> WatchlistMonitor:
+    """Create a monitor around a client without rate-limit delays."""
+    client = XposedOrNot(rate_limiter=RateLimiter(min_interval=0))
+    return WatchlistMonitor(client, tmp_path / "watchlist.sqlite")
+
+
+def diff_with(domain: str) -> CatalogDiff:
+    """Create a catalog diff adding one breach on a domain."""
+    return CatalogDiff(added=[Breach.from_dict({"breachID": "New", "domain": domain})])
+
+
+class TestWatchlistMonitor:
+    """Tests for WatchlistMonitor."""
+
+    def test_add(self, monitor: WatchlistMonitor) -> None:
+        """Test that addresses are added once and validated."""
+        assert monitor.add(["a@corp.com", "b@example.com"]) == 2
+        assert monitor.add(["a@corp.com"]) == 0
+        assert len(monitor) == 2
+
+        with pytest.raises(ValidationError):
+            monitor.add(["not-an-email"])
+
+    @respx.mock
+    def test_plan_order(self, monitor: WatchlistMonitor) -> None:
+        """Test that domain matches come first and fresh addresses are skipped."""
+        respx.get(url__startswith=FREE_API).mock(
+            return_value=Response(200, json={"breaches": ["Adobe"]})
+        )
+        monitor.add(["a@example.com", "b@mail.corp.com", "c@other.org"])
+        list(monitor.run())  # baseline: every address checked once
+
+        assert monitor.plan() == []
+        assert monitor.plan(diff_with("corp.com")) == ["b@mail.corp.com"]
+        assert monitor.plan(diff_with("corp.com"), sweep=True) == [
+            "b@mail.corp.com",
+            "a@example.com",
+            "c@other.org",
+        ]
+        assert monitor.plan(diff_with("corp.com"), limit=1, sweep=True) == ["b@mail.corp.com"]
+
+    def test_plan_follows_diff_not_watchlist(self, monitor: WatchlistMonitor) -> None:
+        """Test that a one-breach diff over a large watchlist plans few addresses."""
+        monitor.add(f"user{i}@corp{i % 100}.com" for i in range(5000))
+        monitor.add(["stale@example.com"])
+        with monitor._lock:
+            monitor._conn.execute(
+                "UPDATE watchlist SET breaches = '[]', checked_at = ? WHERE email != ?",
+                (time.time(), "stale@example.com"),
+            )
+
+        planned = monitor.plan(diff_with("corp7.com"))
+
+        assert len(planned) == 51
+        assert planned[-1] == "stale@example.com"
+        assert all(email.endswith("@corp7.com") for email in planned[:-1])
+
+    @respx.mock
+    def test_run_reports_new_breaches(self, monitor: WatchlistMonitor) -> None:
+        """Test that only breaches new since the last check are reported."""
+        respx.get(f"{FREE_API}a@example.com").mock(
+            side_effect=[
+                Response(200, json={"breaches": ["Adobe"]}),
+                Response(200, json={"breaches": ["Adobe", "New"]}),
+            ]
+        )
+        respx.get(f"{FREE_API}b@example.com").mock(return_value=Response(404))
+        monitor.add(["a@example.com", "b@example.com"])
+
+        assert list(monitor.run()) == []
+        alerts = list(monitor.run(diff_with("example.com")))
+
+        assert [(a.email, a.new_breaches) for a in alerts] == [("a@example.com", ["New"])]
+        assert alerts[0].breaches == ["Adobe", "New"]
+        assert monitor.known_breaches("b@example.com") == []
+
+    @respx.mock
+    def test_run_bypasses_response_cache(self, tmp_path: Path) -> None:
+        """Test that re-checks are not answered from the client's cache."""
+        route = respx.get(f"{FREE_API}a@example.com").mock(
+            side_effect=[
+                Response(200, json={"breaches": ["Adobe"]}),
+                Response(200, json={"breaches": ["Adobe", "New"]}),
+            ]
+        )
+        client = XposedOrNot(rate_limiter=RateLimiter(min_interval=0), cache=ResponseCache())
+        monitor = WatchlistMonitor(client, tmp_path / "watchlist.sqlite")
+        monitor.add(["a@example.com"])
+
+        list(monitor.run())
+        alerts = list(monitor.run(diff_with("example.com")))
+
+        assert route.call_count == 2
+        assert [(a.email, a.new_breaches) for a in alerts] == [("a@example.com", ["New"])]
+
+    def test_unchanged_catalog_checks_only_stale(self, monitor: WatchlistMonitor) -> None:
+        """Test that an empty diff plans only never-checked addresses."""
+        monitor.add(["a@example.com"])
+
+        assert monitor.plan(CatalogDiff(unchanged=10)) == ["a@example.com"]
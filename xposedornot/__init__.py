@@ -10,40 +10,91 @@ Example:
     >>> print(result.breaches)
 """
 
+from . import datatypes, export, protocol, snapshot
+from .aggregate import BreachAggregator
+from .audit import PasswordAuditor
+from .breaker import CircuitBreaker
+from .cache import ResponseCache, SharedResponseCache
+from .catalog import BreachCatalog
 from .client import XposedOrNot
+from .daemon import DaemonClient
 from .exceptions import (
     APIError,
     AuthenticationError,
+    CircuitOpenError,
+    DeadlineExceeded,
     NotFoundError,
+    QuotaExceededError,
     RateLimitError,
     ServerError,
     ValidationError,
     XposedOrNotError,
 )
+from .hedging import HedgePolicy
+from .keypool import APIKeyPool
 from .models import (
+    APIKeyUsage,
     Breach,
     BreachAnalyticsResponse,
     BreachDetails,
     BreachInfo,
     BreachMetrics,
+    CatalogDiff,
+    CircuitStatus,
     EmailBreachDetailedResponse,
     EmailBreachResponse,
+    EndpointProfile,
+    HedgeStats,
+    PasswordAuditRecord,
+    PasswordAuditStats,
     PasswordCheckResponse,
+    QuotaStatus,
+    RequestTimings,
+    ResponseMeta,
+    WatchlistAlert,
 )
+from .profiling import Profiler
+from .quota import QuotaTracker
+from .ratelimit import RateLimiter, SharedRateLimiter
+from .scheduler import Priority, RequestScheduler
+from .snapshot import SharedBreachCatalog
+from .sync import CatalogSync
+from .watchlist import WatchlistMonitor
 
 __version__ = "1.0.1"
 
 __all__ = [
     # Client
     "XposedOrNot",
+    "DaemonClient",
+    "PasswordAuditor",
+    "APIKeyPool",
+    "RateLimiter",
+    "SharedRateLimiter",
+    "ResponseCache",
+    "SharedResponseCache",
+    "Priority",
+    "RequestScheduler",
+    "QuotaTracker",
+    "HedgePolicy",
+    "CircuitBreaker",
+    "Profiler",
+    "BreachCatalog",
+    "SharedBreachCatalog",
+    "CatalogSync",
+    "WatchlistMonitor",
+    "BreachAggregator",
     # Exceptions
     "XposedOrNotError",
     "APIError",
     "NotFoundError",
     "RateLimitError",
+    "QuotaExceededError",
     "AuthenticationError",
     "ServerError",
     "ValidationError",
+    "DeadlineExceeded",
+    "CircuitOpenError",
     # Models
     "EmailBreachResponse",
     "EmailBreachDetailedResponse",
@@ -53,4 +104,20 @@ __all__ = [
     "BreachMetrics",
     "Breach",
     "PasswordCheckResponse",
+    "PasswordAuditRecord",
+    "PasswordAuditStats",
+    "APIKeyUsage",
+    "QuotaStatus",
+    "ResponseMeta",
+    "HedgeStats",
+    "CircuitStatus",
+    "EndpointProfile",
+    "RequestTimings",
+    "CatalogDiff",
+    "WatchlistAlert",
+    # Modules
+    "datatypes",
+    "export",
+    "protocol",
+    "snapshot",
 ]
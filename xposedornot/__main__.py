@@ -0,0 +1,7 @@
+"""Allow running the CLI with `python -m xposedornot`."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,175 @@
+"""Streaming aggregation of bulk scan results.
+
+BreachAggregator folds results into counters as they arrive, so an
+organization-wide rollup never needs the individual responses in memory:
+its size depends on the number of distinct breaches, industries and years,
+not on the number of addresses. Aggregators built by different workers
+(threads or processes - they pickle) are combined with merge().
+
+Example:
+    >>> agg = BreachAggregator(catalog=xon.get_breach_catalog())
+    >>> async for email, result in xon.stream_check(addresses):
+    ...     agg.add(result)
+    >>> agg.metrics().yearwise_details
+    [{'year': 2012, 'count': 31}, {'year': 2013, 'count': 57}]
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Tuple, Union
+
+from . import datatypes
+from .models import (
+    BreachAnalyticsResponse,
+    BreachMetrics,
+    EmailBreachDetailedResponse,
+    EmailBreachResponse,
+)
+
+if TYPE_CHECKING:
+    from .catalog import BreachCatalog
+
+# (breach, industry, password_risk, year, data_types) of one exposure
+_Exposure = Tuple[str, str, str, Optional[int], int]
+
+ScanResult = Union[
+    BreachAnalyticsResponse, EmailBreachDetailedResponse, EmailBreachResponse, None
+]
+
+
+class BreachAggregator:
+    """Rolls up exposures per breach, industry, password risk and year."""
+
+    def __init__(self, catalog: "BreachCatalog | None" = None):
+        """Initialize the aggregator.
+
+        Args:
+            catalog: Optional breach catalog used to fill in what a result
+                     does not carry itself (industry for Plus results, all
+                     details for free-API results that list names only).
+        """
+        self._catalog = catalog
+        self.addresses = 0  # Results added, including not-found ones
+        self.exposed_addresses = 0  # Results with at least one breach
+        self.exposures = 0  # (address, breach) pairs
+        self.by_breach: Counter[str] = Counter()
+        self.by_industry: Counter[str] = Counter()
+        self.by_password_risk: Counter[str] = Counter()
+        self.by_year: Counter[int] = Counter()
+        self.by_data_type: Counter[str] = Counter()
+
+    def __getstate__(self) -> dict[str, object]:
+        # The catalog is only needed while adding; don't ship it to the merger
+        state = self.__dict__.copy()
+        state["_catalog"] = None
+        return state
+
+    def add(self, result: ScanResult) -> None:
+        """Fold one address's result into the totals.
+
+        Args:
+            result: A check_email() or breach_analytics() result, or None
+                    for an address not found in any breach.
+        """
+        self.addresses += 1
+        exposures = list(self._exposures(result)) if result is not None else []
+        if not exposures:
+            return
+
+        self.exposed_addresses += 1
+        self.exposures += len(exposures)
+        data_types: Counter[int] = Counter()
+        for breach, industry, password_risk, year, mask in exposures:
+            self.by_breach[breach] += 1
+            if industry:
+                self.by_industry[industry] += 1
+            if password_risk:
+                self.by_password_risk[password_risk] += 1
+            if year is not None:
+                self.by_year[year] += 1
+            data_types[mask] += 1
+        for mask, count in data_types.items():
+            for name in datatypes.names(mask):
+                self.by_data_type[name] += count
+
+    def add_all(self, results: Iterable[ScanResult]) -> None:
+        """Add many results (e.g. the values of a bulk scan)."""
+        for result in results:
+            self.add(result)
+
+    def merge(self, other: BreachAggregator) -> BreachAggregator:
+        """Add the totals of another aggregator (e.g. from another worker).
+
+        Returns:
+            This aggregator.
+        """
+        self.addresses += other.addresses
+        self.exposed_addresses += other.exposed_addresses
+        self.exposures += other.exposures
+        self.by_breach.update(other.by_breach)
+        self.by_industry.update(other.by_industry)
+        self.by_password_risk.update(other.by_password_risk)
+        self.by_year.update(other.by_year)
+        self.by_data_type.update(other.by_data_type)
+        return self
+
+    def metrics(self) -> BreachMetrics:
+        """Summarize the totals in the shape of BreachMetrics.
+
+        Counts are exposures (address-breach pairs). risk is left empty:
+        the API's risk score cannot be derived from individual breaches.
+        """
+        return BreachMetrics(
+            industry=_named(self.by_industry),
+            passwords_strength=_named(self.by_password_risk),
+            xposed_data=_named(self.by_data_type),
+            yearwise_details=[
+                {"year": year, "count": count} for year, count in sorted(self.by_year.items())
+            ],
+        )
+
+    def _exposures(
+        self,
+        result: BreachAnalyticsResponse | EmailBreachDetailedResponse | EmailBreachResponse,
+    ) -> Iterator[_Exposure]:
+        if isinstance(result, BreachAnalyticsResponse):
+            for details in result.breaches_details:
+                xposed_at = details.xposed_at
+                yield (
+                    details.breach,
+                    details.industry,
+                    details.password_risk,
+                    xposed_at.year if xposed_at else None,
+                    details.data_types,
+                )
+        elif isinstance(result, EmailBreachDetailedResponse):
+            for info in result.breaches:
+                breach = self._catalog.get(info.breach_id) if self._catalog else None
+                breached_at = info.breached_at
+                yield (
+                    info.breach_id,
+                    breach.industry if breach else "",
+                    info.password_risk,
+                    breached_at.year if breached_at else None,
+                    info.data_types,
+                )
+        else:
+            for name in result.breaches:
+                breach = self._catalog.get(name) if self._catalog else None
+                if breach is None:
+                    yield name, "", "", None, 0
+                    continue
+                breached_at = breach.breached_at
+                yield (
+                    name,
+                    breach.industry,
+                    breach.password_risk,
+                    breached_at.year if breached_at else None,
+                    breach.data_types,
+                )
+
+
+def _named(counter: Counter[str]) -> list[dict[str, object]]:
+    """Counter entries as {"name", "count"} dicts, most common first."""
+    return [{"name": name, "count": count} for name, count in counter.most_common()]
@@ -0,0 +1,226 @@
+"""Streaming password audits over large wordlists.
+
+SECURITY NOTE: As with check_password(), passwords are hashed locally and
+only the first 10 characters of each Keccak-512 hash are sent to the API.
+
+The input file is memory-mapped and split into lines without copying;
+each line is hashed straight from the mapping. Duplicate passwords are
+detected with a set of 64-bit digest fingerprints, and each distinct hash
+prefix is looked up only once, with a bounded number of lookups in flight.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import mmap
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterator, Tuple
+
+from .exceptions import NotFoundError
+from .models import PasswordAuditRecord, PasswordAuditStats
+from .scheduler import Priority, context_with_priority
+from .utils import keccak512_digests, keccak512_prefix
+
+if TYPE_CHECKING:
+    from .client import XposedOrNot
+
+# (line_number, offset, line) - the line is a zero-copy view into the mapping
+_Line = Tuple[int, int, memoryview]
+
+
+def iter_lines(buffer: mmap.mmap | bytes) -> Iterator[_Line]:
+    """Split a buffer into lines without copying.
+
+    Blank lines are skipped and trailing carriage returns are stripped.
+
+    Args:
+        buffer: The memory-mapped file (or any bytes-like buffer).
+
+    Yields:
+        (line_number, offset, line) tuples, where line is a memoryview.
+    """
+    view = memoryview(buffer)
+    find = buffer.find
+    size = len(buffer)
+    pos = 0
+    line_number = 0
+
+    while pos < size:
+        line_number += 1
+        end = find(b"\n", pos)
+        if end == -1:
+            end = size
+        stop = end
+        if stop > pos and view[stop - 1] == 0x0D:  # "\r"
+            stop -= 1
+        if stop > pos:
+            yield line_number, pos, view[pos:stop]
+        pos = end + 1
+
+
+class PasswordAuditor:
+    """Audits a password file against the XposedOrNot password API.
+
+    Example:
+        >>> from xposedornot import XposedOrNot
+        >>> from xposedornot.audit import PasswordAuditor
+        >>> with XposedOrNot() as xon:
+        ...     for record in PasswordAuditor(xon).audit("wordlist.txt"):
+        ...         if record.exposed:
+        ...             print(record.line_number, record.count)
+    """
+
+    DEFAULT_CONCURRENCY = 4
+    DEFAULT_BATCH_SIZE = 1024
+
+    def __init__(
+        self,
+        client: "XposedOrNot",
+        concurrency: int = DEFAULT_CONCURRENCY,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        priority: Priority = Priority.BULK,
+    ):
+        """Initialize the auditor.
+
+        Args:
+            client: The client used for hash prefix lookups. The client's rate
+                    limiter still applies, so on the free API lookups are
+                    paced at 1 request/second regardless of concurrency.
+            concurrency: Maximum number of lookups in flight.
+            batch_size: Number of lines hashed per batch.
+            priority: Priority of the lookups under the free-API rate limit,
+                      so interactive calls on the same client go first.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self._client = client
+        self._concurrency = concurrency
+        self._batch_size = batch_size
+        self._priority = priority
+        self.stats = PasswordAuditStats()
+
+    def audit(self, path: str | os.PathLike[str]) -> Iterator[PasswordAuditRecord]:
+        """Audit every line of a password file.
+
+        Records are yielded in file order as soon as the lookups for their
+        batch have completed, so memory use does not grow with file size
+        (apart from one fingerprint per distinct password and one count per
+        distinct hash prefix).
+
+        Args:
+            path: Path to a newline-separated password file.
+
+        Yields:
+            A PasswordAuditRecord for each non-empty line.
+
+        Raises:
+            RateLimitError: If rate limit is exceeded after all retries.
+            APIError: For other API errors.
+        """
+        self.stats = PasswordAuditStats()
+
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield from self._audit_buffer(buffer)
+
+    def _audit_buffer(self, buffer: mmap.mmap) -> Iterator[PasswordAuditRecord]:
+        seen: set[int] = set()
+        counts: dict[str, int] = {}
+        pending: dict[str, Future[int]] = {}
+        # Batches waiting for their lookups; kept short so memory stays bounded
+        window: deque[list[PasswordAuditRecord]] = deque()
+
+        # Lookups run in worker threads, in a copy of the caller's context
+        # with the audit's priority applied
+        context = context_with_priority(self._priority)
+
+        executor = ThreadPoolExecutor(max_workers=self._concurrency)
+        try:
+            for batch in self._batches(iter_lines(buffer)):
+                window.append(
+                    self._submit_batch(batch, seen, counts, pending, executor, context)
+                )
+                if len(window) > 1:
+                    yield from self._drain(window.popleft(), counts, pending)
+            while window:
+                yield from self._drain(window.popleft(), counts, pending)
+        finally:
+            for future in pending.values():
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _batches(self, lines: Iterator[_Line]) -> Iterator[list[_Line]]:
+        batch: list[_Line] = []
+        for line in lines:
+            batch.append(line)
+            if len(batch) >= self._batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _submit_batch(
+        self,
+        batch: list[_Line],
+        seen: set[int],
+        counts: dict[str, int],
+        pending: dict[str, Future[int]],
+        executor: ThreadPoolExecutor,
+        context: contextvars.Context,
+    ) -> list[PasswordAuditRecord]:
+        records = []
+        digests = keccak512_digests(line for _, _, line in batch)
+
+        for (line_number, offset, _), digest in zip(batch, digests):
+            fingerprint = int.from_bytes(digest[:8], "big")
+            duplicate = fingerprint in seen
+            if not duplicate:
+                seen.add(fingerprint)
+                self.stats.unique_passwords += 1
+
+            prefix = keccak512_prefix(digest)
+            if prefix not in counts and prefix not in pending:
+                # A context can only be entered by one thread at a time
+                pending[prefix] = executor.submit(context.copy().run, self._lookup, prefix)
+                self.stats.lookups += 1
+
+            records.append(
+                PasswordAuditRecord(
+                    line_number=line_number,
+                    offset=offset,
+                    hash_prefix=prefix,
+                    count=0,
+                    duplicate=duplicate,
+                )
+            )
+
+        self.stats.lines += len(records)
+        return records
+
+    def _drain(
+        self,
+        records: list[PasswordAuditRecord],
+        counts: dict[str, int],
+        pending: dict[str, Future[int]],
+    ) -> Iterator[PasswordAuditRecord]:
+        for record in records:
+            prefix = record.hash_prefix
+            if prefix not in counts:
+                counts[prefix] = pending.pop(prefix).result()
+            record.count = counts[prefix]
+            if record.count:
+                self.stats.exposed += 1
+            yield record
+
+    def _lookup(self, prefix: str) -> int:
+        try:
+            return self._client._password.check_prefix(prefix).count
+        except NotFoundError:
+            return 0
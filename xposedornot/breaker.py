@@ -0,0 +1,224 @@
+"""Per-host circuit breaking.
+
+When a host is degraded, sending it every request anyway ties callers up
+in timeouts and retries. CircuitBreaker tracks the outcomes of recent
+requests per host and, once too many fail or are too slow, opens the
+host's circuit: requests to it fail fast with CircuitOpenError, without
+waiting for rate-limit or quota budget. After open_for seconds the
+circuit is half-open and lets a limited number of probe requests through;
+if they succeed it closes again, otherwise it re-opens.
+
+Failures are connection errors, timeouts and 5xx responses. Other
+responses (including 404 and 429) show that the host is answering.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+
+from .exceptions import CircuitOpenError
+from .models import CircuitStatus
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _Circuit:
+    def __init__(self, window: int):
+        self.state = CLOSED
+        # (failed, slow) per call, most recent last
+        self.outcomes: deque[tuple[bool, bool]] = deque(maxlen=window)
+        self.open_until = 0.0
+        self.probes = 0  # Probes in flight while half-open
+        self.probe_successes = 0
+        self.opened = 0
+
+    def rates(self) -> tuple[float, float]:
+        calls = len(self.outcomes)
+        if not calls:
+            return 0.0, 0.0
+        failed = sum(1 for f, _ in self.outcomes if f)
+        slow = sum(1 for _, s in self.outcomes if s)
+        return failed / calls, slow / calls
+
+
+class CircuitBreaker:
+    """Opens a per-host circuit when requests fail or slow down too often.
+
+    One breaker can be shared by several clients, which then share the
+    view of each host's health.
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_rate=0.5, slow_call_duration=5.0)
+        >>> xon = XposedOrNot(circuit_breaker=breaker)
+        >>> try:
+        ...     xon.check_password("hunter2")
+        ... except CircuitOpenError as e:
+        ...     print(f"{e.host} is unhealthy, retry in {e.retry_after:.0f}s")
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        slow_call_duration: float | None = None,
+        slow_call_rate: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        open_for: float = 30.0,
+        probes: int = 1,
+    ):
+        """Initialize the breaker.
+
+        Args:
+            failure_rate: Share of failed calls in the window that opens
+                          the circuit.
+            slow_call_duration: Seconds after which a call counts as slow.
+                                None disables the latency threshold.
+            slow_call_rate: Share of slow calls in the window that opens
+                            the circuit.
+            window: Number of recent calls per host the rates cover.
+            min_calls: Calls needed in the window before the rates are used.
+            open_for: Seconds an open circuit fails fast before probing.
+            probes: Probe requests let through at a time while half-open;
+                    this many must succeed for the circuit to close.
+        """
+        if not 0 < failure_rate <= 1 or not 0 < slow_call_rate <= 1:
+            raise ValueError("failure_rate and slow_call_rate must be in (0, 1]")
+        if probes < 1:
+            raise ValueError("probes must be at least 1")
+        self.failure_rate = failure_rate
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate = slow_call_rate
+        self.min_calls = min_calls
+        self.open_for = open_for
+        self.probes = probes
+        self._window = window
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _after_fork(self) -> None:
+        """Reset the lock, which may have been held by another thread at fork."""
+        self._lock = threading.Lock()
+
+    def _circuit(self, host: str) -> _Circuit:
+        circuit = self._circuits.get(host)
+        if circuit is None:
+            circuit = self._circuits[host] = _Circuit(self._window)
+        return circuit
+
+    def check(self, host: str) -> None:
+        """Fail fast if the host's circuit is open, without taking a probe slot.
+
+        Raises:
+            CircuitOpenError: If the circuit is open.
+        """
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is not None and circuit.state == OPEN:
+                wait = circuit.open_until - time.monotonic()
+                if wait > 0:
+                    raise CircuitOpenError(host, retry_after=wait)
+
+    def acquire(self, host: str) -> bool:
+        """Admit a request to a host.
+
+        Returns:
+            Whether the request is a probe (the circuit is half-open).
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with
+                every probe slot taken.
+        """
+        with self._lock:
+            circuit = self._circuit(host)
+            if circuit.state == OPEN:
+                wait = circuit.open_until - time.monotonic()
+                if wait > 0:
+                    raise CircuitOpenError(host, retry_after=wait)
+                circuit.state = HALF_OPEN
+                circuit.probes = 0
+                circuit.probe_successes = 0
+            if circuit.state == HALF_OPEN:
+                if circuit.probes >= self.probes:
+                    raise CircuitOpenError(host)
+                circuit.probes += 1
+                return True
+            return False
+
+    def record(self, host: str, probe: bool, failed: bool | None, duration: float) -> None:
+        """Record the outcome of a request admitted by acquire().
+
+        Args:
+            host: The host.
+            probe: What acquire() returned.
+            failed: Whether the host failed the request. None if the
+                    request was abandoned before the host could answer
+                    (e.g. the caller's deadline passed); it is not counted.
+            duration: Seconds the request took.
+        """
+        slow = self.slow_call_duration is not None and duration >= self.slow_call_duration
+        with self._lock:
+            circuit = self._circuit(host)
+            if probe:
+                if circuit.state != HALF_OPEN:
+                    return
+                circuit.probes -= 1
+                if failed is None:
+                    return
+                if failed or slow:
+                    self._open(circuit)
+                    return
+                circuit.probe_successes += 1
+                if circuit.probe_successes >= self.probes:
+                    circuit.state = CLOSED
+                    circuit.outcomes.clear()
+                return
+
+            if failed is None or circuit.state != CLOSED:
+                return
+            circuit.outcomes.append((failed, slow))
+            if len(circuit.outcomes) >= self.min_calls:
+                failure_rate, slow_rate = circuit.rates()
+                if failure_rate >= self.failure_rate or (
+                    self.slow_call_duration is not None and slow_rate >= self.slow_call_rate
+                ):
+                    self._open(circuit)
+
+    def _open(self, circuit: _Circuit) -> None:
+        circuit.state = OPEN
+        circuit.open_until = time.monotonic() + self.open_for
+        circuit.opened += 1
+        circuit.outcomes.clear()
+
+    def reset(self, host: str | None = None) -> None:
+        """Close the circuit of a host (or of every host) and forget its history."""
+        with self._lock:
+            if host is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(host, None)
+
+    def status(self) -> list[CircuitStatus]:
+        """Report the state of every host's circuit."""
+        with self._lock:
+            now = time.monotonic()
+            result = []
+            for host, circuit in self._circuits.items():
+                failure_rate, slow_rate = circuit.rates()
+                result.append(
+                    CircuitStatus(
+                        host=host,
+                        state=circuit.state,
+                        calls=len(circuit.outcomes),
+                        failure_rate=failure_rate,
+                        slow_rate=slow_rate,
+                        opened=circuit.opened,
+                        retry_after=(
+                            max(circuit.open_until - now, 0.0) if circuit.state == OPEN else 0.0
+                        ),
+                    )
+                )
+            return result
@@ -0,0 +1,173 @@
+"""Response caches for the XposedOrNot API client.
+
+ResponseCache keeps recent responses in process memory. SharedResponseCache
+stores them in a SQLite database so that all processes on a host reuse the
+same entries. Both cache "not found" (404) answers as well as successful
+responses, since most addresses in a bulk scan are not in any breach.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Tuple
+
+from .utils import connect_sqlite
+
+# (status_code, json_body)
+CachedResponse = Tuple[int, Any]
+
+
+class ResponseCache:
+    """An in-process LRU cache of API responses with a time-to-live."""
+
+    DEFAULT_TTL = 3600.0
+    DEFAULT_MAX_ENTRIES = 10_000
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid.
+            max_entries: Maximum number of entries kept; least recently used
+                         entries are evicted first.
+        """
+        self.ttl = ttl
+        self._max_entries = max_entries
+        # key -> (expires, stored_at, response)
+        self._entries: OrderedDict[str, tuple[float, float, CachedResponse]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the cached (status_code, body) for key, if still valid."""
+        entry = self.lookup(key)
+        return entry[1] if entry is not None else None
+
+    def lookup(self, key: str) -> tuple[float, CachedResponse] | None:
+        """Return when the response for key was stored (Unix time) and the response.
+
+        Returns:
+            (stored_at, (status_code, body)), or None if there is no valid entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, stored_at, value = entry
+            if expires <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return stored_at, value
+
+    def set(self, key: str, status_code: int, body: Any) -> None:
+        """Store a response under key."""
+        with self._lock:
+            now = time.time()
+            self._entries[key] = (now + self.ttl, now, (status_code, body))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def _after_fork(self) -> None:
+        """Reset state that must not be shared with a forked child."""
+        self._lock = threading.Lock()
+
+
+class SharedResponseCache(ResponseCache):
+    """A response cache shared by all processes through a SQLite file.
+
+    Entries are keyed by a digest of the request and the client's API keys,
+    so the file does not contain the addresses or password hash prefixes
+    looked up. Response bodies (e.g. the breaches found for an address)
+    are stored as they are: keep the file readable by trusted users only.
+
+    Example:
+        >>> from xposedornot import SharedResponseCache, XposedOrNot
+        >>> xon = XposedOrNot(cache=SharedResponseCache("/tmp/xon.sqlite", ttl=86400))
+    """
+
+    PURGE_EVERY = 1000  # Expired rows are purged after this many writes
+
+    def __init__(self, path: str | os.PathLike[str], ttl: float = ResponseCache.DEFAULT_TTL):
+        """Initialize the shared cache.
+
+        Args:
+            path: Path of the SQLite database shared by all processes. It can
+                  be the same file as a SharedRateLimiter.
+            ttl: Seconds an entry stays valid.
+        """
+        super().__init__(ttl=ttl)
+        self._path = os.fspath(path)
+        self._conn: sqlite3.Connection | None = None
+        self._pid = os.getpid()
+        self._writes = 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        del state["_lock"]
+        del state["_entries"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._conn = connect_sqlite(self._path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, expires REAL NOT NULL, stored REAL NOT NULL, "
+                "status INTEGER NOT NULL, body TEXT)"
+            )
+        return self._conn
+
+    def lookup(self, key: str) -> tuple[float, CachedResponse] | None:
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT stored, status, body FROM responses WHERE key = ? AND expires > ?",
+                    (key, time.time()),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        stored, status, body = row
+        return stored, (status, json.loads(body))
+
+    def set(self, key: str, status_code: int, body: Any) -> None:
+        payload = json.dumps(body, separators=(",", ":"))
+        with self._lock:
+            conn = self._connection()
+            now = time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, expires, stored, status, body) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, now + self.ttl, now, status_code, payload),
+            )
+            self._writes += 1
+            if self._writes % self.PURGE_EVERY == 0:
+                conn.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection().execute("DELETE FROM responses")
+
+    def _after_fork(self) -> None:
+        super()._after_fork()
+        self._conn = None
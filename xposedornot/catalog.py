@@ -0,0 +1,203 @@
+"""Local copy of the breach catalog with lookup indexes.
+
+The full catalog returned by get_breaches() is small enough to keep in
+memory, and answering lookups from it avoids one API request per query.
+BreachCatalog indexes the breaches by ID and by domain; domains and
+breach IDs are matched case-insensitively. A time index sorted by breach
+date, built on first use, answers date-range queries by binary search,
+and a full-text index (see xposedornot.search) answers keyword queries.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from datetime import date, datetime, timezone
+from typing import Any, Iterable, Iterator, Sequence, Union
+
+from . import export
+from .models import Breach
+from .search import BreachTextIndex
+from .utils import parse_date
+
+# A point in time: datetime (naive means UTC), date, Unix time or ISO string
+When = Union[datetime, date, float, str]
+
+
+def normalize_domain(domain: str) -> str:
+    """Normalize a domain name for index lookups."""
+    return domain.strip().rstrip(".").casefold()
+
+
+def _timestamp(when: When) -> float:
+    if isinstance(when, (int, float)):
+        return float(when)
+    if isinstance(when, str):
+        parsed = parse_date(when)
+        if parsed is None:
+            raise ValueError(f"Invalid date: {when!r}")
+        return parsed.timestamp()
+    if not isinstance(when, datetime):
+        when = datetime(when.year, when.month, when.day)
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.timestamp()
+
+
+class BreachCatalog:
+    """An immutable snapshot of the breach catalog.
+
+    Example:
+        >>> from xposedornot import XposedOrNot
+        >>> catalog = XposedOrNot().get_breach_catalog()
+        >>> [b.breach_id for b in catalog.by_domain("adobe.com")]
+        ['adobe']
+    """
+
+    def __init__(
+        self,
+        breaches: Iterable[Breach],
+        fetched_at: float | None = None,
+        previous: BreachCatalog | None = None,
+    ):
+        """Initialize the catalog and build its indexes.
+
+        Args:
+            breaches: Every breach in the catalog.
+            fetched_at: Unix time the breaches were fetched. Defaults to now.
+            previous: The catalog this one replaces. If its text index was
+                      built, the index is taken over and updated for the
+                      changed breaches only (previous rebuilds its own if
+                      searched again).
+        """
+        self._breaches = list(breaches)
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+
+        self._by_id: dict[str, Breach] = {}
+        self._by_domain: dict[str, list[Breach]] = {}
+        for breach in self._breaches:
+            self._by_id[breach.breach_id.casefold()] = breach
+            if breach.domain:
+                self._by_domain.setdefault(normalize_domain(breach.domain), []).append(breach)
+
+        # Built on first use
+        self._times: list[float] | None = None
+        self._by_time: list[Breach] = []
+        self._first_by_domain: dict[str, Breach] | None = None
+        self._text_index: BreachTextIndex | None = None
+        self._text_lock = threading.Lock()
+
+        if previous is not None:
+            with previous._text_lock:
+                index, previous._text_index = previous._text_index, None
+            if index is not None:
+                index.update(self._breaches)
+                self._text_index = index
+
+    def __len__(self) -> int:
+        return len(self._breaches)
+
+    def __iter__(self) -> Iterator[Breach]:
+        return iter(self._breaches)
+
+    def __contains__(self, breach_id: object) -> bool:
+        return isinstance(breach_id, str) and breach_id.casefold() in self._by_id
+
+    @property
+    def breaches(self) -> list[Breach]:
+        """All breaches, in the order the API returned them."""
+        return list(self._breaches)
+
+    def to_columns(self, fields: Sequence[str] | None = None) -> dict[str, list[Any]]:
+        """Return the catalog as one list per Breach field (see xposedornot.export)."""
+        return export.to_columns(self.breaches, fields)
+
+    def get(self, breach_id: str) -> Breach | None:
+        """Look up a breach by its ID.
+
+        Args:
+            breach_id: The breach ID (any capitalization).
+
+        Returns:
+            The breach, or None if it is not in the catalog.
+        """
+        return self._by_id.get(breach_id.casefold())
+
+    def by_domain(self, domain: str) -> list[Breach]:
+        """Return the breaches of a domain, as get_breaches(domain=...) would."""
+        return list(self._by_domain.get(normalize_domain(domain), ()))
+
+    def age(self) -> float:
+        """Seconds since the catalog was fetched."""
+        return max(time.time() - self.fetched_at, 0.0)
+
+    def _time_index(self) -> tuple[list[float], list[Breach]]:
+        """Breach timestamps in ascending order, and the breaches in that order."""
+        if self._times is None:
+            dated = sorted(
+                ((b.breached_at.timestamp(), b) for b in self._breaches if b.breached_at),
+                key=lambda pair: pair[0],
+            )
+            self._by_time = [breach for _, breach in dated]
+            self._times = [timestamp for timestamp, _ in dated]
+        return self._times, self._by_time
+
+    def between(self, start: When | None = None, end: When | None = None) -> list[Breach]:
+        """Return breaches whose breach date lies in [start, end), oldest first.
+
+        Breaches without a (parseable) breach date are never returned.
+
+        Args:
+            start: Earliest breach date, inclusive. None means no lower bound.
+            end: Latest breach date, exclusive. None means no upper bound.
+        """
+        times, breaches = self._time_index()
+        lo = 0 if start is None else bisect_left(times, _timestamp(start))
+        hi = len(times) if end is None else bisect_left(times, _timestamp(end))
+        return breaches[lo:hi]
+
+    def since(self, start: When) -> list[Breach]:
+        """Return breaches dated start or later, oldest first."""
+        return self.between(start)
+
+    def recent(self, days: float) -> list[Breach]:
+        """Return breaches dated within the given number of days, oldest first."""
+        return self.between(time.time() - days * 86400)
+
+    def first_breach(self, domain: str) -> Breach | None:
+        """Return the earliest dated breach of a domain, if any."""
+        return self._first_index().get(normalize_domain(domain))
+
+    def first_breach_by_domain(self) -> dict[str, Breach]:
+        """Map each (normalized) domain to its earliest dated breach."""
+        return dict(self._first_index())
+
+    def _first_index(self) -> dict[str, Breach]:
+        if self._first_by_domain is None:
+            first: dict[str, Breach] = {}
+            for breach in self._time_index()[1]:
+                if breach.domain:
+                    first.setdefault(normalize_domain(breach.domain), breach)
+            self._first_by_domain = first
+        return self._first_by_domain
+
+    def search(self, query: str) -> list[Breach]:
+        """Find breaches whose description (or industry) matches a query.
+
+        The text index is built on first use.
+
+        Args:
+            query: Words and "quoted phrases", all of which must occur,
+                   e.g. 'plaintext "api key"'. Case-insensitive.
+
+        Returns:
+            Matching breaches, sorted by breach ID.
+        """
+        with self._text_lock:
+            index = self._text_index
+            if index is None:
+                index = BreachTextIndex()
+                index.update(self)
+                self._text_index = index
+        return [breach for breach in map(self.get, index.search(query)) if breach is not None]
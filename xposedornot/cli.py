@@ -0,0 +1,90 @@
+"""Command-line interface for the XposedOrNot API client.
+
+Usage:
+    xon serve [--host HOST] [--port PORT] [--socket PATH] [--api-key KEY]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from typing import Sequence
+
+from .cache import ResponseCache
+from .client import XposedOrNot
+from .daemon import DEFAULT_HOST, DEFAULT_PORT, _remove_socket, create_server
+
+
+def _serve(args: argparse.Namespace) -> int:
+    client = XposedOrNot(
+        api_key=args.api_key or os.environ.get("XON_API_KEY") or None,
+        timeout=args.timeout,
+        cache=ResponseCache(ttl=args.cache_ttl) if args.cache_ttl > 0 else None,
+    )
+    server = create_server(
+        client,
+        host=args.host,
+        port=args.port,
+        socket_path=args.socket,
+        verbose=args.verbose,
+    )
+
+    where = args.socket or f"http://{args.host}:{args.port}"
+    print(f"xon daemon listening on {where}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        client.close()
+        if args.socket:
+            _remove_socket(args.socket)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the `xon` command."""
+    parser = argparse.ArgumentParser(prog="xon", description="XposedOrNot API client")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser(
+        "serve",
+        help="Run a local daemon sharing one client, cache and rate budget",
+        description=(
+            "Run a local daemon sharing one client, cache and rate budget. "
+            "The daemon does not authenticate callers: over TCP, any local user "
+            "or process can spend the configured API key and read cached lookups. "
+            "On shared hosts use --socket, which is accessible to the current user only."
+        ),
+    )
+    serve.add_argument(
+        "--host",
+        default=DEFAULT_HOST,
+        help="Interface to listen on (unauthenticated; keep it on loopback)",
+    )
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port to listen on")
+    serve.add_argument("--socket", help="Listen on this Unix socket (mode 0600) instead of TCP")
+    serve.add_argument("--api-key", help="Plus API key (default: $XON_API_KEY)")
+    serve.add_argument("--timeout", type=float, default=None, help="Upstream timeout in seconds")
+    serve.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=ResponseCache.DEFAULT_TTL,
+        help="Seconds to cache responses (0 disables caching)",
+    )
+    serve.add_argument("--verbose", action="store_true", help="Log every request")
+    serve.set_defaults(handler=_serve)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry point for the `xon` command."""
+    args = build_parser().parse_args(argv)
+    return args.handler(args)  # type: ignore[no-any-return]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
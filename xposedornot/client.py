@@ -2,26 +2,74 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
+import hashlib
+import os
+import sys
+import threading
 import time
-from typing import Any
+import weakref
+from typing import (
+    IO,
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Callable,
+    ContextManager,
+    Iterable,
+    Iterator,
+    Mapping,
+    TypeVar,
+)
 
 import httpx
 
+from . import protocol, snapshot
+from .audit import PasswordAuditor
+from .breaker import CircuitBreaker
+from .cache import ResponseCache
+from .catalog import BreachCatalog
+from .deadline import check_deadline, remaining_time, request_deadline
 from .endpoints import BreachesEndpoint, EmailEndpoint, PasswordEndpoint
 from .exceptions import (
     APIError,
     AuthenticationError,
+    DeadlineExceeded,
     NotFoundError,
+    QuotaExceededError,
     RateLimitError,
-    ServerError,
 )
+from .hedging import HedgePolicy
+from .keypool import APIKeyPool
+from .metadata import RequestTracer, relevant_headers
 from .models import (
     Breach,
     BreachAnalyticsResponse,
+    CircuitStatus,
     EmailBreachDetailedResponse,
     EmailBreachResponse,
+    HedgeStats,
+    PasswordAuditRecord,
     PasswordCheckResponse,
+    QuotaStatus,
+    RequestTimings,
+    ResponseMeta,
 )
+from .profiling import Profiler
+from .protocol import Operation
+from .quota import QuotaTracker
+from .ratelimit import RateLimiter
+from .scheduler import Priority, RequestScheduler, current_priority, request_priority
+from .snapshot import SharedBreachCatalog
+from .streaming import DEFAULT_MAX_IN_FLIGHT, EmailResult, stream_check
+from .warmup import KeepAliveRefresher, origin, warm_up
+
+T = TypeVar("T")
+
+# Clients alive in this process, so a forked child can rebuild their pools
+_live_clients: "weakref.WeakSet[XposedOrNot]" = weakref.WeakSet()
 
 
 class XposedOrNot:
@@ -38,17 +86,28 @@ class XposedOrNot:
         >>> print(result.breaches)
     """
 
-    DEFAULT_BASE_URL = "https://api.xposedornot.com"
+    DEFAULT_BASE_URL = protocol.DEFAULT_BASE_URL
     DEFAULT_TIMEOUT = 30.0
     RATE_LIMIT_DELAY = 1.0  # 1 request per second for free API
     MAX_RETRIES = 3  # Max retries on 429
     RETRY_BASE_DELAY = 1.0  # Base delay for exponential backoff
+    KEEPALIVE_EXPIRY = 30.0  # Seconds an idle pooled connection is kept
 
     def __init__(
         self,
         api_key: str | None = None,
         base_url: str | None = None,
-        timeout: float | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        key_pool: APIKeyPool | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        quota: QuotaTracker | None = None,
+        on_response: Callable[[ResponseMeta], None] | None = None,
+        compact_results: bool = False,
+        hedge: HedgePolicy | None = None,
+        timeouts: Mapping[str, float | httpx.Timeout] | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        profiler: Profiler | None = None,
     ):
         """Initialize the XposedOrNot client.
 
@@ -57,14 +116,70 @@ class XposedOrNot:
                      When provided, check_email() uses the Plus API with
                      detailed breach information and higher rate limits.
             base_url: Optional custom base URL for the API.
-            timeout: Request timeout in seconds. Defaults to 30.
+            timeout: Request timeout in seconds. Defaults to 30. Pass an
+                     httpx.Timeout to set the connect, read, write and pool
+                     timeouts separately.
+            key_pool: Optional pool of several Plus API keys used in rotation
+                      instead of api_key. Requests go to the key with the most
+                      remaining budget; throttled and rejected keys are rested
+                      or dropped.
+            rate_limiter: Limiter used for the free API. Defaults to an
+                          in-process RateLimiter at 1 request/second; pass a
+                          SharedRateLimiter to share the budget between
+                          processes.
+            cache: Optional response cache. Pass a SharedResponseCache to
+                   share cached responses between processes.
+            quota: Optional hourly/daily quota accounting. Requests fail fast
+                   with QuotaExceededError when the quota is used up, and
+                   BULK requests are paced across the quota window.
+            on_response: Optional hook called with a ResponseMeta after every
+                         API call (successful or not), e.g. to feed metrics.
+                         The latest one is also available as
+                         last_response_meta.
+            compact_results: With an API key, have check_email() request
+                             breach IDs only and fill in the breach details
+                             from the locally cached breach catalog. Results
+                             are the same EmailBreachDetailedResponse, with
+                             much smaller responses for large scans.
+            hedge: Optional hedging of Plus API requests: if no response
+                   arrives within the policy's delay (a high percentile of
+                   recent response times), an identical request is sent
+                   and the first answer is used. Hedges count against the
+                   key pool and quota; BULK requests are never hedged.
+            timeouts: Optional per-host timeouts overriding timeout, keyed by
+                      host name or base URL, e.g.
+                      {"passwords.xposedornot.com": httpx.Timeout(5, connect=1)}.
+            circuit_breaker: Optional per-host circuit breaker. While a host
+                             keeps failing or responding slowly, calls to it
+                             fail fast with CircuitOpenError instead of
+                             waiting on timeouts and retries.
+            profiler: Optional profiler recording a per-endpoint breakdown
+                      of where the time of each call goes. See also
+                      profile().
         """
         self._api_key = api_key
+        self._key_pool = key_pool
         self._base_url = base_url or self.DEFAULT_BASE_URL
         self._timeout = timeout or self.DEFAULT_TIMEOUT
-        self._last_request_time: float = 0
-
-        self._client = httpx.Client(timeout=self._timeout)
+        self._default_timeout = httpx.Timeout(self._timeout)
+        self._timeouts = {
+            httpx.URL(key).host if "://" in key else key.casefold(): httpx.Timeout(value)
+            for key, value in (timeouts or {}).items()
+        }
+        self._rate_limiter = rate_limiter or RateLimiter(self.RATE_LIMIT_DELAY)
+        self._scheduler = RequestScheduler(self._rate_limiter)
+        self._cache = cache
+        self._quota = quota
+        self._on_response = on_response
+        self._compact_results = compact_results
+        self._hedge = hedge
+        self._breaker = circuit_breaker
+        self._profiler = profiler
+        self._local = threading.local()
+        self._keepalive: KeepAliveRefresher | None = None
+
+        self._client = self._build_http_client()
+        _live_clients.add(self)
 
         # Initialize endpoint handlers
         self._email = EmailEndpoint(self)
@@ -79,21 +194,229 @@ class XposedOrNot:
 
     def close(self) -> None:
         """Close the HTTP client."""
+        if self._keepalive is not None:
+            self._keepalive.stop()
+            self._keepalive = None
         self._client.close()
-
-    def _wait_for_rate_limit(self) -> None:
+        if self._quota is not None:
+            self._quota.save()
+        _live_clients.discard(self)
+
+    def _build_http_client(self) -> httpx.Client:
+        return httpx.Client(
+            timeout=self._timeout, limits=httpx.Limits(keepalive_expiry=self.KEEPALIVE_EXPIRY)
+        )
+
+    def _after_fork(self) -> None:
+        """Give a forked child its own connection pool and locks.
+
+        Pooled connections (and their TLS state) inherited from the parent
+        must not be used by the child, so they are dropped without being
+        closed and a fresh pool is built. A keep-alive refresher does not
+        survive the fork; call warmup() again in the child.
+        """
+        self._client = self._build_http_client()
+        self._keepalive = None
+        self._scheduler._after_fork()
+        self._breaches._after_fork()
+        if self._key_pool is not None:
+            self._key_pool._after_fork()
+        if self._cache is not None:
+            self._cache._after_fork()
+        if self._quota is not None:
+            self._quota._after_fork()
+        if self._hedge is not None:
+            self._hedge._after_fork()
+        if self._breaker is not None:
+            self._breaker._after_fork()
+        if self._profiler is not None:
+            self._profiler._after_fork()
+
+    @property
+    def _uses_api_key(self) -> bool:
+        """Whether requests are authenticated (single key or key pool)."""
+        return bool(self._api_key or self._key_pool)
+
+    def _wait_for_rate_limit(self, timeout: float | None = None) -> float:
         """Wait if necessary to respect API rate limits.
 
         Rate limiting is only applied for free API (no API key).
         Plus API users have tier-based limits handled by the server.
+
+        Safe to call from several threads (and, with a SharedRateLimiter,
+        from several processes). Waiting requests are served in priority
+        order; see priority().
+
+        Args:
+            timeout: Maximum seconds to wait. None waits as long as needed.
+
+        Returns:
+            Number of seconds spent waiting.
+
+        Raises:
+            TimeoutError: If no slot can be had within timeout.
         """
         # Skip rate limiting for Plus API users - they have their own tier-based limits
-        if self._api_key:
-            return
+        if self._uses_api_key:
+            return 0.0
+
+        return self._scheduler.acquire(timeout=timeout)
+
+    def _wait_for_slot(self) -> float:
+        """Wait for the rate limiter within the current deadline (see _wait_for_rate_limit)."""
+        try:
+            return self._wait_for_rate_limit(check_deadline(what="a request"))
+        except TimeoutError as e:
+            raise DeadlineExceeded("Deadline exceeded waiting for the rate limiter") from e
+
+    def _mark_request_done(self) -> None:
+        """Record the completion time of a request for rate limiting."""
+        if not self._uses_api_key:
+            self._scheduler.release()
+
+    def warmup(
+        self, connections: int = 1, keepalive: float | None = None
+    ) -> dict[str, list[RequestTimings]]:
+        """Open pooled connections to the API hosts ahead of the first call.
+
+        DNS, TCP and TLS setup then happen here rather than in the first
+        check_email() or check_password(). The hosts are the configured
+        base URL, the password API and, with an API key, the Plus API. The
+        warm-up requests do not count against the rate limit or quota.
+
+        Example:
+            >>> xon = XposedOrNot(api_key="...")
+            >>> xon.warmup(keepalive=20)  # at startup, before serving traffic
+
+        Args:
+            connections: Connections to open per host, e.g. the number of
+                         threads that will make calls concurrently.
+            keepalive: If given, re-warm the connections every keepalive
+                       seconds in a background thread (replacing any
+                       running one) until close(). Keep it below
+                       KEEPALIVE_EXPIRY.
+
+        Returns:
+            Mapping of host root to the timings of its warm-up requests.
+
+        Raises:
+            APIError: If a host cannot be reached.
+        """
+        timings = warm_up(self, self._warmup_origins(), connections)
+        if keepalive is not None:
+            if self._keepalive is not None:
+                self._keepalive.stop()
+            self._keepalive = KeepAliveRefresher(self, keepalive, connections)
+        return timings
+
+    def _warmup_origins(self) -> list[str]:
+        """Roots of the hosts this client sends requests to."""
+        bases = [self._base_url, protocol.PASSWORD_API_BASE]
+        if self._uses_api_key:
+            bases.append(protocol.PLUS_API_BASE)
+        return list(dict.fromkeys(map(origin, bases)))
+
+    async def awarmup(
+        self, connections: int = 1, keepalive: float | None = None
+    ) -> dict[str, list[RequestTimings]]:
+        """Async version of warmup(), run in the event loop's executor."""
+        loop = asyncio.get_running_loop()
+        call = functools.partial(self.warmup, connections, keepalive)
+        return await loop.run_in_executor(None, call)
+
+    def remaining_quota(self) -> QuotaStatus | None:
+        """Report the remaining hourly and daily request budget.
+
+        Returns:
+            QuotaStatus, or None if the client was created without a quota.
+        """
+        return self._quota.status() if self._quota is not None else None
+
+    def deadline(self, seconds: float | None) -> ContextManager[None]:
+        """Complete the enclosed calls within the given number of seconds.
+
+        The deadline covers rate-limiter and quota waits, every attempt and
+        the backoff between retries. Calls fail fast with DeadlineExceeded
+        as soon as the remaining time cannot cover the next wait or
+        attempt, and each attempt's timeouts are capped at the remaining
+        time. Deadlines nest; an inner one can only shorten an outer one.
+
+        Example:
+            >>> with xon.deadline(10):  # the whole batch
+            ...     for email in batch:
+            ...         xon.check_email(email, deadline=2)  # each call
+
+        Args:
+            seconds: Time budget. None leaves the current deadline in place.
+        """
+        return request_deadline(seconds)
 
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.RATE_LIMIT_DELAY:
-            time.sleep(self.RATE_LIMIT_DELAY - elapsed)
+    def hedge_stats(self) -> HedgeStats | None:
+        """Report how many requests were hedged and how often the hedge won.
+
+        Returns:
+            HedgeStats, or None if the client was created without hedging.
+        """
+        return self._hedge.stats() if self._hedge is not None else None
+
+    def circuit_status(self) -> list[CircuitStatus] | None:
+        """Report the state of each host's circuit.
+
+        Returns:
+            A CircuitStatus per host contacted so far, or None if the client
+            was created without a circuit breaker.
+        """
+        return self._breaker.status() if self._breaker is not None else None
+
+    @contextlib.contextmanager
+    def profile(
+        self, trace_allocations: bool = False, file: IO[str] | None = sys.stderr
+    ) -> Iterator[Profiler]:
+        """Profile the calls made in the enclosed block, from any thread.
+
+        Each endpoint's time is broken down into rate-limit, quota and
+        backoff waits, HTTP attempts, JSON decoding and model building,
+        and a summary table is printed when the block ends.
+
+        Example:
+            >>> with xon.profile(trace_allocations=True) as profiler:
+            ...     for email in batch:
+            ...         xon.check_email(email)
+            >>> profiler.report()  # also available afterwards
+
+        Args:
+            trace_allocations: Also record the memory allocated per
+                               endpoint, using tracemalloc.
+            file: Where to print the summary; None to not print it.
+
+        Yields:
+            The Profiler collecting the breakdown.
+        """
+        previous = self._profiler
+        profiler = self._profiler = Profiler(trace_allocations=trace_allocations)
+        try:
+            with profiler:
+                yield profiler
+        finally:
+            self._profiler = previous
+            if file is not None:
+                profiler.print_summary(file)
+
+    def priority(self, priority: Priority) -> ContextManager[None]:
+        """Run the enclosed calls at the given priority.
+
+        Under the free-API rate limit, INTERACTIVE calls take the next free
+        slot ahead of queued NORMAL and BULK calls, and BULK calls only get
+        a small share while others are waiting.
+
+        Example:
+            >>> with xon.priority(Priority.INTERACTIVE):
+            ...     xon.check_email("signup@example.com")
+
+        Args:
+            priority: Priority class for requests made in this context.
+        """
+        return request_priority(priority)
 
     def _request(
         self,
@@ -101,79 +424,343 @@ class XposedOrNot:
         path: str,
         params: dict[str, Any] | None = None,
         base_url: str | None = None,
+        headers: dict[str, str] | None = None,
+        refresh: bool = False,
     ) -> dict[str, Any]:
         """Make an HTTP request to the API.
 
         Automatically retries with exponential backoff on 429 (rate limit) errors.
+        When a cache is configured, GET responses (including 404s) are served
+        from it without touching the network or the rate limiter.
 
         Args:
             method: HTTP method (GET, POST, etc.).
             path: API endpoint path.
             params: Optional query parameters.
             base_url: Optional override for base URL.
+            headers: Optional extra request headers, e.g. conditional
+                     request validators. Requests with extra headers are
+                     never answered from the cache.
+            refresh: Fetch a new response even if one is cached (it still
+                     replaces the cached one).
 
         Returns:
-            JSON response as a dictionary.
+            JSON response as a dictionary; empty for a 304 (Not Modified)
+            response, which last_response_meta reports.
 
         Raises:
             NotFoundError: If resource is not found.
             RateLimitError: If rate limit is exceeded after all retries.
+            QuotaExceededError: If the configured quota is used up.
+            CircuitOpenError: If the host's circuit is open.
             AuthenticationError: If authentication fails.
             ServerError: If server returns 5xx error.
             APIError: For other API errors.
         """
-        self._wait_for_rate_limit()
-
         url = f"{base_url or self._base_url}{path}"
-        headers = {}
-
-        if self._api_key:
-            headers["x-api-key"] = self._api_key
-
-        last_exception: RateLimitError | None = None
-
-        for attempt in range(self.MAX_RETRIES + 1):
-            try:
-                response = self._client.request(method, url, params=params, headers=headers)
-                self._last_request_time = time.time()
-
-                if response.status_code == 404:
+        meta = ResponseMeta(method=method, url=url)
+        try:
+            return self._send(method, url, params, meta, headers, refresh)
+        finally:
+            self._local.response_meta = meta
+            if self._on_response is not None:
+                self._on_response(meta)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        meta: ResponseMeta,
+        headers: dict[str, str] | None = None,
+        refresh: bool = False,
+    ) -> dict[str, Any]:
+        """Send a request with caching, rate limiting and retries, filling in meta."""
+        cache = self._cache
+        cache_key = self._cache_key(method, url, params) if cache is not None else None
+        if cache is not None and cache_key is not None and not headers and not refresh:
+            cached = cache.lookup(cache_key)
+            if cached is not None:
+                meta.cached_at, (status_code, body) = cached
+                meta.from_cache = True
+                meta.status_code = status_code
+                if status_code == 404:
                     raise NotFoundError("Resource not found")
+                return body  # type: ignore[no-any-return]
 
-                if response.status_code == 429:
-                    last_exception = RateLimitError()
-                    if attempt < self.MAX_RETRIES:
-                        # Exponential backoff: 1s, 2s, 4s
-                        delay = self.RETRY_BASE_DELAY * (2 ** attempt)
-                        time.sleep(delay)
-                        continue
-                    raise last_exception
+        breaker = self._breaker
+        host = httpx.URL(url).host
+        if breaker is not None:
+            # Fail fast before spending rate-limit budget on an unhealthy host
+            breaker.check(host)
 
-                if response.status_code == 401:
-                    raise AuthenticationError()
+        meta.rate_limit_wait = self._wait_for_slot()
 
-                if response.status_code >= 500:
-                    raise ServerError(
-                        f"Server error: {response.status_code}",
-                        status_code=response.status_code,
-                    )
+        attempt = 0
+        rotations = 0
 
-                if response.status_code >= 400:
-                    raise APIError(f"API error: {response.text}", status_code=response.status_code)
+        while True:
+            probe = breaker.acquire(host) if breaker is not None else False
+            reserved = False
+            try:
+                if self._quota is not None:
+                    meta.quota_wait += self._quota.acquire(timeout=check_deadline(what="a request"))
+                    reserved = True
+                api_key = (
+                    self._key_pool.acquire(timeout=check_deadline(what="a request"))
+                    if self._key_pool
+                    else self._api_key
+                )
+            except BaseException as e:
+                if breaker is not None:
+                    breaker.record(host, probe, None, 0.0)
+                if reserved and self._quota is not None:
+                    self._quota.release()
+                if isinstance(e, TimeoutError):
+                    raise DeadlineExceeded("Deadline exceeded waiting for request budget") from e
+                raise
+            request_headers = {**(headers or {}), **protocol.auth_headers(api_key)}
+
+            tracer = RequestTracer()
+            meta.attempts += 1
+            failed: bool | None = None
+            sent = time.perf_counter()
+            try:
+                if self._hedge is not None and self._is_hedgeable(method, url):
+                    response, tracer = self._hedged_attempt(
+                        self._hedge, method, url, params, headers, request_headers, meta
+                    )
+                else:
+                    response = self._attempt(method, url, params, request_headers, tracer)
+                failed = response.status_code >= 500
+            except APIError as e:
+                # Connection errors and timeouts count against the host, the caller's deadline not
+                failed = not isinstance(e, DeadlineExceeded)
+                raise
+            finally:
+                meta.network += time.perf_counter() - sent
+                meta.timings = tracer.timings()
+                if breaker is not None:
+                    breaker.record(host, probe, failed, meta.timings.total)
+            self._mark_request_done()
+
+            meta.status_code = response.status_code
+            meta.headers = relevant_headers(response.headers)
+
+            error = protocol.error_for_status(response.status_code, response.text)
+
+            if isinstance(error, NotFoundError):
+                if cache is not None and cache_key is not None:
+                    cache.set(cache_key, 404, None)
+                raise error
+
+            if isinstance(error, RateLimitError):
+                if self._key_pool and api_key:
+                    self._key_pool.report(api_key, 429, _retry_after(response))
+                    # Another pooled key may still have budget - switch instead of backing off
+                    if rotations < len(self._key_pool) and self._key_pool.has_available():
+                        rotations += 1
+                        continue
+                if attempt < self.MAX_RETRIES:
+                    # Exponential backoff: 1s, 2s, 4s
+                    delay = self.RETRY_BASE_DELAY * (2 ** attempt)
+                    # Give up now if the deadline cannot cover the sleep and another attempt
+                    check_deadline(delay + meta.timings.total, "another attempt")
+                    time.sleep(delay)
+                    meta.backoff += delay
+                    attempt += 1
+                    # Queue again, so the retry keeps to the schedule behind higher-priority work
+                    meta.rate_limit_wait += self._wait_for_slot()
+                    continue
+                raise error
+
+            if isinstance(error, AuthenticationError):
+                if self._key_pool and api_key:
+                    # Take the key out of rotation; acquire() raises once none are left
+                    self._key_pool.report(api_key, 401)
+                    continue
+                raise error
+
+            if error is not None:
+                raise error
+
+            if response.status_code == protocol.NOT_MODIFIED:
+                return {}
+
+            decode_start = time.perf_counter()
+            data = response.json()
+            meta.decode = time.perf_counter() - decode_start
+            if cache is not None and cache_key is not None:
+                cache.set(cache_key, response.status_code, data)
+            return data  # type: ignore[no-any-return]
+
+    def _attempt(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str],
+        tracer: RequestTracer,
+    ) -> httpx.Response:
+        """Send one HTTP request, within the host's timeouts and the current deadline."""
+        timeout = self._timeouts.get(httpx.URL(url).host, self._default_timeout)
+        remaining = check_deadline(what="a request")
+        if remaining is not None:
+            timeout = _cap_timeout(timeout, remaining)
+        try:
+            return self._client.request(
+                method,
+                url,
+                params=params,
+                headers=headers,
+                timeout=timeout,
+                extensions={"trace": tracer},
+            )
+        except httpx.RequestError as e:
+            left = remaining_time()
+            if isinstance(e, httpx.TimeoutException) and left is not None and left <= 0:
+                raise DeadlineExceeded(f"Deadline exceeded during the request: {str(e)}") from e
+            raise APIError(f"Request failed: {str(e)}") from e
+
+    def _is_hedgeable(self, method: str, url: str) -> bool:
+        """Whether a request may be hedged: a non-BULK Plus API GET."""
+        return (
+            method.upper() == "GET"
+            and url.startswith(protocol.PLUS_API_BASE)
+            and current_priority() is not Priority.BULK
+        )
+
+    def _hedged_attempt(
+        self,
+        hedge: HedgePolicy,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        request_headers: dict[str, str],
+        meta: ResponseMeta,
+    ) -> tuple[httpx.Response, RequestTracer]:
+        """Send one request, plus a hedge if it is slow; return the first answer."""
+
+        def send(request_headers: dict[str, str]) -> tuple[httpx.Response, RequestTracer]:
+            tracer = RequestTracer()
+            return self._attempt(method, url, params, request_headers, tracer), tracer
+
+        def reserve_hedge() -> Callable[[], tuple[httpx.Response, RequestTracer]] | None:
+            # Hedges are optional: skip rather than wait when there is no budget
+            if self._quota is not None:
+                try:
+                    self._quota.acquire()
+                except QuotaExceededError:
+                    return None
+            try:
+                api_key = self._key_pool.acquire(timeout=0) if self._key_pool else self._api_key
+            except (AuthenticationError, TimeoutError):
+                if self._quota is not None:
+                    self._quota.release()
+                return None
+            meta.attempts += 1
+
+            def send_hedge() -> tuple[httpx.Response, RequestTracer]:
+                response, tracer = send({**(headers or {}), **protocol.auth_headers(api_key)})
+                if self._key_pool and api_key and response.status_code == 429:
+                    self._key_pool.report(api_key, 429, _retry_after(response))
+                return response, tracer
+
+            return send_hedge
+
+        (response, tracer), meta.hedged = hedge.run(
+            functools.partial(send, request_headers),
+            reserve_hedge,
+            lambda result: _is_answer(result[0]),
+        )
+        return response, tracer
+
+    def _execute(
+        self,
+        operation: Operation[T],
+        refresh: bool = False,
+        headers: dict[str, str] | None = None,
+    ) -> T:
+        """Run a protocol operation through _request and parse the result.
 
-                return response.json()
+        Args:
+            operation: The operation.
+            refresh: Bypass cached responses (see _request).
+            headers: Extra request headers, e.g. conditional request validators.
+        """
+        request = functools.partial(
+            self._request,
+            operation.method,
+            operation.path,
+            params=operation.params,
+            base_url=operation.base_url,
+            headers=headers,
+            refresh=refresh,
+        )
+        profiler = self._profiler
+        if profiler is None:
+            return operation.parse(request())
+
+        sample = profiler._begin(operation.endpoint)
+        try:
+            data = request()
+            parse_start = time.perf_counter()
+            result = operation.parse(data)
+            sample.parse = time.perf_counter() - parse_start
+            return result
+        except BaseException:
+            sample.failed = True
+            raise
+        finally:
+            profiler._finish(sample, self.last_response_meta)
+
+    def _cache_key(self, method: str, url: str, params: dict[str, Any] | None) -> str | None:
+        """Build a cache key for a request, or None if it must not be cached.
+
+        The key is a digest of the request and of the API keys it is sent
+        with, so cached entries do not hold the addresses or hash
+        prefixes looked up in plaintext, and responses fetched with one key are never
+        served to a client using another (or none).
+        """
+        if method.upper() != "GET":
+            return None
+        query = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        secret = self._key_pool._secret() if self._key_pool else self._api_key or ""
+        digest = hashlib.blake2b(f"{url}?{query}".encode(), digest_size=20)
+        digest.update(b"\0" + secret.encode())
+        return digest.hexdigest()
 
-            except httpx.RequestError as e:
-                raise APIError(f"Request failed: {str(e)}")
+    def _is_cached(self, operation: Operation[Any], max_age: float | None = None) -> bool:
+        """Whether a successful response to operation is in the response cache.
 
-        # Should not reach here, but just in case
-        if last_exception:
-            raise last_exception
-        raise APIError("Request failed after retries")
+        Args:
+            operation: The operation.
+            max_age: Only count a response stored at most this many seconds ago.
+        """
+        if self._cache is None:
+            return False
+        key = self._cache_key(operation.method, operation.url(self._base_url), operation.params)
+        entry = self._cache.lookup(key) if key is not None else None
+        if entry is None:
+            return False
+        stored_at, (status_code, _) = entry
+        return status_code == 200 and (max_age is None or time.time() - stored_at < max_age)
+
+    @property
+    def last_response_meta(self) -> ResponseMeta | None:
+        """Metadata of the most recent API call made from the current thread.
+
+        Includes the timing breakdown, retry count, time spent waiting on
+        the rate limiter, quota and backoff, and rate-limit/caching headers.
+        """
+        return getattr(self._local, "response_meta", None)
 
     # Convenience methods that delegate to endpoint handlers
 
-    def check_email(self, email: str) -> EmailBreachResponse | EmailBreachDetailedResponse:
+    def check_email(
+        self, email: str, deadline: float | None = None
+    ) -> EmailBreachResponse | EmailBreachDetailedResponse:
         """Check if an email has been exposed in data breaches.
 
         When an API key is configured, uses the Plus API (plus-api.xposedornot.com)
@@ -182,36 +769,135 @@ class XposedOrNot:
 
         Args:
             email: The email address to check.
+            deadline: Optional time budget in seconds for this call,
+                      including waits and retries (see deadline()).
 
         Returns:
             EmailBreachDetailedResponse if API key is set (Plus API),
             EmailBreachResponse if no API key (free API).
         """
-        return self._email.check(email)
+        with request_deadline(deadline):
+            return self._email.check(email)
 
-    def breach_analytics(self, email: str) -> BreachAnalyticsResponse:
+    def breach_analytics(
+        self, email: str, deadline: float | None = None
+    ) -> BreachAnalyticsResponse:
         """Get detailed breach analytics for an email.
 
         Args:
             email: The email address to analyze.
+            deadline: Optional time budget in seconds for this call,
+                      including waits and retries (see deadline()).
 
         Returns:
             BreachAnalyticsResponse with detailed breach information.
         """
-        return self._email.analytics(email)
+        with request_deadline(deadline):
+            return self._email.analytics(email)
 
-    def get_breaches(self, domain: str | None = None) -> list[Breach]:
+    def get_breaches(
+        self, domain: str | None = None, deadline: float | None = None
+    ) -> list[Breach]:
         """Get a list of all known data breaches.
 
         Args:
             domain: Optional domain to filter breaches by.
+            deadline: Optional time budget in seconds for this call,
+                      including waits and retries (see deadline()).
 
         Returns:
             List of Breach objects.
         """
-        return self._breaches.list(domain=domain)
+        with request_deadline(deadline):
+            return self._breaches.list(domain=domain)
+
+    def get_breach_catalog(self, max_age: float | None = None) -> BreachCatalog:
+        """Get the full breach catalog, indexed for local lookups.
+
+        The catalog is fetched once and reused until it is older than
+        max_age; get_breaches(domain=...) is answered from it while it is
+        fresh.
+
+        Args:
+            max_age: Maximum age in seconds of a previously fetched catalog.
+                     Defaults to one hour; 0 forces a refresh.
+
+        Returns:
+            BreachCatalog with every known breach.
+        """
+        return self._breaches.catalog(max_age=max_age)
+
+    def save_breach_catalog(
+        self, path: str | os.PathLike[str], max_age: float | None = None
+    ) -> None:
+        """Write the breach catalog to a binary snapshot file.
+
+        Other processes load it with load_breach_catalog() instead of
+        downloading and parsing the catalog (see xposedornot.snapshot).
+
+        Args:
+            path: Snapshot file to write (replaced atomically).
+            max_age: As for get_breach_catalog().
+        """
+        snapshot.save(self.get_breach_catalog(max_age=max_age), path)
+
+    def load_breach_catalog(self, path: str | os.PathLike[str]) -> BreachCatalog:
+        """Memory-map a snapshot written by save_breach_catalog() and use it.
+
+        The snapshot answers get_breach_catalog() and domain lookups until
+        it is older than an hour (counted from when it was fetched, not
+        loaded); then a fresh catalog is downloaded as usual.
+
+        Args:
+            path: Snapshot file.
+
+        Returns:
+            The loaded catalog.
+
+        Raises:
+            ValueError: If the file is not a catalog snapshot.
+        """
+        catalog = snapshot.load(path)
+        self._breaches.use_catalog(catalog)
+        return catalog
+
+    def share_breach_catalog(
+        self, name: str | None = None, max_age: float | None = None
+    ) -> SharedBreachCatalog:
+        """Publish the breach catalog in shared memory for worker processes.
+
+        Workers call attach_breach_catalog() with the returned catalog's
+        name (or receive the catalog itself, which pickles as its name).
+        The caller owns the segment: close() and unlink() it when done.
+
+        Args:
+            name: Segment name. Defaults to a random unique name.
+            max_age: As for get_breach_catalog().
 
-    def check_password(self, password: str) -> PasswordCheckResponse:
+        Returns:
+            The published catalog.
+        """
+        return SharedBreachCatalog.create(self.get_breach_catalog(max_age=max_age), name)
+
+    def attach_breach_catalog(self, name: str) -> SharedBreachCatalog:
+        """Attach to a catalog published by share_breach_catalog() and use it.
+
+        Like load_breach_catalog(), but without a file.
+
+        Args:
+            name: Segment name.
+
+        Returns:
+            The attached catalog.
+
+        Raises:
+            FileNotFoundError: If no segment has that name.
+        """
+        catalog = SharedBreachCatalog.attach(name)
+        self._breaches.use_catalog(catalog)
+        return catalog
+
+    def check_password(self, password: str, deadline: float | None = None) -> PasswordCheckResponse:
         """Check if a password has been exposed in data breaches.
 
         SECURITY: Your password is NEVER sent over the network.
@@ -223,8 +909,105 @@ class XposedOrNot:
 
         Args:
             password: The password to check (hashed locally, never transmitted).
+            deadline: Optional time budget in seconds for this call,
+                      including waits and retries (see deadline()).
 
         Returns:
             PasswordCheckResponse with exposure count and characteristics.
         """
-        return self._password.check(password)
+        with request_deadline(deadline):
+            return self._password.check(password)
+
+    def stream_check(
+        self,
+        source: AsyncIterable[str] | Iterable[str],
+        analytics: bool = False,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        return_exceptions: bool = False,
+        stop: asyncio.Event | None = None,
+    ) -> AsyncGenerator[tuple[str, EmailResult], None]:
+        """Check a stream of email addresses with backpressure.
+
+        Addresses are pulled from source only while fewer than max_in_flight
+        checks are running, so memory stays bounded no matter how fast the
+        source produces. Results are yielded in completion order.
+
+        Example:
+            >>> async for email, result in xon.stream_check(queue_consumer()):
+            ...     if result is not None:
+            ...         print(email, result.breaches)
+
+        Args:
+            source: Sync or async iterable of email addresses.
+            analytics: Use breach_analytics() instead of check_email().
+            max_in_flight: Maximum number of checks running at once.
+            return_exceptions: Yield per-address errors (ValidationError,
+                               RateLimitError, ...) as the result instead of
+                               raising them.
+            stop: Optional event; once set, no more addresses are pulled and
+                  the checks already in flight are drained.
+
+        Returns:
+            Async iterator of (email, result) pairs. The result is None for
+            addresses not found in any breach (NotFoundError).
+        """
+        return stream_check(
+            self,
+            source,
+            analytics=analytics,
+            max_in_flight=max_in_flight,
+            return_exceptions=return_exceptions,
+            stop=stop,
+        )
+
+    def audit_passwords(
+        self, path: str | os.PathLike[str], concurrency: int = 4
+    ) -> Iterator[PasswordAuditRecord]:
+        """Audit a newline-separated password file.
+
+        The file is memory-mapped and hashed locally; only hash prefixes are
+        sent to the API, each distinct prefix once. See xposedornot.audit.
+
+        Args:
+            path: Path to the password file.
+            concurrency: Maximum number of lookups in flight.
+
+        Returns:
+            Iterator of PasswordAuditRecord, one per non-empty line, in file order.
+        """
+        return PasswordAuditor(self, concurrency=concurrency).audit(path)
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Parse a Retry-After header given in seconds."""
+    value = response.headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+def _cap_timeout(timeout: httpx.Timeout, limit: float) -> httpx.Timeout:
+    """Cap every phase of a timeout at limit seconds."""
+    return httpx.Timeout(
+        connect=limit if timeout.connect is None else min(timeout.connect, limit),
+        read=limit if timeout.read is None else min(timeout.read, limit),
+        write=limit if timeout.write is None else min(timeout.write, limit),
+        pool=limit if timeout.pool is None else min(timeout.pool, limit),
+    )
+
+
+def _is_answer(response: httpx.Response) -> bool:
+    """Whether a response answers the request (rather than being a 429, 5xx, ...)."""
+    return response.status_code < 400 or response.status_code == 404
+
+
+def _reinit_after_fork() -> None:
+    for client in list(_live_clients):
+        client._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinit_after_fork)
@@ -0,0 +1,334 @@
+"""Local sidecar daemon sharing one client between processes.
+
+`xon serve` runs a single XposedOrNot client - with its rate limiter,
+response cache and connection pools - behind a localhost HTTP or Unix
+socket interface. DaemonClient is a drop-in XposedOrNot replacement that
+forwards API requests to the daemon, so every process on the host shares
+one warm cache and one rate budget.
+
+The daemon only forwards GET requests to the known XposedOrNot hosts; it
+is not a general-purpose proxy. Password checks are hashed by the calling
+process, so passwords never reach the daemon either.
+
+The daemon does not authenticate its callers: anyone who can connect to
+it can spend its API key and read its cache. On a shared host, listen on
+a Unix socket, which is created readable and writable by its owner only.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+import socketserver
+import stat
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import httpx
+
+from . import exceptions
+from .client import XposedOrNot
+from .endpoints import EmailEndpoint, PasswordEndpoint
+from .exceptions import APIError, XposedOrNotError
+from .models import RequestTimings, ResponseMeta
+from .scheduler import Priority, current_priority, request_priority
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+def _upstreams(client: XposedOrNot) -> dict[str, str]:
+    """Map upstream names to the base URLs the daemon may call."""
+    return {
+        "api": client._base_url,
+        "plus": EmailEndpoint.PLUS_API_BASE,
+        "passwords": PasswordEndpoint.PASSWORD_API_BASE,
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Handles requests from DaemonClient instances."""
+
+    server: "_DaemonServer"  # type: ignore[assignment]
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        if self.path != "/v1/info":
+            self._send(404, {"error": {"type": "NotFoundError", "message": "Unknown path"}})
+            return
+        self._send(200, {"authenticated": self.server.client._uses_api_key})
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        if self.path != "/v1/request":
+            self._send(404, {"error": {"type": "NotFoundError", "message": "Unknown path"}})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length))
+            base_url = _upstreams(self.server.client)[payload["upstream"]]
+            path = payload["path"]
+            if not isinstance(path, str) or not path.startswith("/"):
+                raise ValueError("path must start with '/'")
+            priority = Priority(payload.get("priority", Priority.NORMAL))
+        except (KeyError, TypeError, ValueError) as e:
+            self._send(400, {"error": {"type": "APIError", "message": f"Bad request: {e}"}})
+            return
+
+        client = self.server.client
+        try:
+            with request_priority(priority):
+                data = client._request("GET", path, params=payload.get("params"), base_url=base_url)
+        except XposedOrNotError as e:
+            status_code = getattr(e, "status_code", None) or 502
+            self._send(
+                status_code,
+                {
+                    "error": {
+                        "type": type(e).__name__,
+                        "message": str(e),
+                        "status_code": getattr(e, "status_code", None),
+                        "host": getattr(e, "host", None),
+                        "retry_after": getattr(e, "retry_after", None),
+                    },
+                    "meta": _dump_meta(client.last_response_meta),
+                },
+            )
+            return
+
+        self._send(200, {"data": data, "meta": _dump_meta(client.last_response_meta)})
+
+    def _send(self, status_code: int, body: dict[str, Any]) -> None:
+        encoded = json.dumps(body).encode("utf-8")
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class _DaemonServer:
+    client: XposedOrNot
+    verbose: bool
+
+
+class _TCPServer(_DaemonServer, ThreadingHTTPServer):
+    daemon_threads = True
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+
+    class _UnixServer(_DaemonServer, socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+
+def _remove_socket(path: str) -> None:
+    """Remove a stale Unix socket, refusing to delete anything else."""
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{path} exists and is not a socket")
+    os.unlink(path)
+
+
+def create_server(
+    client: XposedOrNot,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: str | None = None,
+    verbose: bool = False,
+) -> socketserver.BaseServer:
+    """Create a daemon server around a client.
+
+    Args:
+        client: The shared client all requests go through.
+        host: Interface to listen on (ignored when socket_path is given).
+        port: TCP port to listen on (ignored when socket_path is given).
+        socket_path: Listen on this Unix socket instead of TCP. The socket
+                     is only accessible to the current user. A stale
+                     socket at the path is replaced.
+        verbose: Log each request to stderr.
+
+    Returns:
+        The server; call serve_forever() to run it.
+
+    Raises:
+        FileExistsError: If socket_path exists and is not a socket.
+    """
+    server: _DaemonServer
+    if socket_path:
+        _remove_socket(socket_path)
+        # Bind with a restrictive umask so the socket is never world-accessible
+        umask = os.umask(0o177)
+        try:
+            server = _UnixServer(socket_path, _Handler)
+        finally:
+            os.umask(umask)
+    else:
+        server = _TCPServer((host, port), _Handler)
+    server.client = client
+    server.verbose = verbose
+    return server  # type: ignore[return-value]
+
+
+class DaemonClient(XposedOrNot):
+    """An XposedOrNot client that sends API requests through a local daemon.
+
+    All public methods behave exactly as on XposedOrNot; rate limiting,
+    caching and API keys are handled by the daemon.
+
+    Example:
+        >>> from xposedornot.daemon import DaemonClient
+        >>> xon = DaemonClient()  # daemon started with `xon serve`
+        >>> result = xon.check_email("test@example.com")
+    """
+
+    def __init__(
+        self,
+        url: str | None = None,
+        socket_path: str | None = None,
+        timeout: float | None = None,
+    ):
+        """Initialize the daemon client.
+
+        Args:
+            url: Daemon URL. Defaults to http://127.0.0.1:8765.
+            socket_path: Connect to a daemon on this Unix socket instead.
+            timeout: Request timeout in seconds. Should cover the daemon's own
+                     rate-limit waits and retries. Defaults to 30.
+        """
+        self._socket_path = socket_path
+        self._daemon_url = url or f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
+        self._authenticated: bool | None = None
+        super().__init__(timeout=timeout)
+
+    def _build_http_client(self) -> httpx.Client:
+        if self._socket_path:
+            return httpx.Client(
+                base_url="http://xon-daemon",
+                timeout=self._timeout,
+                transport=httpx.HTTPTransport(uds=self._socket_path),
+            )
+        return httpx.Client(base_url=self._daemon_url, timeout=self._timeout)
+
+    @property
+    def _uses_api_key(self) -> bool:
+        """Whether the daemon's client is authenticated (asked once, then cached)."""
+        if self._authenticated is None:
+            self._authenticated = bool(self._call("GET", "/v1/info")["authenticated"])
+        return self._authenticated
+
+    def _warmup_origins(self) -> list[str]:
+        """Only the daemon is contacted directly; it holds the upstream connections."""
+        return ["/"]
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        base_url: str | None = None,
+        headers: dict[str, str] | None = None,
+        refresh: bool = False,
+    ) -> dict[str, Any]:
+        """Forward an API request to the daemon.
+
+        Extra headers are not forwarded, so conditional requests always
+        get a full response; refresh is ignored, as the daemon's cache
+        applies.
+
+        Raises:
+            The same exceptions XposedOrNot._request raises, re-created from
+            the daemon's error response.
+        """
+        upstream = {v: k for k, v in _upstreams(self).items()}.get(base_url or self._base_url)
+        if upstream is None or method.upper() != "GET":
+            raise APIError(f"Request cannot be sent through the daemon: {method} {base_url}")
+
+        payload = {
+            "upstream": upstream,
+            "path": path,
+            "params": params,
+            "priority": int(current_priority()),
+        }
+        meta = ResponseMeta(method=method, url=f"{base_url or self._base_url}{path}")
+        try:
+            body = self._call("POST", "/v1/request", json=payload, meta=meta)
+            return body["data"]  # type: ignore[no-any-return]
+        finally:
+            self._local.response_meta = meta
+            if self._on_response is not None:
+                self._on_response(meta)
+
+    def _call(
+        self, method: str, path: str, meta: ResponseMeta | None = None, **kwargs: Any
+    ) -> dict[str, Any]:
+        """Send a request to the daemon, filling in meta from its reply if given."""
+        try:
+            response = self._client.request(method, path, **kwargs)
+        except httpx.RequestError as e:
+            raise APIError(f"Daemon request failed: {str(e)}") from e
+
+        try:
+            body = response.json()
+        except ValueError as e:
+            raise APIError(
+                f"Invalid response from the daemon (HTTP {response.status_code})",
+                status_code=response.status_code,
+            ) from e
+        if meta is not None and body.get("meta"):
+            _load_meta(meta, body["meta"])
+        if response.status_code != 200:
+            error = body.get("error", {})
+            raise _rebuild_error(error, response.status_code)
+        return body  # type: ignore[no-any-return]
+
+
+def _dump_meta(meta: ResponseMeta | None) -> dict[str, Any] | None:
+    """Serialize the metadata of the daemon's call for the reply."""
+    return dataclasses.asdict(meta) if meta is not None else None
+
+
+def _load_meta(meta: ResponseMeta, data: dict[str, Any]) -> None:
+    """Fill in meta from the daemon's metadata, keeping the caller's method and URL."""
+    for f in dataclasses.fields(ResponseMeta):
+        if f.name in data and f.name not in ("method", "url"):
+            setattr(meta, f.name, data[f.name])
+    meta.timings = RequestTimings(**(data.get("timings") or {}))
+
+
+def _rebuild_error(error: dict[str, Any], status_code: int) -> XposedOrNotError:
+    """Re-create an exception raised inside the daemon, with its fields."""
+    message = error.get("message", "Daemon error")
+    exc_type = getattr(exceptions, error.get("type", ""), None)
+
+    if exc_type in (
+        exceptions.NotFoundError,
+        exceptions.RateLimitError,
+        exceptions.AuthenticationError,
+        exceptions.ValidationError,
+        exceptions.DeadlineExceeded,
+    ):
+        return exc_type(message)  # type: ignore[no-any-return]
+    if exc_type is exceptions.QuotaExceededError:
+        return exceptions.QuotaExceededError(message, retry_after=error.get("retry_after"))
+    if exc_type is exceptions.CircuitOpenError:
+        circuit = exceptions.CircuitOpenError(
+            error.get("host") or "", retry_after=error.get("retry_after")
+        )
+        circuit.args = (message,)
+        return circuit
+    if exc_type is exceptions.ServerError:
+        return exceptions.ServerError(message, status_code=error.get("status_code") or 500)
+    return APIError(message, status_code=error.get("status_code") or status_code)
@@ -0,0 +1,200 @@
+"""Bitmask encoding of exposed data types.
+
+Every data type name ("Email addresses", "Passwords", ...) is assigned a
+bit in a process-wide registry, and breach models carry the set of types
+they expose as an integer (data_types). Filtering and aggregating large
+result sets then needs integer operations instead of string splitting:
+
+Example:
+    >>> from xposedornot import datatypes
+    >>> wanted = datatypes.mask("Passwords", "Phone numbers")
+    >>> risky = [b for b in breaches if datatypes.has_all(b.data_types, wanted)]
+
+Names are matched case-insensitively. Well-known types have fixed bits, so
+masks of those types are stable between processes; other names get the
+next free bit when first seen in an API response. Queries only look names
+up, so a name no response has used never takes a bit.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from typing import Iterable
+
+# Order defines the bit of each type - append only
+KNOWN_DATA_TYPES = (
+    "Email addresses",
+    "Passwords",
+    "Usernames",
+    "Names",
+    "Phone numbers",
+    "Physical addresses",
+    "Dates of birth",
+    "IP addresses",
+    "Genders",
+    "Geographic locations",
+    "Job titles",
+    "Employers",
+    "Social media profiles",
+    "Password hints",
+    "Security questions and answers",
+    "Credit cards",
+    "Partial credit card data",
+    "Bank account numbers",
+    "Government issued IDs",
+    "Website activity",
+    "Device information",
+    "Browser user agent details",
+    "Auth tokens",
+    "Private messages",
+    "Purchases",
+    "Spoken languages",
+    "Education levels",
+    "Income levels",
+    "Nationalities",
+    "Marital statuses",
+    "Ethnicities",
+    "Religions",
+    "Sexual orientations",
+    "Health insurance information",
+    "Vehicle details",
+    "Avatars",
+    "Salutations",
+    "Time zones",
+)
+
+_SEPARATORS = re.compile(r"[;,]")
+
+
+def split_data_types(value: str | Iterable[str] | None) -> list[str]:
+    """Split a ';'-joined data type string (lists are passed through)."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = _SEPARATORS.split(value)
+    return [name.strip() for name in value if name and name.strip()]
+
+
+class DataTypeRegistry:
+    """Assigns a bit to each data type name."""
+
+    def __init__(self, names: Iterable[str] = KNOWN_DATA_TYPES):
+        """Initialize the registry.
+
+        Args:
+            names: Names to register first, in bit order.
+        """
+        self._bits: dict[str, int] = {}
+        self._names: list[str] = []
+        self._lock = threading.Lock()
+        for name in names:
+            self.bit(name)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.lookup(name) is not None
+
+    def lookup(self, name: str) -> int | None:
+        """Return the bit index of a data type, or None if it is not registered."""
+        return self._bits.get(name.strip().casefold())
+
+    def bit(self, name: str) -> int:
+        """Return the bit index of a data type, registering it if new."""
+        key = name.strip().casefold()
+        bit = self._bits.get(key)
+        if bit is None:
+            with self._lock:
+                bit = self._bits.get(key)
+                if bit is None:
+                    bit = len(self._names)
+                    self._names.append(name.strip())
+                    self._bits[key] = bit
+        return bit
+
+    def mask(self, names: Iterable[str]) -> int:
+        """Return the bitmask of a set of data type names, registering new ones."""
+        result = 0
+        for name in names:
+            result |= 1 << self.bit(name)
+        return result
+
+    def query(self, names: Iterable[str]) -> int:
+        """Return the bitmask of the registered names among names.
+
+        Unlike mask(), names that are not registered are left out rather
+        than registered.
+        """
+        result = 0
+        for name in names:
+            bit = self.lookup(name)
+            if bit is not None:
+                result |= 1 << bit
+        return result
+
+    def names(self, mask: int) -> list[str]:
+        """Return the data type names set in a bitmask, in bit order."""
+        result = []
+        while mask:
+            low = mask & -mask
+            result.append(self._names[low.bit_length() - 1])
+            mask ^= low
+        return result
+
+    def counts(self, masks: Iterable[int]) -> dict[str, int]:
+        """Count how many masks include each data type.
+
+        Args:
+            masks: Bitmasks, e.g. the data_types of a list of breaches.
+
+        Returns:
+            Mapping of data type name to count, for types seen at least once.
+        """
+        per_bit: dict[int, int] = {}
+        for mask in masks:
+            while mask:
+                low = mask & -mask
+                per_bit[low] = per_bit.get(low, 0) + 1
+                mask ^= low
+        return {
+            self._names[low.bit_length() - 1]: count
+            for low, count in sorted(per_bit.items())
+        }
+
+
+registry = DataTypeRegistry()
+"""The process-wide registry used by the models."""
+
+
+def mask(*names: str) -> int:
+    """Return the bitmask of the given data type names.
+
+    Raises:
+        ValueError: If a name is not a registered data type.
+    """
+    for name in names:
+        if name not in registry:
+            raise ValueError(f"Unknown data type: {name!r}")
+    return registry.query(names)
+
+
+def names(data_types: int) -> list[str]:
+    """Return the data type names set in a bitmask."""
+    return registry.names(data_types)
+
+
+def has_any(data_types: int, query: int) -> bool:
+    """Whether data_types includes at least one type of query."""
+    return bool(data_types & query)
+
+
+def has_all(data_types: int, query: int) -> bool:
+    """Whether data_types includes every type of query."""
+    return data_types & query == query
+
+
+def has_none(data_types: int, query: int) -> bool:
+    """Whether data_types includes no type of query."""
+    return not data_types & query
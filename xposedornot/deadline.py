@@ -0,0 +1,67 @@
+"""Deadlines bounding the total time of API calls.
+
+A deadline covers everything a call does - rate-limiter and quota waits,
+every attempt and the backoff between them - and nests: an inner deadline
+can shorten but never extend an outer one, so one deadline can bound a
+whole batch while individual calls in it get tighter ones. Like request
+priorities, the deadline follows the current thread or asyncio task.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from .exceptions import DeadlineExceeded
+
+# time.monotonic() by which the current call must complete
+_current_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "xposedornot_deadline", default=None
+)
+
+
+def remaining_time() -> float | None:
+    """Seconds left until the current deadline (may be negative), or None."""
+    deadline = _current_deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def check_deadline(needed: float = 0.0, what: str = "the call") -> float | None:
+    """Fail fast if the current deadline cannot cover the time needed.
+
+    Args:
+        needed: Seconds the next step is expected to take.
+        what: Description of the next step for the error message.
+
+    Returns:
+        The remaining seconds, or None without a deadline.
+
+    Raises:
+        DeadlineExceeded: If the remaining time is not more than needed.
+    """
+    remaining = remaining_time()
+    if remaining is not None and remaining <= needed:
+        raise DeadlineExceeded(
+            f"Deadline exceeded: {max(remaining, 0.0):.2f}s left, not enough for {what}"
+        )
+    return remaining
+
+
+@contextmanager
+def request_deadline(seconds: float | None) -> Iterator[None]:
+    """Complete the enclosed calls within the given number of seconds.
+
+    None leaves the current deadline (if any) in place.
+    """
+    if seconds is None:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    current = _current_deadline.get()
+    token = _current_deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _current_deadline.reset(token)
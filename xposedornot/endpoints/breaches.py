@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from typing import TYPE_CHECKING
 
+from .. import protocol
+from ..catalog import BreachCatalog, normalize_domain
 from ..models import Breach
 
 if TYPE_CHECKING:
@@ -11,10 +15,27 @@ if TYPE_CHECKING:
 
 
 class BreachesEndpoint:
-    """Handles breach-related API endpoints."""
+    """Handles breach-related API endpoints.
+
+    Domain lookups are planned: a one-off get_breaches(domain=...) sends a
+    filtered request, but once more than BATCH_THRESHOLD distinct domains
+    have been queried within BATCH_WINDOW seconds, the full catalog is
+    fetched once and later domain lookups are answered from it for as long
+    as it is younger than CATALOG_TTL. A fresh catalog (already loaded, or
+    in the response cache) is always used.
+    """
+
+    CATALOG_TTL = 3600.0  # Seconds a fetched catalog answers domain lookups
+    BATCH_WINDOW = 60.0  # Seconds over which distinct domain lookups are counted
+    BATCH_THRESHOLD = 5  # Distinct domains per window before the catalog is fetched
 
     def __init__(self, client: "XposedOrNot"):
         self._client = client
+        self._catalog: BreachCatalog | None = None
+        # Normalized domain -> time it was last looked up
+        self._recent_domains: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
 
     def list(self, domain: str | None = None) -> list[Breach]:
         """Get a list of all known data breaches.
@@ -28,12 +49,88 @@ class BreachesEndpoint:
         Raises:
             RateLimitError: If rate limit is exceeded.
         """
-        params = {}
-        if domain:
-            params["domain"] = domain
+        if not domain:
+            return self._fetch_catalog().breaches
+
+        catalog = self._fresh_catalog()
+        if catalog is None and self._is_burst(domain):
+            catalog = self.catalog()
+        if catalog is not None:
+            return catalog.by_domain(domain)
+        return self._client._execute(protocol.list_breaches(domain=domain))
+
+    def catalog(self, max_age: float | None = None) -> BreachCatalog:
+        """Return the breach catalog, fetching it if missing or stale.
+
+        Concurrent callers share a single fetch.
+
+        Args:
+            max_age: Maximum age in seconds of a catalog that may be reused.
+                     Defaults to CATALOG_TTL; 0 forces a refresh.
+
+        Raises:
+            RateLimitError: If rate limit is exceeded.
+        """
+        max_age = self.CATALOG_TTL if max_age is None else max_age
+        catalog = self._catalog
+        if catalog is not None and catalog.age() < max_age:
+            return catalog
+
+        with self._fetch_lock:
+            # Another thread may have fetched it while we waited
+            catalog = self._catalog
+            if catalog is not None and catalog.age() < max_age:
+                return catalog
+            return self._fetch_catalog(max_age)
+
+    def use_catalog(self, catalog: BreachCatalog) -> None:
+        """Install a catalog obtained elsewhere (e.g. a loaded snapshot).
+
+        It is used like a fetched one, until it is older than CATALOG_TTL.
+        """
+        with self._fetch_lock:
+            self._catalog = catalog
+        with self._lock:
+            self._recent_domains.clear()
+
+    def _fetch_catalog(self, max_age: float | None = None) -> BreachCatalog:
+        operation = protocol.list_breaches()
+        max_age = self.CATALOG_TTL if max_age is None else max_age
+        # A cached response older than max_age would only serve stale data again
+        refresh = not self._client._is_cached(operation, max_age)
+        breaches = self._client._execute(operation, refresh=refresh)
+        # A response served from the cache is as old as the cache entry
+        meta = self._client.last_response_meta
+        fetched_at = meta.cached_at if meta is not None and meta.from_cache else None
+        # Carries the text index over, re-indexing changed breaches only
+        catalog = BreachCatalog(breaches, fetched_at=fetched_at, previous=self._catalog)
+        self._catalog = catalog
+        with self._lock:
+            self._recent_domains.clear()
+        return catalog
+
+    def _fresh_catalog(self) -> BreachCatalog | None:
+        """The catalog, if it can answer lookups without a new API request."""
+        catalog = self._catalog
+        if catalog is not None and catalog.age() < self.CATALOG_TTL:
+            return catalog
+        if self._client._is_cached(protocol.list_breaches(), self.CATALOG_TTL):
+            return self.catalog()
+        return None
 
-        data = self._client._request("GET", "/v1/breaches", params=params if params else None)
+    def _is_burst(self, domain: str) -> bool:
+        """Record a domain lookup and report whether lookups are bursting."""
+        now = time.monotonic()
+        with self._lock:
+            recent = self._recent_domains
+            recent[normalize_domain(domain)] = now
+            if len(recent) > self.BATCH_THRESHOLD:
+                cutoff = now - self.BATCH_WINDOW
+                for key in [k for k, t in recent.items() if t < cutoff]:
+                    del recent[key]
+            return len(recent) > self.BATCH_THRESHOLD
 
-        # API returns {"exposedBreaches": [...]}
-        breaches_list = data.get("exposedBreaches", [])
-        return [Breach.from_dict(b) for b in breaches_list]
+    def _after_fork(self) -> None:
+        """Reset locks that may have been held by another thread at fork."""
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
@@ -4,9 +4,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from ..exceptions import ValidationError
-from ..models import BreachAnalyticsResponse, EmailBreachDetailedResponse, EmailBreachResponse
-from ..utils import validate_email
+from .. import protocol
+from ..catalog import BreachCatalog
+from ..models import (
+    BreachAnalyticsResponse,
+    BreachInfo,
+    EmailBreachDetailedResponse,
+    EmailBreachResponse,
+)
 
 if TYPE_CHECKING:
     from ..client import XposedOrNot
@@ -15,12 +20,15 @@ if TYPE_CHECKING:
 class EmailEndpoint:
     """Handles email-related API endpoints."""
 
-    PLUS_API_BASE = "https://plus-api.xposedornot.com"
+    PLUS_API_BASE = protocol.PLUS_API_BASE
+    CATALOG_REFRESH_INTERVAL = 300.0  # Min seconds between refreshes for unknown IDs
 
     def __init__(self, client: "XposedOrNot"):
         self._client = client
 
-    def check(self, email: str) -> EmailBreachResponse | EmailBreachDetailedResponse:
+    def check(
+        self, email: str, refresh: bool = False
+    ) -> EmailBreachResponse | EmailBreachDetailedResponse:
         """Check if an email has been exposed in data breaches.
 
         When an API key is configured, uses the Plus API (plus-api.xposedornot.com)
@@ -29,6 +37,7 @@ class EmailEndpoint:
 
         Args:
             email: The email address to check.
+            refresh: Fetch a fresh result instead of a cached response.
 
         Returns:
             EmailBreachDetailedResponse if API key is set (Plus API),
@@ -40,22 +49,34 @@ class EmailEndpoint:
             RateLimitError: If rate limit is exceeded.
             AuthenticationError: If API key is invalid (Plus API only).
         """
-        if not validate_email(email):
-            raise ValidationError(f"Invalid email format: {email}")
-
-        if self._client._api_key:
-            # Use Plus API for authenticated requests
-            data = self._client._request(
-                "GET",
-                f"/v3/check-email/{email}",
-                params={"detailed": "true"},
-                base_url=self.PLUS_API_BASE,
-            )
-            return EmailBreachDetailedResponse.from_api_response(data)
-        else:
-            # Use free API for unauthenticated requests
-            data = self._client._request("GET", f"/v1/check-email/{email}")
-            return EmailBreachResponse.from_api_response(data)
+        # Use Plus API for authenticated requests, free API otherwise
+        plus = self._client._uses_api_key
+        if plus and self._client._compact_results:
+            return self._check_compact(email, refresh)
+        return self._client._execute(protocol.check_email(email, plus=plus), refresh=refresh)
+
+    def _check_compact(
+        self, email: str, refresh: bool = False
+    ) -> EmailBreachResponse | EmailBreachDetailedResponse:
+        """Fetch breach IDs only and fill in the details from the breach catalog.
+
+        If the response names a breach the catalog does not know yet, the
+        catalog is refreshed (at most every CATALOG_REFRESH_INTERVAL
+        seconds); if the breach is still unknown, the detailed response is
+        requested instead.
+        """
+        breach_ids = self._client._execute(
+            protocol.check_email_compact(email), refresh=refresh
+        ).breaches
+
+        catalogs = self._client._breaches
+        breaches = _join(catalogs.catalog(), breach_ids)
+        if breaches is None:
+            breaches = _join(catalogs.catalog(max_age=self.CATALOG_REFRESH_INTERVAL), breach_ids)
+        if breaches is None:
+            return self._client._execute(protocol.check_email(email, plus=True), refresh=refresh)
+
+        return EmailBreachDetailedResponse(status="success", email=email, breaches=breaches)
 
     def analytics(self, email: str) -> BreachAnalyticsResponse:
         """Get detailed breach analytics for an email.
@@ -72,8 +93,15 @@ class EmailEndpoint:
             NotFoundError: If email is not found in any breaches.
             RateLimitError: If rate limit is exceeded.
         """
-        if not validate_email(email):
-            raise ValidationError(f"Invalid email format: {email}")
-
-        data = self._client._request("GET", "/v1/breach-analytics", params={"email": email})
-        return BreachAnalyticsResponse.from_api_response(data)
+        return self._client._execute(protocol.breach_analytics(email))
+
+
+def _join(catalog: BreachCatalog, breach_ids: list[str]) -> list[BreachInfo] | None:
+    """Look up breach details in the catalog; None if any ID is unknown."""
+    breaches = []
+    for breach_id in breach_ids:
+        breach = catalog.get(breach_id)
+        if breach is None:
+            return None
+        breaches.append(BreachInfo.from_breach(breach, breach_id=breach_id))
+    return breaches
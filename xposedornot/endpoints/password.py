@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from .. import protocol
 from ..models import PasswordCheckResponse
 from ..utils import hash_password_keccak512
 
@@ -23,7 +24,7 @@ class PasswordEndpoint:
     Only a partial hash (first 10 chars of Keccak-512) is sent to the API.
     """
 
-    PASSWORD_API_BASE = "https://passwords.xposedornot.com/api"
+    PASSWORD_API_BASE = protocol.PASSWORD_API_BASE
 
     def __init__(self, client: "XposedOrNot"):
         self._client = client
@@ -49,11 +50,22 @@ class PasswordEndpoint:
             RateLimitError: If rate limit is exceeded.
         """
         # Hash password locally - only the hash prefix is sent, never the password
-        hash_prefix = hash_password_keccak512(password)
-
-        data = self._client._request(
-            "GET",
-            f"/v1/pass/anon/{hash_prefix}",
-            base_url=self.PASSWORD_API_BASE,
-        )
-        return PasswordCheckResponse.from_api_response(data)
+        return self.check_prefix(hash_password_keccak512(password))
+
+    def check_prefix(self, hash_prefix: str) -> PasswordCheckResponse:
+        """Check a precomputed Keccak-512 hash prefix.
+
+        Used by bulk callers that hash passwords themselves (see
+        xposedornot.audit); check() is the usual entry point.
+
+        Args:
+            hash_prefix: The first 10 hex characters of the Keccak-512 hash.
+
+        Returns:
+            PasswordCheckResponse containing exposure count and characteristics.
+
+        Raises:
+            NotFoundError: If password hash prefix is not found.
+            RateLimitError: If rate limit is exceeded.
+        """
+        return self._client._execute(protocol.check_password_prefix(hash_prefix))
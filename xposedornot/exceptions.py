@@ -49,3 +49,45 @@ class ValidationError(XposedOrNotError):
     """Raised when input validation fails."""
 
     pass
+
+
+class QuotaExceededError(RateLimitError):
+    """Raised when a configured hourly or daily quota is used up.
+
+    Raised before the request is sent, so no retries are spent on it.
+    """
+
+    def __init__(
+        self,
+        message: str = "Request quota exhausted.",
+        retry_after: float | None = None,
+    ):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class DeadlineExceeded(APIError):
+    """Raised when a call cannot complete within its deadline.
+
+    Raised as soon as the remaining time cannot cover the next wait or
+    attempt, rather than after spending it.
+    """
+
+    def __init__(self, message: str = "Deadline exceeded"):
+        super().__init__(message)
+
+
+class CircuitOpenError(APIError):
+    """Raised without sending a request while a host's circuit is open.
+
+    The host recently failed or responded too slowly too often (see
+    CircuitBreaker). No rate-limit or quota budget is spent on the call.
+    """
+
+    def __init__(self, host: str, retry_after: float | None = None):
+        message = f"Circuit open for {host}"
+        if retry_after:
+            message += f"; next probe in {retry_after:.0f}s"
+        super().__init__(message)
+        self.host = host
+        self.retry_after = retry_after
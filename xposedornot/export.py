@@ -0,0 +1,186 @@
+"""Columnar and streaming export of breach records.
+
+Records (Breach, BreachInfo, BreachDetails, PasswordAuditRecord, ... - any
+of the result dataclasses) are read field by field with attrgetter instead
+of dataclasses.asdict(), which deep-copies every record. to_columns()
+returns one list per field, which NumPy and Arrow ingest directly;
+write_csv() and write_jsonl() stream rows without holding them in memory.
+
+NumPy and pyarrow are optional: to_numpy() and to_arrow() import them on
+first use (pip install "xposedornot[export]").
+"""
+
+from __future__ import annotations
+
+import csv
+import dataclasses
+import json
+import os
+from contextlib import contextmanager
+from itertools import chain
+from operator import attrgetter
+from typing import IO, Any, Callable, Iterable, Iterator, Sequence
+
+# Separator used for list fields (e.g. Breach.exposed_data) in CSV output
+LIST_SEPARATOR = ";"
+
+
+def record_fields(record_type: type) -> list[str]:
+    """Return the exported field names of a result dataclass."""
+    return [f.name for f in dataclasses.fields(record_type)]
+
+
+def _row_getter(names: Sequence[str]) -> Callable[[Any], tuple[Any, ...]]:
+    """Return a function reading the given fields of a record as a tuple."""
+    if len(names) == 1:
+        name = names[0]
+        return lambda record: (getattr(record, name),)
+    return attrgetter(*names)
+
+
+def _fields_of(records: Sequence[Any], fields: Sequence[str] | None) -> list[str]:
+    if fields is not None:
+        return list(fields)
+    if not records:
+        return []
+    return record_fields(type(records[0]))
+
+
+def to_columns(
+    records: Iterable[Any], fields: Sequence[str] | None = None
+) -> dict[str, list[Any]]:
+    """Transpose records into one list per field.
+
+    Args:
+        records: Result dataclasses, all of the same type.
+        fields: Fields to export. Defaults to every dataclass field.
+
+    Returns:
+        Mapping of field name to the values of that field, in record order.
+    """
+    records = records if isinstance(records, Sequence) else list(records)
+    names = _fields_of(records, fields)
+    if not records:
+        return {name: [] for name in names}
+    columns = zip(*map(_row_getter(names), records))
+    return {name: list(column) for name, column in zip(names, columns)}
+
+
+def to_numpy(records: Iterable[Any], fields: Sequence[str] | None = None) -> Any:
+    """Export records as a NumPy structured array (requires numpy).
+
+    Integer, float and bool fields get native dtypes; other fields are
+    stored as Python objects.
+    """
+    import numpy as np
+
+    columns = to_columns(records, fields)
+    dtypes = [(name, _numpy_dtype(values)) for name, values in columns.items()]
+    length = len(next(iter(columns.values()), []))
+    array = np.empty(length, dtype=dtypes)
+    for name, values in columns.items():
+        array[name] = values
+    return array
+
+
+def _numpy_dtype(values: list[Any]) -> str:
+    if values and all(type(v) is bool for v in values):
+        return "?"
+    if values and all(type(v) is int for v in values):
+        return "i8"
+    if values and all(type(v) in (int, float) for v in values):
+        return "f8"
+    return "O"
+
+
+def to_arrow(records: Iterable[Any], fields: Sequence[str] | None = None) -> Any:
+    """Export records as a pyarrow.Table (requires pyarrow)."""
+    import pyarrow as pa
+
+    return pa.table(to_columns(records, fields))
+
+
+@contextmanager
+def _open(target: str | os.PathLike[str] | IO[str]) -> Iterator[IO[str]]:
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "w", encoding="utf-8", newline="") as f:
+            yield f
+    else:
+        yield target
+
+
+def write_csv(
+    records: Iterable[Any],
+    target: str | os.PathLike[str] | IO[str],
+    fields: Sequence[str] | None = None,
+) -> int:
+    """Stream records to a CSV file with a header row.
+
+    List fields are joined with LIST_SEPARATOR.
+
+    Args:
+        records: Result dataclasses, all of the same type.
+        target: Path or open text file.
+        fields: Fields to export. Defaults to every dataclass field.
+
+    Returns:
+        Number of records written.
+    """
+    iterator = iter(records)
+    first = next(iterator, None)
+    if first is None:
+        with _open(target) as f:
+            if fields:
+                csv.writer(f).writerow(fields)
+        return 0
+    names = list(fields) if fields is not None else record_fields(type(first))
+    getter = _row_getter(names)
+
+    count = 0
+    with _open(target) as f:
+        writer = csv.writer(f)
+        writer.writerow(names)
+        for record in chain([first], iterator):
+            writer.writerow(
+                [
+                    LIST_SEPARATOR.join(map(str, v)) if isinstance(v, list) else v
+                    for v in getter(record)
+                ]
+            )
+            count += 1
+    return count
+
+
+def write_jsonl(
+    records: Iterable[Any],
+    target: str | os.PathLike[str] | IO[str],
+    fields: Sequence[str] | None = None,
+) -> int:
+    """Stream records to a JSON Lines file, one object per record.
+
+    Args:
+        records: Result dataclasses, all of the same type.
+        target: Path or open text file.
+        fields: Fields to export. Defaults to every dataclass field.
+
+    Returns:
+        Number of records written.
+    """
+    iterator = iter(records)
+    first = next(iterator, None)
+    if first is None:
+        with _open(target):
+            return 0
+    names = list(fields) if fields is not None else record_fields(type(first))
+    getter = _row_getter(names)
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str).encode
+
+    count = 0
+    with _open(target) as f:
+        write = f.write
+        for record in chain([first], iterator):
+            write(encode(dict(zip(names, getter(record)))))
+            write("\n")
+            count += 1
+    return count
+
@@ -0,0 +1,182 @@
+"""Hedged requests for tail latency.
+
+A hedged request is sent once; if no answer arrives within the hedge
+delay, an identical second request is sent and whichever answers first is
+used. The delay tracks a high percentile of recent response times, so
+only the slowest few percent of requests are hedged and the extra load
+stays small, while a single stalled response no longer holds a call up
+for the full timeout.
+
+The loser is not cancelled (a synchronous HTTP request cannot be); its
+response is discarded when it arrives.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, TypeVar
+
+from .models import HedgeStats
+
+R = TypeVar("R")
+
+
+class HedgePolicy:
+    """When to hedge, and the counters of what happened.
+
+    One policy can be shared by several clients; its latency window and
+    counters are then shared too.
+
+    Example:
+        >>> xon = XposedOrNot(api_key="...", hedge=HedgePolicy(percentile=95))
+        >>> xon.hedge_stats()
+        HedgeStats(requests=1200, hedged=58, hedge_wins=41, skipped=0, delay=0.41)
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.01,
+        max_delay: float | None = None,
+        window: int = 1000,
+        min_samples: int = 20,
+        max_workers: int = 64,
+    ):
+        """Initialize the policy.
+
+        Args:
+            percentile: Response-time percentile used as the hedge delay.
+            initial_delay: Delay used until min_samples responses were seen.
+            min_delay: Lower bound of the delay.
+            max_delay: Optional upper bound of the delay.
+            window: Number of recent response times the percentile covers.
+            min_samples: Response times needed before the percentile is used.
+            max_workers: Maximum requests (primaries and hedges) in flight.
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self._max_workers = max_workers
+        self._samples: deque[float] = deque(maxlen=window)
+        self._delay = initial_delay
+        self._measured = False  # Whether the delay comes from samples yet
+        self._stale = 0  # Samples added since the delay was computed
+        self._requests = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._skipped = 0
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _after_fork(self) -> None:
+        """Drop the worker threads and lock, which do not survive a fork."""
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def delay(self) -> float:
+        """Seconds to wait for an answer before hedging."""
+        with self._lock:
+            # Recomputed every few samples rather than on every call
+            if len(self._samples) >= self.min_samples and (self._stale >= 16 or not self._measured):
+                ordered = sorted(self._samples)
+                rank = math.ceil(self.percentile / 100 * len(ordered)) - 1
+                delay = max(ordered[max(rank, 0)], self.min_delay)
+                if self.max_delay is not None:
+                    delay = min(delay, self.max_delay)
+                self._delay = delay
+                self._measured = True
+                self._stale = 0
+            return self._delay
+
+    def observe(self, seconds: float) -> None:
+        """Record the response time of one request."""
+        with self._lock:
+            self._samples.append(seconds)
+            self._stale += 1
+
+    def stats(self) -> HedgeStats:
+        """Return the counters and the current delay."""
+        delay = self.delay()
+        with self._lock:
+            return HedgeStats(
+                requests=self._requests,
+                hedged=self._hedged,
+                hedge_wins=self._hedge_wins,
+                skipped=self._skipped,
+                delay=delay,
+            )
+
+    def _submit(self, call: Callable[[], R]) -> Future[R]:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="xposedornot-hedge"
+                )
+            executor = self._executor
+
+        def timed() -> R:
+            start = time.perf_counter()
+            result = call()
+            self.observe(time.perf_counter() - start)
+            return result
+
+        # Run in a copy of the caller's context so its priority and deadline apply
+        return executor.submit(contextvars.copy_context().run, timed)
+
+    def run(
+        self,
+        primary: Callable[[], R],
+        reserve_hedge: Callable[[], Callable[[], R] | None],
+        acceptable: Callable[[R], bool],
+    ) -> tuple[R, bool]:
+        """Run a request, hedging it if it is slow.
+
+        Args:
+            primary: Sends the request.
+            reserve_hedge: Called when the delay has passed. Reserves budget
+                           for a hedge and returns the call sending it, or
+                           returns None if there is no room.
+            acceptable: Whether a result can be used, e.g. not a 429 or 5xx
+                        response. When neither result is acceptable, the
+                        primary's result (or exception) is returned.
+
+        Returns:
+            (result, whether a hedge was sent).
+        """
+        with self._lock:
+            self._requests += 1
+        first = self._submit(primary)
+        done, _ = wait([first], timeout=self.delay())
+        if done:
+            return first.result(), False
+
+        hedge = reserve_hedge()
+        if hedge is None:
+            with self._lock:
+                self._skipped += 1
+            return first.result(), False
+        second = self._submit(hedge)
+        with self._lock:
+            self._hedged += 1
+
+        pending = {first, second}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # Prefer the primary when both completed at once
+            for future in sorted(done, key=lambda f: f is not first):
+                if future.exception() is None and acceptable(future.result()):
+                    if future is second:
+                        with self._lock:
+                            self._hedge_wins += 1
+                    return future.result(), True
+        return first.result(), True
@@ -0,0 +1,218 @@
+"""Pooling of several Plus API keys.
+
+An APIKeyPool spreads requests across keys by remaining per-minute budget,
+takes keys out of rotation when the server rejects them (401) or throttles
+them (429), and keeps per-key usage counters.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Iterable, Mapping
+
+from .exceptions import AuthenticationError
+from .models import APIKeyUsage
+
+
+class _PooledKey:
+    """Book-keeping for a single key in the pool."""
+
+    def __init__(self, name: str, key: str, requests_per_minute: int):
+        self.name = name
+        self.key = key
+        self.requests_per_minute = requests_per_minute
+        self.window: deque[float] = deque()
+        self.cooling_until = 0.0
+        self.invalid = False
+        self.requests = 0
+        self.rate_limited = 0
+        self.auth_failures = 0
+        self.last_used = 0.0
+
+    def remaining(self, now: float) -> int:
+        while self.window and self.window[0] <= now - APIKeyPool.WINDOW:
+            self.window.popleft()
+        return self.requests_per_minute - len(self.window)
+
+    def available_at(self, now: float) -> float:
+        """Earliest time this key can be used again."""
+        if self.remaining(now) > 0:
+            return max(now, self.cooling_until)
+        return max(self.window[0] + APIKeyPool.WINDOW, self.cooling_until)
+
+    def status(self, now: float) -> str:
+        if self.invalid:
+            return "invalid"
+        if self.cooling_until > now:
+            return "cooling"
+        return "active"
+
+
+class APIKeyPool:
+    """A pool of Plus API keys used in rotation.
+
+    Example:
+        >>> from xposedornot import APIKeyPool, XposedOrNot
+        >>> pool = APIKeyPool({"finance": "key-1", "ops": "key-2"}, requests_per_minute=50)
+        >>> xon = XposedOrNot(key_pool=pool)
+        >>> xon.check_email("test@example.com")
+        >>> for usage in pool.usage():
+        ...     print(usage.name, usage.requests, usage.status)
+    """
+
+    WINDOW = 60.0  # Budgets are per rolling minute
+    DEFAULT_REQUESTS_PER_MINUTE = 50  # Lowest Plus tier
+    DEFAULT_COOLDOWN = 60.0  # Used when a 429 carries no Retry-After header
+
+    def __init__(
+        self,
+        keys: Iterable[str] | Mapping[str, str] = (),
+        requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+        cooldown: float = DEFAULT_COOLDOWN,
+    ):
+        """Initialize the key pool.
+
+        Args:
+            keys: API keys, or a mapping of display name to API key.
+            requests_per_minute: Default per-key budget (your plan's RPM).
+            cooldown: Seconds a key is rested after a 429 without Retry-After.
+        """
+        self._default_rpm = requests_per_minute
+        self._cooldown = cooldown
+        self._keys: dict[str, _PooledKey] = {}
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+
+        if isinstance(keys, Mapping):
+            for name, key in keys.items():
+                self.add(key, name=name)
+        else:
+            for key in keys:
+                self.add(key)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _after_fork(self) -> None:
+        """Reset locks that may have been held by another thread at fork."""
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+
+    def _secret(self) -> str:
+        """All keys of the pool, to identify responses fetched with them."""
+        with self._lock:
+            return "\n".join(sorted(self._keys))
+
+    def add(self, key: str, name: str | None = None, requests_per_minute: int | None = None) -> None:
+        """Add a key to the pool.
+
+        Args:
+            key: The API key.
+            name: Display name used in usage reports. Defaults to a masked key.
+            requests_per_minute: Budget for this key, if different from the default.
+        """
+        if not key:
+            raise ValueError("API key must not be empty")
+        with self._lock:
+            self._keys[key] = _PooledKey(
+                name or _mask(key), key, requests_per_minute or self._default_rpm
+            )
+            self._available.notify_all()
+
+    def acquire(self, timeout: float | None = None) -> str:
+        """Reserve one request on the key with the most remaining budget.
+
+        Blocks until a key has budget if all are used up or cooling down.
+
+        Args:
+            timeout: Maximum seconds to wait. None waits indefinitely.
+
+        Returns:
+            The API key to send with the request.
+
+        Raises:
+            AuthenticationError: If every key in the pool has been rejected.
+            TimeoutError: If no key became available within timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._available:
+            while True:
+                now = time.monotonic()
+                usable = [k for k in self._keys.values() if not k.invalid]
+                if not usable:
+                    raise AuthenticationError("No valid API keys left in the pool")
+
+                ready = [k for k in usable if k.available_at(now) <= now]
+                if ready:
+                    chosen = max(ready, key=lambda k: (k.remaining(now), -k.last_used))
+                    chosen.window.append(now)
+                    chosen.requests += 1
+                    chosen.last_used = now
+                    return chosen.key
+
+                wait = min(k.available_at(now) for k in usable) - now
+                if deadline is not None:
+                    if now >= deadline:
+                        raise TimeoutError("No API key became available in time")
+                    wait = min(wait, deadline - now)
+                self._available.wait(wait)
+
+    def report(self, key: str, status_code: int, retry_after: float | None = None) -> None:
+        """Report the outcome of a request made with a pooled key.
+
+        Args:
+            key: The key returned by acquire().
+            status_code: HTTP status code of the response.
+            retry_after: Seconds from the Retry-After header, if any.
+        """
+        with self._available:
+            pooled = self._keys.get(key)
+            if pooled is None:
+                return
+            if status_code == 401:
+                pooled.invalid = True
+                pooled.auth_failures += 1
+            elif status_code == 429:
+                pooled.rate_limited += 1
+                rest = retry_after if retry_after is not None else self._cooldown
+                pooled.cooling_until = time.monotonic() + rest
+            self._available.notify_all()
+
+    def has_available(self) -> bool:
+        """Whether any key can take a request right now."""
+        with self._lock:
+            now = time.monotonic()
+            return any(
+                not k.invalid and k.available_at(now) <= now for k in self._keys.values()
+            )
+
+    def usage(self) -> list[APIKeyUsage]:
+        """Report per-key usage and status.
+
+        Returns:
+            One APIKeyUsage per key, in the order keys were added.
+        """
+        with self._lock:
+            now = time.monotonic()
+            return [
+                APIKeyUsage(
+                    name=k.name,
+                    status=k.status(now),
+                    requests=k.requests,
+                    rate_limited=k.rate_limited,
+                    auth_failures=k.auth_failures,
+                    remaining=0 if k.invalid else max(k.remaining(now), 0),
+                    requests_per_minute=k.requests_per_minute,
+                )
+                for k in self._keys.values()
+            ]
+
+
+def _mask(key: str) -> str:
+    """Mask an API key for display."""
+    if len(key) <= 8:
+        return "****"
+    return f"{key[:4]}...{key[-4:]}"
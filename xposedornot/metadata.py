@@ -0,0 +1,82 @@
+"""Collection of per-request timing and header metadata.
+
+Timings come from the httpcore "trace" request extension, which reports
+the start and end of each connection and HTTP phase. Only the response
+headers that matter for rate limiting and caching are kept.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import httpx
+
+from .models import RequestTimings
+
+# Response headers copied into ResponseMeta.headers
+_HEADER_NAMES = frozenset(
+    {
+        "retry-after",
+        "cache-control",
+        "age",
+        "etag",
+        "last-modified",
+        "expires",
+        "cf-cache-status",
+        "x-cache",
+    }
+)
+_HEADER_PREFIXES = ("x-ratelimit-", "ratelimit", "x-rate-limit-")
+
+
+def relevant_headers(headers: httpx.Headers) -> dict[str, str]:
+    """Pick the rate-limit and caching headers out of a response."""
+    return {
+        name: value
+        for name, value in headers.items()
+        if name in _HEADER_NAMES or name.startswith(_HEADER_PREFIXES)
+    }
+
+
+class RequestTracer:
+    """Records httpcore trace events for one HTTP attempt.
+
+    Pass the instance as the "trace" request extension and read timings()
+    once the response has been received.
+    """
+
+    def __init__(self) -> None:
+        self._start = time.perf_counter()
+        self._events: dict[str, float] = {}
+
+    def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        # Event names look like "connection.connect_tcp.started" or
+        # "http11.receive_response_headers.complete"; keep the last two parts
+        _, _, name = event_name.partition(".")
+        self._events[name] = time.perf_counter()
+
+    def _span(self, start: str, end: str) -> float | None:
+        if start in self._events and end in self._events:
+            return self._events[end] - self._events[start]
+        return None
+
+    def timings(self) -> RequestTimings:
+        """Build the timing breakdown from the recorded events."""
+        sent = self._events.get("send_request_body.complete") or self._events.get(
+            "send_request_headers.complete"
+        )
+        first_byte = self._events.get("receive_response_headers.complete")
+
+        return RequestTimings(
+            connect=self._span("connect_tcp.started", "connect_tcp.complete"),
+            tls=self._span("start_tls.started", "start_tls.complete"),
+            send=(
+                sent - self._events["send_request_headers.started"]
+                if sent is not None and "send_request_headers.started" in self._events
+                else None
+            ),
+            ttfb=first_byte - sent if first_byte is not None and sent is not None else None,
+            receive=self._span("receive_response_body.started", "receive_response_body.complete"),
+            total=time.perf_counter() - self._start,
+        )
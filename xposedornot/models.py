@@ -3,8 +3,34 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
 from typing import Any
 
+from . import datatypes
+from .utils import parse_date
+
+
+class _DataTypesMixin:
+    """Query helpers for models with a data_types bitmask."""
+
+    data_types: int
+
+    def exposes_any(self, *names: str) -> bool:
+        """Whether the breach exposed at least one of the given data types."""
+        return datatypes.has_any(self.data_types, datatypes.registry.query(names))
+
+    def exposes_all(self, *names: str) -> bool:
+        """Whether the breach exposed every one of the given data types."""
+        # A type not registered yet cannot have been exposed
+        return all(name in datatypes.registry for name in names) and datatypes.has_all(
+            self.data_types, datatypes.registry.query(names)
+        )
+
+    def exposes_none(self, *names: str) -> bool:
+        """Whether the breach exposed none of the given data types."""
+        return datatypes.has_none(self.data_types, datatypes.registry.query(names))
+
 
 @dataclass
 class EmailBreachResponse:
@@ -25,7 +51,7 @@ class EmailBreachResponse:
 
 
 @dataclass
-class BreachInfo:
+class BreachInfo(_DataTypesMixin):
     """Detailed information about a single breach from the Plus API."""
 
     breach_id: str
@@ -58,6 +84,40 @@ class BreachInfo:
     seniority: str | None = None
     """Seniority information if available."""
 
+    data_types: int = field(default=0, repr=False)
+    """Bitmask of xposed_data (see xposedornot.datatypes). Computed if not given."""
+
+    def __post_init__(self) -> None:
+        if not self.data_types:
+            self.data_types = datatypes.registry.mask(datatypes.split_data_types(self.xposed_data))
+
+    @cached_property
+    def breached_at(self) -> datetime | None:
+        """breached_date as a UTC datetime (parsed on first use, then cached)."""
+        return parse_date(self.breached_date)
+
+    @classmethod
+    def from_breach(cls, breach: "Breach", breach_id: str | None = None) -> "BreachInfo":
+        """Create from a breach catalog entry.
+
+        Args:
+            breach: The catalog entry.
+            breach_id: Breach ID to report (as spelled by the Plus API).
+                       Defaults to the catalog's ID.
+        """
+        return cls(
+            breach_id=breach_id or breach.breach_id,
+            breached_date=breach.breached_date,
+            logo=breach.logo,
+            password_risk=breach.password_risk,
+            searchable="Yes" if breach.searchable else "No",
+            xposed_data=";".join(breach.exposed_data),
+            xposed_records=breach.exposed_records,
+            xposure_desc=breach.exposure_description,
+            domain=breach.domain,
+            data_types=breach.data_types,
+        )
+
 
 @dataclass
 class EmailBreachDetailedResponse:
@@ -103,7 +163,7 @@ class EmailBreachDetailedResponse:
 
 
 @dataclass
-class BreachDetails:
+class BreachDetails(_DataTypesMixin):
     """Details of a single breach."""
 
     breach: str
@@ -142,6 +202,18 @@ class BreachDetails:
     xposed_records: int
     """Number of records exposed."""
 
+    data_types: int = field(default=0, repr=False)
+    """Bitmask of xposed_data (see xposedornot.datatypes). Computed if not given."""
+
+    def __post_init__(self) -> None:
+        if not self.data_types:
+            self.data_types = datatypes.registry.mask(datatypes.split_data_types(self.xposed_data))
+
+    @cached_property
+    def xposed_at(self) -> datetime | None:
+        """xposed_date as a UTC datetime (parsed on first use, then cached)."""
+        return parse_date(self.xposed_date)
+
 
 @dataclass
 class BreachMetrics:
@@ -185,6 +257,11 @@ class BreachAnalyticsResponse:
     pastes_count: int = 0
     """Number of pastes found."""
 
+    @cached_property
+    def first_breach_at(self) -> datetime | None:
+        """first_breach as a UTC datetime (parsed on first use, then cached)."""
+        return parse_date(self.first_breach)
+
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> "BreachAnalyticsResponse":
         """Create from API response."""
@@ -231,7 +308,7 @@ class BreachAnalyticsResponse:
 
 
 @dataclass
-class Breach:
+class Breach(_DataTypesMixin):
     """Information about a data breach."""
 
     breach_id: str
@@ -273,6 +350,18 @@ class Breach:
     verified: bool
     """Whether the breach is verified."""
 
+    data_types: int = field(default=0, repr=False)
+    """Bitmask of exposed_data (see xposedornot.datatypes). Computed if not given."""
+
+    def __post_init__(self) -> None:
+        if not self.data_types:
+            self.data_types = datatypes.registry.mask(self.exposed_data)
+
+    @cached_property
+    def breached_at(self) -> datetime | None:
+        """breached_date as a UTC datetime (parsed on first use, then cached)."""
+        return parse_date(self.breached_date)
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Breach":
         """Create from API response dict."""
@@ -339,3 +428,329 @@ class PasswordCheckResponse:
             characteristics=characteristics,
             count=count,
         )
+
+
+@dataclass
+class PasswordAuditRecord:
+    """Result for a single line of a password audit.
+
+    The password itself is never stored; use line_number or offset to
+    locate it in the audited file.
+    """
+
+    line_number: int
+    """1-based line number in the audited file."""
+
+    offset: int
+    """Byte offset of the line in the audited file."""
+
+    hash_prefix: str
+    """The Keccak-512 hash prefix that was looked up."""
+
+    count: int
+    """Number of times this password was found in breaches (0 if not found)."""
+
+    duplicate: bool = False
+    """Whether the same password appeared on an earlier line."""
+
+    @property
+    def exposed(self) -> bool:
+        """Whether the password has been found in any breach."""
+        return self.count > 0
+
+
+@dataclass
+class PasswordAuditStats:
+    """Running totals for a password audit."""
+
+    lines: int = 0
+    """Number of non-empty lines processed."""
+
+    unique_passwords: int = 0
+    """Number of distinct passwords seen."""
+
+    lookups: int = 0
+    """Number of hash prefixes looked up against the API."""
+
+    exposed: int = 0
+    """Number of lines whose password has been exposed."""
+
+
+@dataclass
+class APIKeyUsage:
+    """Usage and status of a single key in an APIKeyPool."""
+
+    name: str
+    """Display name of the key (masked key if no name was given)."""
+
+    status: str
+    """'active', 'cooling' (rested after a 429) or 'invalid' (rejected with a 401)."""
+
+    requests: int
+    """Number of requests sent with this key."""
+
+    rate_limited: int
+    """Number of 429 responses received for this key."""
+
+    auth_failures: int
+    """Number of 401 responses received for this key."""
+
+    remaining: int
+    """Requests left in the current one-minute window."""
+
+    requests_per_minute: int
+    """Configured per-minute budget for this key."""
+
+
+@dataclass
+class QuotaStatus:
+    """Remaining request budget in the rolling quota windows.
+
+    Fields for a window are None when no limit is configured for it.
+    """
+
+    hourly_limit: int | None
+    """Configured requests per rolling hour."""
+
+    hourly_used: int
+    """Requests sent in the last hour."""
+
+    hourly_remaining: int | None
+    """Requests left in the rolling hour."""
+
+    daily_limit: int | None
+    """Configured requests per rolling day."""
+
+    daily_used: int
+    """Requests sent in the last 24 hours."""
+
+    daily_remaining: int | None
+    """Requests left in the rolling day."""
+
+    retry_after: float = 0.0
+    """Seconds until at least one more request is allowed (0 if allowed now)."""
+
+
+@dataclass
+class CircuitStatus:
+    """State of one host's circuit in a CircuitBreaker."""
+
+    host: str
+    """Host name."""
+
+    state: str
+    """'closed' (requests flow), 'open' (requests fail fast) or 'half_open' (probing)."""
+
+    calls: int
+    """Outcomes in the rolling window."""
+
+    failure_rate: float
+    """Share of failed calls (connection errors, timeouts, 5xx) in the window."""
+
+    slow_rate: float
+    """Share of calls slower than the slow-call threshold in the window."""
+
+    opened: int
+    """Number of times the circuit has opened."""
+
+    retry_after: float = 0.0
+    """Seconds until an open circuit lets a probe through (0 otherwise)."""
+
+
+@dataclass
+class HedgeStats:
+    """Counters of a HedgePolicy (see XposedOrNot(hedge=...))."""
+
+    requests: int
+    """Requests that were eligible for hedging."""
+
+    hedged: int
+    """Requests for which a hedge was sent."""
+
+    hedge_wins: int
+    """Hedged requests answered first by the hedge."""
+
+    skipped: int
+    """Hedges not sent because the rate or quota budget had no room."""
+
+    delay: float
+    """Current hedge delay in seconds."""
+
+    @property
+    def hedge_rate(self) -> float:
+        """Share of eligible requests that were hedged."""
+        return self.hedged / self.requests if self.requests else 0.0
+
+
+@dataclass
+class RequestTimings:
+    """Timing breakdown of a single HTTP attempt, in seconds.
+
+    Phases are None when they did not happen (e.g. connect and tls on a
+    reused pooled connection) or could not be observed.
+    """
+
+    connect: float | None = None
+    """TCP connection setup, including DNS resolution."""
+
+    tls: float | None = None
+    """TLS handshake."""
+
+    send: float | None = None
+    """Sending the request."""
+
+    ttfb: float | None = None
+    """Time from the request being sent to the first response byte."""
+
+    receive: float | None = None
+    """Reading the response body."""
+
+    total: float = 0.0
+    """Wall-clock duration of the attempt."""
+
+
+@dataclass
+class ResponseMeta:
+    """Metadata about one API call, across all of its attempts."""
+
+    method: str
+    """HTTP method."""
+
+    url: str
+    """Request URL (without query parameters)."""
+
+    status_code: int | None = None
+    """Status code of the final attempt (None if no response was received)."""
+
+    attempts: int = 0
+    """Number of HTTP attempts made (0 when served from cache)."""
+
+    from_cache: bool = False
+    """Whether the response was served from the client's cache."""
+
+    cached_at: float | None = None
+    """Unix time a response served from the cache was originally fetched."""
+
+    rate_limit_wait: float = 0.0
+    """Seconds spent waiting on the rate limiter and priority queue."""
+
+    quota_wait: float = 0.0
+    """Seconds spent waiting on quota pacing."""
+
+    backoff: float = 0.0
+    """Seconds spent sleeping between retries."""
+
+    network: float = 0.0
+    """Seconds spent in HTTP attempts (all of them, including hedges' waits)."""
+
+    decode: float = 0.0
+    """Seconds spent decoding the JSON response body."""
+
+    hedged: bool = False
+    """Whether a hedge request was sent for the final attempt."""
+
+    timings: RequestTimings = field(default_factory=RequestTimings)
+    """Timing breakdown of the final attempt."""
+
+    headers: dict[str, str] = field(default_factory=dict)
+    """Rate-limit and caching headers of the final response."""
+
+    @property
+    def retries(self) -> int:
+        """Number of attempts after the first."""
+        return max(self.attempts - 1, 0)
+
+
+@dataclass
+class EndpointProfile:
+    """Where the time of one endpoint's calls went, from a Profiler."""
+
+    endpoint: str
+    """Endpoint name, e.g. 'check_email'."""
+
+    calls: int = 0
+    """Number of calls."""
+
+    errors: int = 0
+    """Calls that raised (including NotFoundError)."""
+
+    total: float = 0.0
+    """Seconds spent in the calls, end to end."""
+
+    rate_limit_wait: float = 0.0
+    """Seconds spent waiting on the rate limiter and priority queue."""
+
+    quota_wait: float = 0.0
+    """Seconds spent waiting on quota pacing."""
+
+    backoff: float = 0.0
+    """Seconds spent sleeping between retries."""
+
+    network: float = 0.0
+    """Seconds spent in HTTP attempts."""
+
+    decode: float = 0.0
+    """Seconds spent decoding JSON bodies."""
+
+    parse: float = 0.0
+    """Seconds spent building result models from the decoded JSON."""
+
+    allocated: int | None = None
+    """Net bytes allocated by the calls (None unless allocations are traced)."""
+
+    @property
+    def other(self) -> float:
+        """Seconds not accounted for by a phase (caching, accounting, hooks)."""
+        phases = (
+            self.rate_limit_wait
+            + self.quota_wait
+            + self.backoff
+            + self.network
+            + self.decode
+            + self.parse
+        )
+        return max(self.total - phases, 0.0)
+
+    @property
+    def mean(self) -> float:
+        """Mean seconds per call."""
+        return self.total / self.calls if self.calls else 0.0
+
+
+@dataclass
+class CatalogDiff:
+    """Changes to the breach catalog since the previous sync."""
+
+    added: list[Breach] = field(default_factory=list)
+    """Breaches that were not in the previous snapshot."""
+
+    changed: list[Breach] = field(default_factory=list)
+    """Breaches whose content changed (new versions)."""
+
+    removed: list[Breach] = field(default_factory=list)
+    """Breaches no longer in the catalog (last known versions)."""
+
+    unchanged: int = 0
+    """Number of breaches that did not change."""
+
+    not_modified: bool = False
+    """Whether the server answered 304 (Not Modified) without a body."""
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether any breach was added, changed or removed."""
+        return bool(self.added or self.changed or self.removed)
+
+
+@dataclass
+class WatchlistAlert:
+    """New exposures of a watched email address."""
+
+    email: str
+    """The watched address."""
+
+    new_breaches: list[str]
+    """Breaches the address was found in since its previous check."""
+
+    breaches: list[str]
+    """Every breach the address is currently known to be in."""
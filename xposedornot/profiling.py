@@ -0,0 +1,183 @@
+"""Per-endpoint profiling of client calls.
+
+A Profiler attached to a client splits the time of every endpoint call
+into phases: waiting on the rate limiter, quota pacing and retry backoff,
+HTTP attempts, JSON decoding and building the result models. With
+trace_allocations it also records, through tracemalloc, how much memory
+the calls allocated. The summary shows which phase is worth optimizing.
+
+Allocations are measured as the growth of traced memory across a call,
+so with calls running concurrently on several threads they are shared
+out approximately.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import tracemalloc
+from typing import IO, Any
+
+from .models import EndpointProfile, ResponseMeta
+
+_COLUMNS = (
+    ("calls", 7),
+    ("errors", 7),
+    ("total s", 10),
+    ("mean ms", 10),
+    ("wait", 9),
+    ("quota", 9),
+    ("backoff", 9),
+    ("network", 9),
+    ("decode", 9),
+    ("parse", 9),
+    ("other", 9),
+)
+
+
+class _Sample:
+    """Measurements of one call in progress."""
+
+    __slots__ = ("endpoint", "start", "memory", "parse", "failed")
+
+    def __init__(self, endpoint: str, memory: int | None):
+        self.endpoint = endpoint
+        self.start = time.perf_counter()
+        self.memory = memory
+        self.parse = 0.0
+        self.failed = False
+
+
+class Profiler:
+    """Collects a per-endpoint time breakdown of client calls.
+
+    Pass one to the client as profiler=, or use XposedOrNot.profile() to
+    profile a block of calls and print the summary at the end.
+
+    Example:
+        >>> profiler = Profiler(trace_allocations=True)
+        >>> xon = XposedOrNot(profiler=profiler)
+        >>> with profiler:
+        ...     for email in batch:
+        ...         xon.check_email(email)
+        >>> profiler.print_summary()
+    """
+
+    def __init__(self, trace_allocations: bool = False):
+        """Initialize the profiler.
+
+        Args:
+            trace_allocations: Also record the memory allocated by each
+                               endpoint's calls. Starts tracemalloc while the
+                               profiler is active, which slows allocations
+                               down noticeably.
+        """
+        self.trace_allocations = trace_allocations
+        self._profiles: dict[str, EndpointProfile] = {}
+        self._lock = threading.Lock()
+        self._started_tracing = False
+
+    def __enter__(self) -> "Profiler":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start tracing allocations, if enabled and not already traced."""
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        """Stop tracing allocations, if start() started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _after_fork(self) -> None:
+        """Reset the lock, which may have been held by another thread at fork."""
+        self._lock = threading.Lock()
+
+    def _begin(self, endpoint: str) -> _Sample:
+        memory = None
+        if self.trace_allocations and tracemalloc.is_tracing():
+            memory = tracemalloc.get_traced_memory()[0]
+        return _Sample(endpoint, memory)
+
+    def _finish(self, sample: _Sample, meta: ResponseMeta | None) -> None:
+        total = time.perf_counter() - sample.start
+        allocated = None
+        if sample.memory is not None and tracemalloc.is_tracing():
+            allocated = max(tracemalloc.get_traced_memory()[0] - sample.memory, 0)
+
+        with self._lock:
+            profile = self._profiles.get(sample.endpoint)
+            if profile is None:
+                profile = self._profiles[sample.endpoint] = EndpointProfile(sample.endpoint)
+            profile.calls += 1
+            profile.errors += sample.failed
+            profile.total += total
+            profile.parse += sample.parse
+            if meta is not None:
+                profile.rate_limit_wait += meta.rate_limit_wait
+                profile.quota_wait += meta.quota_wait
+                profile.backoff += meta.backoff
+                profile.network += meta.network
+                profile.decode += meta.decode
+            if allocated is not None:
+                profile.allocated = (profile.allocated or 0) + allocated
+
+    def report(self) -> list[EndpointProfile]:
+        """Return the profile of each endpoint, slowest total first."""
+        with self._lock:
+            profiles = [EndpointProfile(**vars(profile)) for profile in self._profiles.values()]
+        return sorted(profiles, key=lambda profile: profile.total, reverse=True)
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        with self._lock:
+            self._profiles.clear()
+
+    def summary(self) -> str:
+        """Format the profiles as a table, phases in seconds."""
+        profiles = self.report()
+        traced = any(profile.allocated is not None for profile in profiles)
+        width = max([len("endpoint")] + [len(profile.endpoint) for profile in profiles])
+        columns = _COLUMNS + ((("alloc KiB", 11),) if traced else ())
+
+        lines = ["endpoint".ljust(width) + "".join(name.rjust(w) for name, w in columns)]
+        for profile in profiles:
+            values = [
+                str(profile.calls),
+                str(profile.errors),
+                f"{profile.total:.3f}",
+                f"{profile.mean * 1000:.1f}",
+                *(
+                    f"{seconds:.3f}"
+                    for seconds in (
+                        profile.rate_limit_wait,
+                        profile.quota_wait,
+                        profile.backoff,
+                        profile.network,
+                        profile.decode,
+                        profile.parse,
+                        profile.other,
+                    )
+                ),
+            ]
+            if traced:
+                values.append(
+                    f"{profile.allocated / 1024:.1f}" if profile.allocated is not None else "-"
+                )
+            lines.append(
+                profile.endpoint.ljust(width)
+                + "".join(value.rjust(w) for value, (_, w) in zip(values, columns))
+            )
+        return "\n".join(lines)
+
+    def print_summary(self, file: IO[str] | None = None) -> None:
+        """Print the summary table (to stderr by default)."""
+        print(self.summary(), file=file or sys.stderr)
@@ -0,0 +1,300 @@
+"""Transport-independent (sans-I/O) protocol layer for the XposedOrNot API.
+
+This module knows how to build requests for each API operation and how to
+turn responses into models or exceptions, but never performs I/O itself.
+XposedOrNot drives it with a blocking httpx.Client; other code can drive
+the same operations with any HTTP stack:
+
+Example:
+    >>> import httpx
+    >>> from xposedornot import protocol
+    >>> op = protocol.check_email("test@example.com")
+    >>> req = op.build_request()
+    >>> async with httpx.AsyncClient() as http:
+    ...     resp = await http.request(req.method, req.url, params=req.params, headers=req.headers)
+    >>> result = op.parse_response(resp.status_code, resp.content)
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, TypeVar
+
+from .exceptions import (
+    APIError,
+    AuthenticationError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+    ValidationError,
+)
+from .models import (
+    Breach,
+    BreachAnalyticsResponse,
+    EmailBreachDetailedResponse,
+    EmailBreachResponse,
+    PasswordCheckResponse,
+)
+from .utils import hash_password_keccak512, validate_email
+
+DEFAULT_BASE_URL = "https://api.xposedornot.com"
+PLUS_API_BASE = "https://plus-api.xposedornot.com"
+PASSWORD_API_BASE = "https://passwords.xposedornot.com/api"
+
+NOT_MODIFIED = 304
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class HTTPRequest:
+    """A fully specified HTTP request, ready for any transport."""
+
+    method: str
+    url: str
+    params: dict[str, Any] | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Operation(Generic[T]):
+    """One API operation: where to send it and how to read the answer."""
+
+    method: str
+    """HTTP method."""
+
+    path: str
+    """Path relative to the base URL."""
+
+    parse: Callable[[dict[str, Any]], T]
+    """Builds the result model from the decoded JSON body."""
+
+    params: dict[str, Any] | None = None
+    """Query parameters."""
+
+    base_url: str | None = None
+    """Fixed base URL (Plus and password APIs); None means the client's base URL."""
+
+    name: str = ""
+    """Short name of the endpoint, e.g. for profiles; empty means the path."""
+
+    conditional: bool = False
+    """Whether the operation is sent with conditional_headers(), so that
+    NOT_MODIFIED (304) is a valid answer."""
+
+    @property
+    def endpoint(self) -> str:
+        """Name of the endpoint, without per-call parts of the path."""
+        return self.name or self.path
+
+    def url(self, default_base_url: str = DEFAULT_BASE_URL) -> str:
+        """Return the absolute URL of the operation."""
+        return f"{self.base_url or default_base_url}{self.path}"
+
+    def build_request(
+        self, api_key: str | None = None, default_base_url: str = DEFAULT_BASE_URL
+    ) -> HTTPRequest:
+        """Build the HTTP request for this operation.
+
+        Args:
+            api_key: Plus API key to authenticate with, if any.
+            default_base_url: Base URL for operations on the main API.
+        """
+        return HTTPRequest(
+            method=self.method,
+            url=self.url(default_base_url),
+            params=self.params,
+            headers=auth_headers(api_key),
+        )
+
+    def parse_response(self, status_code: int, body: bytes | str) -> T:
+        """Turn a raw response into the result model.
+
+        For a conditional operation, NOT_MODIFIED (304) parses like an
+        empty JSON object; the caller keeps what it fetched before.
+
+        Raises:
+            The exception error_for_status() maps status_code to.
+            APIError: If the body is empty or not JSON.
+        """
+        text = body.decode("utf-8", errors="replace") if isinstance(body, bytes) else body
+        error = error_for_status(status_code, text)
+        if error is not None:
+            raise error
+        if status_code == NOT_MODIFIED and self.conditional:
+            return self.parse({})
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            raise APIError(f"Invalid JSON response: {text[:200]}", status_code=status_code) from e
+        return self.parse(data)
+
+
+def auth_headers(api_key: str | None) -> dict[str, str]:
+    """Return the headers that authenticate a request."""
+    return {"x-api-key": api_key} if api_key else {}
+
+
+def conditional_headers(etag: str | None, last_modified: str | None) -> dict[str, str]:
+    """Return the validators that make a request conditional.
+
+    The server answers NOT_MODIFIED (304) with an empty body if the
+    resource has not changed since the response carrying these validators.
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def error_for_status(status_code: int, text: str = "") -> APIError | None:
+    """Map an HTTP status code to the exception it stands for.
+
+    Args:
+        status_code: HTTP status code of the response.
+        text: Response body, used in the message of generic errors.
+
+    Returns:
+        The exception to raise, or None for a successful response.
+    """
+    if status_code == 404:
+        return NotFoundError("Resource not found")
+    if status_code == 429:
+        return RateLimitError()
+    if status_code == 401:
+        return AuthenticationError()
+    if status_code >= 500:
+        return ServerError(f"Server error: {status_code}", status_code=status_code)
+    if status_code >= 400:
+        return APIError(f"API error: {text}", status_code=status_code)
+    return None
+
+
+def _require_email(email: str) -> None:
+    if not validate_email(email):
+        raise ValidationError(f"Invalid email format: {email}")
+
+
+def check_email(
+    email: str, plus: bool = False
+) -> Operation[EmailBreachResponse | EmailBreachDetailedResponse]:
+    """Check whether an email address appears in known breaches.
+
+    Args:
+        email: The email address to check.
+        plus: Use the Plus API (requires an API key) for detailed results.
+
+    Raises:
+        ValidationError: If email format is invalid.
+    """
+    _require_email(email)
+    if plus:
+        return Operation(
+            "GET",
+            f"/v3/check-email/{email}",
+            parse=EmailBreachDetailedResponse.from_api_response,
+            params={"detailed": "true"},
+            base_url=PLUS_API_BASE,
+            name="check_email_plus",
+        )
+    return Operation(
+        "GET",
+        f"/v1/check-email/{email}",
+        parse=EmailBreachResponse.from_api_response,
+        name="check_email",
+    )
+
+
+def _parse_breach_ids(data: dict[str, Any]) -> EmailBreachResponse:
+    # Compact responses list breach IDs, either bare or as objects
+    breaches = data.get("breaches", [])
+    return EmailBreachResponse(
+        breaches=[b.get("breach_id", "") if isinstance(b, dict) else b for b in breaches]
+    )
+
+
+def check_email_compact(email: str) -> Operation[EmailBreachResponse]:
+    """Check an email address on the Plus API, returning breach IDs only.
+
+    Raises:
+        ValidationError: If email format is invalid.
+    """
+    _require_email(email)
+    return Operation(
+        "GET",
+        f"/v3/check-email/{email}",
+        parse=_parse_breach_ids,
+        params={"detailed": "false"},
+        base_url=PLUS_API_BASE,
+        name="check_email_compact",
+    )
+
+
+def breach_analytics(email: str) -> Operation[BreachAnalyticsResponse]:
+    """Get breach analytics for an email address.
+
+    Raises:
+        ValidationError: If email format is invalid.
+    """
+    _require_email(email)
+    return Operation(
+        "GET",
+        "/v1/breach-analytics",
+        parse=BreachAnalyticsResponse.from_api_response,
+        params={"email": email},
+        name="breach_analytics",
+    )
+
+
+def _parse_breaches(data: dict[str, Any]) -> list[Breach]:
+    # API returns {"exposedBreaches": [...]}
+    return [Breach.from_dict(b) for b in data.get("exposedBreaches", [])]
+
+
+def list_breaches(domain: str | None = None) -> Operation[list[Breach]]:
+    """List known breaches, optionally filtered by domain."""
+    return Operation(
+        "GET",
+        "/v1/breaches",
+        parse=_parse_breaches,
+        params={"domain": domain} if domain else None,
+        name="get_breaches",
+    )
+
+
+def _raw(data: dict[str, Any]) -> dict[str, Any]:
+    return data
+
+
+def sync_catalog() -> Operation[dict[str, Any]]:
+    """Fetch the breach catalog unparsed, for CatalogSync to compare records."""
+    return Operation(
+        "GET",
+        "/v1/breaches",
+        parse=_raw,
+        name="sync_catalog",
+        conditional=True,
+    )
+
+
+def check_password_prefix(hash_prefix: str) -> Operation[PasswordCheckResponse]:
+    """Look up a Keccak-512 hash prefix in the password API."""
+    return Operation(
+        "GET",
+        f"/v1/pass/anon/{hash_prefix}",
+        parse=PasswordCheckResponse.from_api_response,
+        base_url=PASSWORD_API_BASE,
+        name="check_password",
+    )
+
+
+def check_password(password: str) -> Operation[PasswordCheckResponse]:
+    """Check a password using k-anonymity.
+
+    The password is hashed locally; only the first 10 characters of its
+    Keccak-512 hash end up in the request.
+    """
+    return check_password_prefix(hash_password_keccak512(password))
@@ -0,0 +1,263 @@
+"""Client-side accounting of hourly and daily request quotas.
+
+Besides the per-second limit, the free API enforces hourly and daily caps,
+and Plus plans have their own quotas. A QuotaTracker counts requests in
+rolling one-hour and one-day windows (persisted between runs if a path is
+given) so that a long job learns it is about to run out before it starts
+collecting 429 responses:
+
+- NORMAL and INTERACTIVE requests fail fast with QuotaExceededError once a
+  window is used up.
+- BULK requests are paced so that they spread evenly across the window,
+  and they leave a reserve (10% by default) for other requests.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from typing import Iterator
+
+from .exceptions import QuotaExceededError
+from .models import QuotaStatus
+from .scheduler import Priority, current_priority
+
+HOUR = 3600.0
+DAY = 86400.0
+_BUCKET = 60.0  # Requests are counted per minute
+
+
+class QuotaTracker:
+    """Tracks requests against rolling hourly and daily limits.
+
+    Example:
+        >>> from xposedornot import QuotaTracker, XposedOrNot
+        >>> quota = QuotaTracker(hourly_limit=100, daily_limit=1000, path="xon-quota.json")
+        >>> xon = XposedOrNot(quota=quota)
+        >>> xon.remaining_quota().daily_remaining
+        1000
+    """
+
+    DEFAULT_RESERVE = 0.1  # Share of each window kept free of BULK requests
+    SAVE_INTERVAL = 10.0  # Seconds between automatic saves
+
+    def __init__(
+        self,
+        hourly_limit: int | None = None,
+        daily_limit: int | None = None,
+        path: str | os.PathLike[str] | None = None,
+        reserve: float = DEFAULT_RESERVE,
+    ):
+        """Initialize the quota tracker.
+
+        Args:
+            hourly_limit: Maximum requests per rolling hour, if any.
+            daily_limit: Maximum requests per rolling 24 hours, if any.
+            path: Optional JSON file the counters are loaded from and saved
+                  to, so the budget carries over between runs.
+            reserve: Share of each window that BULK requests leave unused.
+        """
+        if not 0 <= reserve < 1:
+            raise ValueError("reserve must be in [0, 1)")
+
+        self.hourly_limit = hourly_limit
+        self.daily_limit = daily_limit
+        self._path = os.fspath(path) if path is not None else None
+        self._reserve = reserve
+        # [minute, count] pairs, oldest first
+        self._buckets: deque[list[int]] = deque()
+        self._next_bulk = 0.0
+        self._last_save = 0.0
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # Keeps snapshots written in order
+
+        if self._path and os.path.exists(self._path):
+            self.load()
+
+    def _windows(self) -> Iterator[tuple[int, float]]:
+        if self.hourly_limit is not None:
+            yield self.hourly_limit, HOUR
+        if self.daily_limit is not None:
+            yield self.daily_limit, DAY
+
+    def _prune(self, now: float) -> None:
+        oldest = int((now - DAY) // _BUCKET)
+        while self._buckets and self._buckets[0][0] <= oldest:
+            self._buckets.popleft()
+
+    def _used(self, now: float, window: float) -> int:
+        first = int((now - window) // _BUCKET)
+        return sum(count for minute, count in self._buckets if minute > first)
+
+    def _retry_after(self, now: float, headroom: float = 0.0) -> float:
+        """Seconds until every window has room for one more request."""
+        wait = 0.0
+        for limit, window in self._windows():
+            allowed = limit - math.ceil(limit * headroom)
+            used = self._used(now, window)
+            if used < allowed:
+                continue
+            first = int((now - window) // _BUCKET)
+            for minute, count in self._buckets:
+                if minute <= first:
+                    continue
+                used -= count
+                if used < allowed:
+                    wait = max(wait, (minute + 1) * _BUCKET + window - now)
+                    break
+            else:  # allowed is 0 - this window never has room
+                return math.inf
+        return wait
+
+    def _bulk_interval(self) -> float:
+        """Spacing that spreads BULK requests evenly across each window."""
+        intervals = [
+            window / max(limit - math.ceil(limit * self._reserve), 1)
+            for limit, window in self._windows()
+        ]
+        return max(intervals, default=0.0)
+
+    def _count(self, now: float, count: int) -> bool:
+        """Add requests to the current minute; return whether a save is due.
+
+        Must be called with the lock held.
+        """
+        minute = int(now // _BUCKET)
+        if self._buckets and self._buckets[-1][0] == minute:
+            self._buckets[-1][1] += count
+        else:
+            self._buckets.append([minute, count])
+        if self._path is None or now - self._last_save < self.SAVE_INTERVAL:
+            return False
+        # Claimed here, so concurrent callers do not all decide to save
+        self._last_save = now
+        return True
+
+    def acquire(self, priority: Priority | None = None, timeout: float | None = None) -> float:
+        """Wait until the quota allows another request, and reserve it.
+
+        The request is counted as soon as it is admitted, so concurrent
+        callers cannot all pass on the last free slot. Call release() if
+        the request ends up not being sent.
+
+        Args:
+            priority: Priority class. Defaults to the current context's priority.
+            timeout: Maximum seconds a BULK request may wait. None waits as
+                     long as needed.
+
+        Returns:
+            Number of seconds spent waiting.
+
+        Raises:
+            QuotaExceededError: If a window is used up and the request is not
+                BULK (BULK requests wait instead).
+            TimeoutError: If a BULK request would wait longer than timeout.
+        """
+        priority = Priority(current_priority() if priority is None else priority)
+
+        with self._lock:
+            now = time.time()
+            self._prune(now)
+            if priority is Priority.BULK:
+                wait = self._retry_after(now, headroom=self._reserve)
+                if math.isinf(wait):
+                    raise QuotaExceededError("Quota leaves no room for bulk requests")
+                slot = max(now + wait, self._next_bulk)
+                if timeout is not None and slot - now > timeout:
+                    raise TimeoutError(f"Quota pacing delays the request by {slot - now:.0f}s")
+                self._next_bulk = slot + self._bulk_interval()
+            else:
+                wait = self._retry_after(now)
+                if wait > 0:
+                    raise QuotaExceededError(
+                        f"Request quota exhausted; retry in {wait:.0f}s", retry_after=wait
+                    )
+                slot = now
+            save = self._count(now, 1)
+
+        if save:
+            self.save()
+        if slot > now:
+            time.sleep(slot - now)
+        return max(slot - now, 0.0)
+
+    def record(self, count: int = 1) -> None:
+        """Count requests that were sent to the API without acquire()."""
+        with self._lock:
+            save = self._count(time.time(), count)
+        if save:
+            self.save()
+
+    def release(self, count: int = 1) -> None:
+        """Give back requests reserved by acquire() that were not sent."""
+        with self._lock:
+            for bucket in reversed(self._buckets):
+                taken = min(bucket[1], count)
+                bucket[1] -= taken
+                count -= taken
+                if not count:
+                    break
+
+    def status(self) -> QuotaStatus:
+        """Report usage and remaining budget in each window."""
+        with self._lock:
+            now = time.time()
+            self._prune(now)
+            hourly_used = self._used(now, HOUR)
+            daily_used = self._used(now, DAY)
+            retry_after = self._retry_after(now)
+
+        return QuotaStatus(
+            hourly_limit=self.hourly_limit,
+            hourly_used=hourly_used,
+            hourly_remaining=(
+                None if self.hourly_limit is None else max(self.hourly_limit - hourly_used, 0)
+            ),
+            daily_limit=self.daily_limit,
+            daily_used=daily_used,
+            daily_remaining=(
+                None if self.daily_limit is None else max(self.daily_limit - daily_used, 0)
+            ),
+            retry_after=retry_after,
+        )
+
+    def save(self) -> None:
+        """Write the counters to the configured path (atomically)."""
+        if self._path is None:
+            return
+        with self._save_lock:
+            with self._lock:
+                self._last_save = time.time()
+                payload = {"buckets": [list(b) for b in self._buckets]}
+            fd, tmp = tempfile.mkstemp(
+                prefix=f"{os.path.basename(self._path)}.",
+                suffix=".tmp",
+                dir=os.path.dirname(self._path) or ".",
+            )
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(payload, f)
+                os.replace(tmp, self._path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+
+    def load(self) -> None:
+        """Read counters previously written by save()."""
+        if self._path is None:
+            return
+        with open(self._path) as f:
+            payload = json.load(f)
+        with self._lock:
+            self._buckets = deque([int(m), int(c)] for m, c in payload.get("buckets", []))
+            self._prune(time.time())
+
+    def _after_fork(self) -> None:
+        """Reset state that must not be shared with a forked child."""
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
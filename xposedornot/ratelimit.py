@@ -0,0 +1,172 @@
+"""Client-side rate limiters for the free API.
+
+RateLimiter spaces requests made from one process. SharedRateLimiter keeps
+the same schedule in a SQLite database so that every process on a host
+(for example the workers of a multiprocessing pool) stays within the
+free-tier limit together.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from .utils import connect_sqlite
+
+
+class RateLimiter:
+    """Spaces requests at least min_interval seconds apart within a process.
+
+    Safe to use from several threads: each caller reserves the next free
+    slot under a lock and then sleeps outside it.
+    """
+
+    def __init__(self, min_interval: float = 1.0):
+        """Initialize the rate limiter.
+
+        Args:
+            min_interval: Minimum number of seconds between requests.
+        """
+        self.min_interval = min_interval
+        self._last_request_time = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float | None = None) -> float:
+        """Wait for the next request slot.
+
+        Args:
+            timeout: Maximum seconds to wait. None waits as long as needed.
+
+        Returns:
+            Number of seconds spent waiting.
+
+        Raises:
+            TimeoutError: If the next slot is more than timeout seconds
+                away. No slot is reserved then.
+        """
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._last_request_time + self.min_interval)
+            _check_timeout(slot - now, timeout)
+            self._last_request_time = slot
+
+        if slot > now:
+            time.sleep(slot - now)
+        return max(slot - now, 0.0)
+
+    def release(self) -> None:
+        """Record that a request has completed.
+
+        The next slot is counted from the later of the reserved start time
+        and the completion time, so slow responses do not lead to bursts.
+        """
+        with self._lock:
+            self._last_request_time = max(self._last_request_time, time.time())
+
+    def _after_fork(self) -> None:
+        """Reset state that must not be shared with a forked child."""
+        self._lock = threading.Lock()
+
+
+class SharedRateLimiter(RateLimiter):
+    """A rate limiter coordinated across processes through a SQLite file.
+
+    Every process that opens the same database path shares one request
+    schedule. The database runs in WAL mode and each reservation is a short
+    write transaction, so the cost per request is a few microseconds of
+    local I/O.
+
+    Example:
+        >>> from xposedornot import SharedRateLimiter, XposedOrNot
+        >>> def worker_init():
+        ...     global xon
+        ...     xon = XposedOrNot(rate_limiter=SharedRateLimiter("/tmp/xon.sqlite"))
+    """
+
+    def __init__(self, path: str | os.PathLike[str], min_interval: float = 1.0, name: str = "free"):
+        """Initialize the shared rate limiter.
+
+        Args:
+            path: Path of the SQLite database shared by all processes.
+            min_interval: Minimum number of seconds between requests.
+            name: Schedule name, so one database can hold several limiters.
+        """
+        super().__init__(min_interval)
+        self._path = os.fspath(path)
+        self._name = name
+        self._conn: sqlite3.Connection | None = None
+        self._pid = os.getpid()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Connections and locks cannot be pickled; they are reopened on use
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._conn = connect_sqlite(self._path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits (name TEXT PRIMARY KEY, last REAL NOT NULL)"
+            )
+        return self._conn
+
+    def acquire(self, timeout: float | None = None) -> float:
+        with self._lock:
+            conn = self._connection()
+            now = time.time()
+            with _immediate(conn):
+                row = conn.execute(
+                    "SELECT last FROM rate_limits WHERE name = ?", (self._name,)
+                ).fetchone()
+                slot = now if row is None else max(now, row[0] + self.min_interval)
+                _check_timeout(slot - now, timeout)
+                conn.execute(
+                    "INSERT OR REPLACE INTO rate_limits (name, last) VALUES (?, ?)",
+                    (self._name, slot),
+                )
+
+        if slot > now:
+            time.sleep(slot - now)
+        return max(slot - now, 0.0)
+
+    def release(self) -> None:
+        with self._lock:
+            conn = self._connection()
+            with _immediate(conn):
+                conn.execute(
+                    "UPDATE rate_limits SET last = MAX(last, ?) WHERE name = ?",
+                    (time.time(), self._name),
+                )
+
+    def _after_fork(self) -> None:
+        super()._after_fork()
+        # The parent's connection must not be used in the child
+        self._conn = None
+
+
+def _check_timeout(wait: float, timeout: float | None) -> None:
+    if timeout is not None and wait > timeout:
+        raise TimeoutError(f"Next request slot is {wait:.2f}s away")
+
+
+@contextmanager
+def _immediate(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run a block inside a BEGIN IMMEDIATE (write-locked) transaction."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
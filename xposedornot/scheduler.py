@@ -0,0 +1,174 @@
+"""Priority scheduling of requests under the client-side rate limit.
+
+When one client serves both latency-sensitive checks and background bulk
+work, requests wait for rate-limiter slots in priority order instead of
+first come, first served:
+
+- INTERACTIVE requests always get the next available slot.
+- NORMAL and BULK requests share the remaining slots by weighted fair
+  queuing (4:1 by default), so bulk work soaks up spare capacity without
+  being starved completely.
+
+The priority of a request is taken from the calling context; see
+XposedOrNot.priority().
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Iterator, Mapping
+
+from .ratelimit import RateLimiter
+
+
+class Priority(IntEnum):
+    """Priority classes for API requests (lower value is more urgent)."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BULK = 2
+
+
+_current_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "xposedornot_priority", default=Priority.NORMAL
+)
+
+
+def current_priority() -> Priority:
+    """Return the priority of requests made from the current context."""
+    return _current_priority.get()
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Run the enclosed requests at the given priority.
+
+    The priority follows the current thread or asyncio task. Worker threads
+    started with contextvars.copy_context() inherit it.
+    """
+    token = _current_priority.set(Priority(priority))
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def context_with_priority(priority: Priority) -> contextvars.Context:
+    """Return a copy of the current context with the given request priority.
+
+    Useful for running work in other threads, e.g.
+    executor.submit(context.copy().run, fn).
+    """
+    context = contextvars.copy_context()
+    context.run(_current_priority.set, Priority(priority))
+    return context
+
+
+class RequestScheduler:
+    """Hands out rate-limiter slots by priority class.
+
+    Only one caller at a time waits on the underlying limiter; the others
+    queue here, and whoever the policy picks next is the one to take the
+    following slot. An INTERACTIVE request therefore waits for at most the
+    slot currently being waited on.
+    """
+
+    DEFAULT_WEIGHTS: Mapping[Priority, float] = {Priority.NORMAL: 4.0, Priority.BULK: 1.0}
+
+    def __init__(self, limiter: RateLimiter, weights: Mapping[Priority, float] | None = None):
+        """Initialize the scheduler.
+
+        Args:
+            limiter: The rate limiter slots are taken from.
+            weights: Relative shares of NORMAL and BULK requests when both
+                     are queued. INTERACTIVE requests are always served first.
+        """
+        self._limiter = limiter
+        self._weights = dict(weights or self.DEFAULT_WEIGHTS)
+        self._cond = threading.Condition()
+        self._queues: dict[Priority, deque[object]] = {p: deque() for p in Priority}
+        self._virtual: dict[Priority, float] = dict.fromkeys(Priority, 0.0)
+        self._clock = 0.0
+        self._busy = False
+
+    def acquire(self, priority: Priority | None = None, timeout: float | None = None) -> float:
+        """Wait for a request slot.
+
+        Args:
+            priority: Priority class. Defaults to the current context's priority.
+            timeout: Maximum seconds to wait. None waits as long as needed.
+
+        Returns:
+            Number of seconds spent waiting, in the queue and on the limiter.
+
+        Raises:
+            TimeoutError: If no slot can be had within timeout. The request
+                leaves the queue without taking a slot.
+        """
+        priority = Priority(current_priority() if priority is None else priority)
+        ticket = object()
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+
+        with self._cond:
+            self._queues[priority].append(ticket)
+            while self._busy or self._next_ticket() is not ticket:
+                wait = None if deadline is None else deadline - time.monotonic()
+                if wait is not None and wait <= 0:
+                    self._queues[priority].remove(ticket)
+                    self._cond.notify_all()
+                    raise TimeoutError("No request slot became available in time")
+                self._cond.wait(wait)
+            self._queues[priority].popleft()
+            if priority is not Priority.INTERACTIVE:
+                self._charge(priority)
+            self._busy = True
+
+        try:
+            if deadline is None:
+                self._limiter.acquire()
+            else:
+                self._limiter.acquire(max(deadline - time.monotonic(), 0.0))
+        finally:
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+        return time.monotonic() - start
+
+    def release(self) -> None:
+        """Record that a request has completed."""
+        self._limiter.release()
+
+    def queued(self) -> dict[Priority, int]:
+        """Return the number of requests waiting in each priority class."""
+        with self._cond:
+            return {p: len(q) for p, q in self._queues.items()}
+
+    def _next_ticket(self) -> object | None:
+        if self._queues[Priority.INTERACTIVE]:
+            return self._queues[Priority.INTERACTIVE][0]
+
+        waiting = [p for p in (Priority.NORMAL, Priority.BULK) if self._queues[p]]
+        if not waiting:
+            return None
+        chosen = min(waiting, key=lambda p: (max(self._virtual[p], self._clock), p))
+        return self._queues[chosen][0]
+
+    def _charge(self, priority: Priority) -> None:
+        # Start-time fair queuing: an idle class cannot bank credit for later
+        start = max(self._virtual[priority], self._clock)
+        self._clock = start
+        self._virtual[priority] = start + 1.0 / self._weights.get(priority, 1.0)
+
+    def _after_fork(self) -> None:
+        """Reset state that must not be shared with a forked child."""
+        self._cond = threading.Condition()
+        self._queues = {p: deque() for p in Priority}
+        self._busy = False
+        self._limiter._after_fork()
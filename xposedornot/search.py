@@ -0,0 +1,163 @@
+"""In-process full-text index over breach descriptions.
+
+BreachTextIndex maps each term to the documents (breach IDs) containing
+it, with term positions for phrase queries. A query is answered by
+intersecting posting lists, without scanning the descriptions. update()
+re-indexes only the breaches whose text changed, so an index kept across
+catalog refreshes costs little to maintain.
+
+Queries are case-insensitive. Bare words must all occur; quoted phrases
+must occur as consecutive words:
+
+Example:
+    >>> index = BreachTextIndex()
+    >>> index.update(xon.get_breaches())
+    >>> index.search('plaintext "api key"')
+    ['SomeBreach']
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from typing import Iterable
+
+from .models import Breach
+
+_TOKEN = re.compile(r"\w+")
+_QUERY = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN.findall(text.casefold())
+
+
+def breach_text(breach: Breach) -> str:
+    """Text indexed for a catalog breach: its description and industry."""
+    return f"{breach.exposure_description}\n{breach.industry}"
+
+
+class BreachTextIndex:
+    """An inverted index of breach texts, keyed by breach ID."""
+
+    def __init__(self) -> None:
+        # term -> {doc_id: positions}
+        self._postings: dict[str, dict[str, tuple[int, ...]]] = {}
+        # doc_id -> (hash of the indexed text, its distinct terms)
+        self._docs: dict[str, tuple[int, frozenset[str]]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._docs
+
+    def add(self, doc_id: str, text: str) -> bool:
+        """Index a document, replacing an earlier version with the same ID.
+
+        Also usable for texts outside the catalog, such as the details of
+        BreachDetails results.
+
+        Returns:
+            True if the document was new or changed, False if unchanged.
+        """
+        digest = hash(text)
+        with self._lock:
+            current = self._docs.get(doc_id)
+            if current is not None and current[0] == digest:
+                return False
+            if current is not None:
+                self._remove(doc_id, current[1])
+
+            positions: dict[str, list[int]] = {}
+            for position, term in enumerate(tokenize(text)):
+                positions.setdefault(term, []).append(position)
+            for term, offsets in positions.items():
+                self._postings.setdefault(term, {})[doc_id] = tuple(offsets)
+            self._docs[doc_id] = (digest, frozenset(positions))
+        return True
+
+    def remove(self, doc_id: str) -> None:
+        """Remove a document from the index, if present."""
+        with self._lock:
+            current = self._docs.get(doc_id)
+            if current is not None:
+                self._remove(doc_id, current[1])
+
+    def _remove(self, doc_id: str, terms: frozenset[str]) -> None:
+        for term in terms:
+            docs = self._postings[term]
+            del docs[doc_id]
+            if not docs:
+                del self._postings[term]
+        del self._docs[doc_id]
+
+    def update(self, breaches: Iterable[Breach]) -> tuple[int, int]:
+        """Bring the index in line with a (new) catalog.
+
+        Breaches whose text is unchanged are skipped; breaches no longer in
+        the catalog are removed.
+
+        Args:
+            breaches: Every breach of the catalog.
+
+        Returns:
+            (re-indexed, removed) document counts.
+        """
+        with self._lock:
+            seen = set()
+            changed = 0
+            for breach in breaches:
+                seen.add(breach.breach_id)
+                changed += self.add(breach.breach_id, breach_text(breach))
+            stale = [doc_id for doc_id in self._docs if doc_id not in seen]
+            for doc_id in stale:
+                self.remove(doc_id)
+        return changed, len(stale)
+
+    def search(self, query: str) -> list[str]:
+        """Find the documents matching every word and phrase of a query.
+
+        Args:
+            query: Words and "quoted phrases", e.g. 'plaintext "api key"'.
+
+        Returns:
+            Matching document IDs, sorted.
+        """
+        words: list[str] = []
+        phrases: list[list[str]] = []
+        for phrase, word in _QUERY.findall(query):
+            terms = tokenize(phrase or word)
+            if len(terms) > 1:
+                phrases.append(terms)
+            else:
+                words.extend(terms)
+        for terms in phrases:
+            words.extend(terms)
+        if not words:
+            return []
+
+        with self._lock:
+            postings: list[dict[str, tuple[int, ...]]] = []
+            for term in set(words):
+                docs = self._postings.get(term)
+                if not docs:
+                    return []
+                postings.append(docs)
+            # Intersect starting from the rarest term
+            postings.sort(key=len)
+            matches = set(postings[0])
+            for docs in postings[1:]:
+                matches.intersection_update(docs)
+            for terms in phrases:
+                matches = {doc_id for doc_id in matches if self._has_phrase(doc_id, terms)}
+        return sorted(matches)
+
+    def _has_phrase(self, doc_id: str, terms: list[str]) -> bool:
+        following = [set(self._postings[term][doc_id]) for term in terms[1:]]
+        return any(
+            all(start + i in positions for i, positions in enumerate(following, 1))
+            for start in self._postings[terms[0]][doc_id]
+        )
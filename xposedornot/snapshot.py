@@ -0,0 +1,454 @@
+"""Binary snapshots of the breach catalog.
+
+A snapshot holds the parsed catalog and its indexes in one flat buffer
+that is queried in place, so a process can memory-map a snapshot written
+by another and answer lookups immediately - no download, JSON parsing or
+index building - with the pages shared between all processes mapping it.
+Breach objects are only created for the records a query returns.
+SharedBreachCatalog holds the same format in a named shared memory segment
+instead of a file.
+
+Layout (little-endian, sections 8-byte aligned):
+
+- header: magic, version, record count, fetch time and section offsets
+- records: one fixed-width RECORD per breach, in catalog order
+- ids: (key, record) pairs sorted by casefolded breach ID
+- domains: (key, record) pairs sorted by normalized domain, then record
+- times: breach timestamps in ascending order, then their record numbers
+- strings: UTF-8 string table; keys and text fields are (offset, length)
+  references into it
+"""
+
+from __future__ import annotations
+
+import math
+import mmap
+import multiprocessing
+import os
+import struct
+import tempfile
+import threading
+from bisect import bisect_left
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Iterator
+
+from .catalog import BreachCatalog, When, _timestamp, normalize_domain
+from .models import Breach
+from .utils import BytesLike
+
+MAGIC = b"XONCAT\x00\x00"
+VERSION = 1
+
+# magic, version, record count, fetched_at, then offset and entry count (or
+# size) of the records, ids, domains, times and strings sections
+HEADER = struct.Struct("<8sIId9Q")
+# 9 string refs, exposed_records, breached timestamp (NaN if none), flags
+RECORD = struct.Struct("<18IqdB7x")
+INDEX_ENTRY = struct.Struct("<III")
+
+# Separates the items of Breach.exposed_data in the string table
+_LIST_SEPARATOR = "\x1f"
+_SEARCHABLE, _SENSITIVE, _VERIFIED = 1, 2, 4
+
+# Names of the shared memory segments created by this process
+_created: set[str] = set()
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self._refs: dict[str, tuple[int, int]] = {}
+
+    def ref(self, value: str) -> tuple[int, int]:
+        ref = self._refs.get(value)
+        if ref is None:
+            encoded = value.encode("utf-8")
+            ref = (len(self.data), len(encoded))
+            self.data += encoded
+            self._refs[value] = ref
+        return ref
+
+
+def dumps(catalog: BreachCatalog) -> bytes:
+    """Serialize a catalog and its indexes into snapshot bytes."""
+    breaches = list(catalog)
+    strings = _StringTable()
+
+    records = bytearray()
+    timestamps: list[tuple[float, int]] = []
+    ids: dict[str, int] = {}
+    domains: list[tuple[bytes, int, tuple[int, int]]] = []
+
+    for number, breach in enumerate(breaches):
+        refs: list[int] = []
+        for value in (
+            breach.breach_id,
+            breach.breached_date,
+            breach.domain,
+            _LIST_SEPARATOR.join(breach.exposed_data),
+            breach.exposure_description,
+            breach.industry,
+            breach.logo,
+            breach.password_risk,
+            breach.reference_url,
+        ):
+            refs.extend(strings.ref(value))
+        breached_at = breach.breached_at
+        timestamp = breached_at.timestamp() if breached_at else math.nan
+        flags = (
+            (_SEARCHABLE if breach.searchable else 0)
+            | (_SENSITIVE if breach.sensitive else 0)
+            | (_VERIFIED if breach.verified else 0)
+        )
+        records += RECORD.pack(*refs, breach.exposed_records or 0, timestamp, flags)
+
+        if breached_at:
+            timestamps.append((timestamp, number))
+        # Later duplicates win, as in BreachCatalog
+        ids[breach.breach_id.casefold()] = number
+        if breach.domain:
+            key = normalize_domain(breach.domain)
+            domains.append((key.encode("utf-8"), number, strings.ref(key)))
+
+    id_index = sorted((key.encode("utf-8"), n, strings.ref(key)) for key, n in ids.items())
+    domains.sort()
+    timestamps.sort()
+
+    def entries(index: list[tuple[bytes, int, tuple[int, int]]]) -> bytes:
+        return b"".join(INDEX_ENTRY.pack(*ref, number) for _, number, ref in index)
+
+    sections = [
+        bytes(records),
+        entries(id_index),
+        entries(domains),
+        struct.pack(f"<{len(timestamps)}d", *(t for t, _ in timestamps))
+        + struct.pack(f"<{len(timestamps)}I", *(n for _, n in timestamps)),
+        bytes(strings.data),
+    ]
+    offsets = []
+    body = bytearray(_align(HEADER.size))
+    for section in sections:
+        body += bytes(_align(len(body)) - len(body))
+        offsets.append(len(body))
+        body += section
+
+    records_at, ids_at, domains_at, times_at, strings_at = offsets
+    HEADER.pack_into(
+        body,
+        0,
+        MAGIC,
+        VERSION,
+        len(breaches),
+        catalog.fetched_at,
+        records_at,
+        ids_at,
+        len(id_index),
+        domains_at,
+        len(domains),
+        times_at,
+        len(timestamps),
+        strings_at,
+        len(strings.data),
+    )
+    return bytes(body)
+
+
+def save(catalog: BreachCatalog, path: str | os.PathLike[str]) -> None:
+    """Write a catalog snapshot to a file (atomically)."""
+    path = os.fspath(path)
+    data = dumps(catalog)
+    fd, tmp = tempfile.mkstemp(
+        prefix=f"{os.path.basename(path)}.", suffix=".tmp", dir=os.path.dirname(path) or "."
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load(path: str | os.PathLike[str]) -> MappedBreachCatalog:
+    """Memory-map a catalog snapshot written by save().
+
+    Raises:
+        ValueError: If the file is not a catalog snapshot of this version.
+    """
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return MappedBreachCatalog(buffer, on_close=buffer.close)
+    except ValueError:
+        buffer.close()
+        raise
+
+
+class MappedBreachCatalog(BreachCatalog):
+    """A read-only BreachCatalog queried in place from snapshot bytes.
+
+    Supports the full BreachCatalog API. Call close() (or use it as a
+    context manager) to release the underlying buffer.
+
+    Example:
+        >>> from xposedornot import snapshot
+        >>> snapshot.save(xon.get_breach_catalog(), "catalog.xon")
+        >>> with snapshot.load("catalog.xon") as catalog:  # in another process
+        ...     catalog.by_domain("adobe.com")
+    """
+
+    def __init__(self, buffer: BytesLike | mmap.mmap, on_close: Callable[[], None] | None = None):
+        """Attach to snapshot bytes.
+
+        Args:
+            buffer: The snapshot (bytes, mmap, shared memory buffer, ...).
+            on_close: Called by close() after the views are released.
+
+        Raises:
+            ValueError: If the buffer is not a catalog snapshot of this version.
+        """
+        view = memoryview(buffer)
+        if len(view) < HEADER.size:
+            view.release()
+            raise ValueError("Not a breach catalog snapshot")
+        (
+            magic,
+            version,
+            self._count,
+            fetched_at,
+            records_at,
+            ids_at,
+            self._id_entries,
+            domains_at,
+            self._domain_entries,
+            times_at,
+            dated,
+            strings_at,
+            strings_size,
+        ) = HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            view.release()
+            raise ValueError("Not a breach catalog snapshot (or unsupported version)")
+
+        self.fetched_at = fetched_at
+        self._view = view
+        self._records_at = records_at
+        self._ids_at = ids_at
+        self._domains_at = domains_at
+        self._strings = view[strings_at : strings_at + strings_size]
+        self._times_view = view[times_at : times_at + 8 * dated].cast("d")
+        self._time_records = view[times_at + 8 * dated : times_at + 12 * dated].cast("I")
+        self._on_close = on_close
+
+        self._first_by_domain = None
+        self._text_index = None
+        self._text_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Release the buffer. The catalog cannot be used afterwards."""
+        for view in (self._times_view, self._time_records, self._strings, self._view):
+            view.release()
+        if self._on_close is not None:
+            self._on_close()
+            self._on_close = None
+
+    def __enter__(self) -> MappedBreachCatalog:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    # Decoding
+
+    def _string(self, offset: int, length: int) -> str:
+        return str(self._strings[offset : offset + length], "utf-8")
+
+    def _fields(self, number: int) -> tuple[Any, ...]:
+        return RECORD.unpack_from(self._view, self._records_at + number * RECORD.size)
+
+    def _record(self, number: int) -> Breach:
+        fields = self._fields(number)
+        text = [self._string(fields[i], fields[i + 1]) for i in range(0, 18, 2)]
+        exposed_records, _, flags = fields[18:]
+        return Breach(
+            breach_id=text[0],
+            breached_date=text[1],
+            domain=text[2],
+            exposed_data=text[3].split(_LIST_SEPARATOR) if text[3] else [],
+            exposed_records=exposed_records,
+            exposure_description=text[4],
+            industry=text[5],
+            logo=text[6],
+            password_risk=text[7],
+            reference_url=text[8],
+            searchable=bool(flags & _SEARCHABLE),
+            sensitive=bool(flags & _SENSITIVE),
+            verified=bool(flags & _VERIFIED),
+        )
+
+    def _entry(self, index_at: int, position: int) -> tuple[bytes, int]:
+        offset, length, number = INDEX_ENTRY.unpack_from(
+            self._view, index_at + position * INDEX_ENTRY.size
+        )
+        return bytes(self._strings[offset : offset + length]), number
+
+    def _find(self, index_at: int, entries: int, key: str) -> Iterator[int]:
+        """Record numbers of the entries with the given key, by binary search."""
+        needle = key.encode("utf-8")
+        lo, hi = 0, entries
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._entry(index_at, mid)[0] < needle:
+                lo = mid + 1
+            else:
+                hi = mid
+        while lo < entries:
+            found, number = self._entry(index_at, lo)
+            if found != needle:
+                break
+            yield number
+            lo += 1
+
+    def _id_number(self, breach_id: str) -> int | None:
+        return next(self._find(self._ids_at, self._id_entries, breach_id.casefold()), None)
+
+    # BreachCatalog API
+
+    def __len__(self) -> int:
+        return int(self._count)
+
+    def __iter__(self) -> Iterator[Breach]:
+        return map(self._record, range(self._count))
+
+    def __contains__(self, breach_id: object) -> bool:
+        if not isinstance(breach_id, str):
+            return False
+        return self._id_number(breach_id) is not None
+
+    @property
+    def breaches(self) -> list[Breach]:
+        return list(self)
+
+    def get(self, breach_id: str) -> Breach | None:
+        number = self._id_number(breach_id)
+        return None if number is None else self._record(number)
+
+    def by_domain(self, domain: str) -> list[Breach]:
+        key = normalize_domain(domain)
+        return [self._record(n) for n in self._find(self._domains_at, self._domain_entries, key)]
+
+    def between(self, start: When | None = None, end: When | None = None) -> list[Breach]:
+        times = self._times_view
+        lo = 0 if start is None else bisect_left(times, _timestamp(start))
+        hi = len(times) if end is None else bisect_left(times, _timestamp(end))
+        return [self._record(n) for n in self._time_records[lo:hi]]
+
+    def _first_index(self) -> dict[str, Breach]:
+        if self._first_by_domain is None:
+            first: dict[str, tuple[float, int]] = {}
+            for position in range(self._domain_entries):
+                key, number = self._entry(self._domains_at, position)
+                timestamp = self._fields(number)[19]
+                if math.isnan(timestamp):
+                    continue
+                domain = key.decode("utf-8")
+                if domain not in first or timestamp < first[domain][0]:
+                    first[domain] = (timestamp, number)
+            self._first_by_domain = {
+                domain: self._record(number) for domain, (_, number) in first.items()
+            }
+        return self._first_by_domain
+
+
+class SharedBreachCatalog(MappedBreachCatalog):
+    """A read-only BreachCatalog in a named shared memory segment.
+
+    One process publishes the catalog with create(); workers attach() to it
+    by name and query it in place, so the catalog occupies memory once per
+    host however many workers use it. It pickles as its name, so it can be
+    passed to pool initializers.
+
+    Example:
+        >>> shared = SharedBreachCatalog.create(xon.get_breach_catalog())
+        >>> with Pool(32, initializer=init_worker, initargs=(shared,)) as pool:
+        ...     ...
+        >>> shared.close()
+        >>> shared.unlink()
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory):
+        """Wrap an open segment holding a snapshot (use create() or attach())."""
+        super().__init__(_buffer(memory), on_close=memory.close)
+        self._memory = memory
+
+    @classmethod
+    def create(cls, catalog: BreachCatalog, name: str | None = None) -> SharedBreachCatalog:
+        """Publish a catalog in a new shared memory segment.
+
+        The segment outlives the creating process until unlink() is called.
+
+        Args:
+            catalog: The catalog to publish.
+            name: Segment name. Defaults to a random unique name.
+
+        Raises:
+            FileExistsError: If a segment with that name already exists.
+        """
+        data = dumps(catalog)
+        memory = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+        _buffer(memory)[: len(data)] = data
+        _created.add(memory.name)
+        return cls(memory)
+
+    @classmethod
+    def attach(cls, name: str) -> SharedBreachCatalog:
+        """Attach to a segment published by create(), without copying it.
+
+        Raises:
+            FileNotFoundError: If no segment has that name.
+            ValueError: If the segment does not hold a catalog snapshot.
+        """
+        memory = _attach(name)
+        try:
+            return cls(memory)
+        except ValueError:
+            memory.close()
+            raise
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory segment."""
+        return self._memory.name
+
+    def unlink(self) -> None:
+        """Remove the segment. Processes still attached keep their mapping."""
+        self._memory.unlink()
+        _created.discard(self.name)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return SharedBreachCatalog.attach, (self.name,)
+
+
+def _buffer(memory: shared_memory.SharedMemory) -> memoryview:
+    if memory.buf is None:
+        raise ValueError("Shared memory segment is closed")
+    return memory.buf
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        # Before Python 3.13 every attaching process registers the segment
+        # with its resource tracker, which unlinks it when the process exits;
+        # only the creator should own it.
+        memory = shared_memory.SharedMemory(name=name)
+        # multiprocessing children share their parent's tracker, and so does
+        # the creator itself: unregistering there would drop its registration
+        if os.name == "posix" and name not in _created and multiprocessing.parent_process() is None:
+            resource_tracker.unregister(memory._name, "shared_memory")  # type: ignore[attr-defined]
+        return memory
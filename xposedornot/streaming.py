@@ -0,0 +1,131 @@
+"""Streaming email checks with backpressure.
+
+stream_check() pulls addresses from a (sync or async) iterable only as fast
+as the client can check them: at most max_in_flight checks run at a time,
+each in a worker thread going through the client's usual rate limiter,
+scheduler and retries. Memory therefore stays bounded however fast the
+source produces.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Union,
+)
+
+from .exceptions import NotFoundError, XposedOrNotError
+from .models import BreachAnalyticsResponse, EmailBreachDetailedResponse, EmailBreachResponse
+
+if TYPE_CHECKING:
+    from .client import XposedOrNot
+
+EmailResult = Union[
+    EmailBreachResponse,
+    EmailBreachDetailedResponse,
+    BreachAnalyticsResponse,
+    XposedOrNotError,
+    None,
+]
+
+DEFAULT_MAX_IN_FLIGHT = 4
+
+
+async def _aiter(source: AsyncIterable[str] | Iterable[str]) -> AsyncIterator[str]:
+    if isinstance(source, AsyncIterable):
+        async for item in source:
+            yield item
+    else:
+        for item in source:
+            yield item
+
+
+async def stream_check(
+    client: "XposedOrNot",
+    source: AsyncIterable[str] | Iterable[str],
+    analytics: bool = False,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    return_exceptions: bool = False,
+    stop: asyncio.Event | None = None,
+) -> AsyncGenerator[tuple[str, EmailResult], None]:
+    """Check a stream of email addresses with bounded concurrency.
+
+    See XposedOrNot.stream_check() for details.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+
+    check: Callable[[str], Any] = client._email.analytics if analytics else client._email.check
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=max_in_flight)
+    items = _aiter(source).__aiter__()
+
+    in_flight: dict[asyncio.Future[Any], str] = {}
+    next_item: asyncio.Future[str] | None = None
+    stopping: asyncio.Future[Any] | None = (
+        asyncio.ensure_future(stop.wait()) if stop is not None else None
+    )
+    exhausted = False
+
+    try:
+        while True:
+            stopped = stop is not None and stop.is_set()
+            if stopped and next_item is not None:
+                next_item.cancel()
+                next_item = None
+            if next_item is None and not (exhausted or stopped) and len(in_flight) < max_in_flight:
+                next_item = asyncio.ensure_future(items.__anext__())
+
+            waiting: set[asyncio.Future[Any]] = set(in_flight)
+            if next_item is not None:
+                waiting.add(next_item)
+            if not waiting:
+                break
+            if stopping is not None and not stopping.done():
+                waiting.add(stopping)
+
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+            if next_item is not None and next_item in done:
+                try:
+                    email = next_item.result()
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    # Run in a copy of this task's context so priority() applies
+                    call = functools.partial(contextvars.copy_context().run, check, email)
+                    in_flight[loop.run_in_executor(executor, call)] = email
+                next_item = None
+
+            for future in done:
+                email_or_none = in_flight.pop(future, None)  # type: ignore[arg-type]
+                if email_or_none is None:
+                    continue
+                try:
+                    result: EmailResult = future.result()
+                except NotFoundError:
+                    result = None
+                except XposedOrNotError as e:
+                    if not return_exceptions:
+                        raise
+                    result = e
+                yield email_or_none, result
+    finally:
+        for future in in_flight:
+            future.cancel()
+        if next_item is not None:
+            next_item.cancel()
+        if stopping is not None:
+            stopping.cancel()
+        # Checks already running finish in the background; queued ones are dropped
+        executor.shutdown(wait=False)
@@ -0,0 +1,165 @@
+"""Incremental breach catalog sync.
+
+CatalogSync remembers the catalog it last saw as a content hash per
+breach ID and reports only what changed since. Polls are conditional
+(If-None-Match / If-Modified-Since) when the server sent validators, so
+an unchanged catalog costs an empty 304 response; otherwise only added
+and changed breaches are parsed into models.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import TYPE_CHECKING, Any
+
+from . import protocol
+from .deadline import request_deadline
+from .models import Breach, CatalogDiff
+
+if TYPE_CHECKING:
+    from .client import XposedOrNot
+
+
+def content_hash(data: dict[str, Any]) -> str:
+    """Hash the content of a raw breach record, independent of key order."""
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+class CatalogSync:
+    """Polls the breach catalog and reports the differences.
+
+    The first sync reports every breach as added.
+
+    Example:
+        >>> from xposedornot import CatalogSync, XposedOrNot
+        >>> sync = CatalogSync(XposedOrNot(), path="xon-catalog.json")
+        >>> diff = sync.sync()
+        >>> for breach in diff.added:
+        ...     print("new breach:", breach.breach_id)
+    """
+
+    def __init__(self, client: "XposedOrNot", path: str | os.PathLike[str] | None = None):
+        """Initialize the sync.
+
+        Args:
+            client: The client used to fetch the catalog.
+            path: Optional JSON file the snapshot is loaded from and saved
+                  to after each sync, so diffs carry over between runs.
+        """
+        self._client = client
+        self._path = os.fspath(path) if path is not None else None
+        # breach_id -> (content hash, raw record)
+        self._records: dict[str, tuple[str, dict[str, Any]]] = {}
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+
+        if self._path and os.path.exists(self._path):
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def sync(self, deadline: float | None = None) -> CatalogDiff:
+        """Fetch the catalog and compare it with the last snapshot.
+
+        Args:
+            deadline: Optional time budget in seconds for the call.
+
+        Returns:
+            CatalogDiff with the added, changed and removed breaches.
+
+        Raises:
+            RateLimitError: If rate limit is exceeded.
+            DeadlineExceeded: If the call cannot complete within the deadline.
+            APIError: For other API errors.
+        """
+        with self._lock, request_deadline(deadline):
+            headers = (
+                protocol.conditional_headers(self._etag, self._last_modified)
+                if self._records
+                else None
+            )
+            # Never answered from the response cache, which would hide new breaches
+            data = self._client._execute(protocol.sync_catalog(), refresh=True, headers=headers)
+            meta = self._client.last_response_meta
+            if meta is not None and meta.status_code == protocol.NOT_MODIFIED:
+                return CatalogDiff(unchanged=len(self._records), not_modified=True)
+
+            diff = self._apply(data.get("exposedBreaches", []))
+            response_headers = meta.headers if meta is not None else {}
+            self._etag = response_headers.get("etag")
+            self._last_modified = response_headers.get("last-modified")
+
+        if self._path is not None:
+            self.save()
+        return diff
+
+    def _apply(self, items: list[dict[str, Any]]) -> CatalogDiff:
+        diff = CatalogDiff()
+        previous = self._records
+        records: dict[str, tuple[str, dict[str, Any]]] = {}
+
+        for item in items:
+            breach_id = item.get("breachID", "")
+            digest = content_hash(item)
+            records[breach_id] = (digest, item)
+            old = previous.get(breach_id)
+            if old is None:
+                diff.added.append(Breach.from_dict(item))
+            elif old[0] != digest:
+                diff.changed.append(Breach.from_dict(item))
+            else:
+                diff.unchanged += 1
+
+        diff.removed = [
+            Breach.from_dict(item)
+            for breach_id, (_, item) in previous.items()
+            if breach_id not in records
+        ]
+        self._records = records
+        return diff
+
+    def save(self) -> None:
+        """Write the snapshot to the configured path (atomically)."""
+        if self._path is None:
+            return
+        with self._save_lock:
+            with self._lock:
+                payload = {
+                    "etag": self._etag,
+                    "last_modified": self._last_modified,
+                    "breaches": {k: list(v) for k, v in self._records.items()},
+                }
+            fd, tmp = tempfile.mkstemp(
+                prefix=f"{os.path.basename(self._path)}.",
+                suffix=".tmp",
+                dir=os.path.dirname(self._path) or ".",
+            )
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(payload, f)
+                os.replace(tmp, self._path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+
+    def load(self) -> None:
+        """Read a snapshot previously written by save()."""
+        if self._path is None:
+            return
+        with open(self._path) as f:
+            payload = json.load(f)
+        with self._lock:
+            self._etag = payload.get("etag")
+            self._last_modified = payload.get("last_modified")
+            self._records = {
+                breach_id: (digest, item)
+                for breach_id, (digest, item) in payload.get("breaches", {}).items()
+            }
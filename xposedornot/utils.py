@@ -1,9 +1,16 @@
 """Utility functions for the XposedOrNot API client."""
 
+from __future__ import annotations
+
 import re
+import sqlite3
+from datetime import datetime, timezone
+from typing import Iterable, Union
 
 from Crypto.Hash import keccak
 
+BytesLike = Union[bytes, bytearray, memoryview]
+
 
 def validate_email(email: str) -> bool:
     """Validate email format.
@@ -35,3 +42,91 @@ def hash_password_keccak512(password: str) -> str:
     k = keccak.new(digest_bits=512)
     k.update(password.encode("utf-8"))
     return k.hexdigest()[:10]
+
+
+def connect_sqlite(path: str) -> sqlite3.Connection:
+    """Open a SQLite connection for state shared between processes.
+
+    The database runs in WAL mode with autocommit, so readers never block
+    writers and callers control transactions explicitly.
+
+    Args:
+        path: Path of the database file.
+
+    Returns:
+        A connection usable from any thread (callers must serialize access).
+    """
+    conn = sqlite3.connect(path, timeout=30.0, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def keccak512_digests(passwords: Iterable[str | BytesLike]) -> list[bytes]:
+    """Hash a batch of passwords using original Keccak-512.
+
+    Bytes-like inputs (including memoryview slices of a memory-mapped file)
+    are hashed as-is without copying; strings are UTF-8 encoded first, so
+    results match hash_password_keccak512().
+
+    Args:
+        passwords: Passwords to hash.
+
+    Returns:
+        The full 64-byte digest for each password, in input order.
+    """
+    new = keccak.new
+    digests = []
+    for password in passwords:
+        if isinstance(password, str):
+            password = password.encode("utf-8")
+        digests.append(new(digest_bits=512, data=password).digest())
+    return digests
+
+
+def keccak512_prefix(digest: bytes) -> str:
+    """Return the 10-character hash prefix sent to the password API.
+
+    Args:
+        digest: A full Keccak-512 digest from keccak512_digests().
+
+    Returns:
+        The first 10 hex characters of the digest.
+    """
+    return digest[:5].hex()
+
+
+_DATE_PATTERN = re.compile(r"^(\d{4})(?:-(\d{1,2})(?:-(\d{1,2}))?)?")
+
+
+def parse_date(value: str | None) -> datetime | None:
+    """Parse a date as returned by the API.
+
+    Accepts ISO 8601 dates and timestamps (with or without offset) as well
+    as bare years and year-months, which some endpoints return.
+
+    Args:
+        value: The date string.
+
+    Returns:
+        A timezone-aware datetime (UTC unless an offset is given), or None
+        if the value is empty or cannot be parsed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        # fromisoformat() only accepts "Z" from Python 3.11
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        match = _DATE_PATTERN.match(value)
+        if match is None:
+            return None
+        year, month, day = (int(part) if part else 1 for part in match.groups())
+        try:
+            parsed = datetime(year, month, day)
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
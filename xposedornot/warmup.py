@@ -0,0 +1,117 @@
+"""Connection pre-warming.
+
+The first request to each API host pays for DNS resolution, the TCP
+connection and the TLS handshake. warm_up() pays that ahead of time by
+sending a HEAD request for the root of each host, which leaves an open
+connection in the client's pool for the next API call to reuse. The root
+is not an API endpoint, so these requests bypass the rate limiter, quota
+and cache.
+
+Idle pooled connections expire (see XposedOrNot.KEEPALIVE_EXPIRY), and
+servers close them too. KeepAliveRefresher re-warms the pool periodically
+so that latency-sensitive calls keep finding a warm connection.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterable
+
+import httpx
+
+from .exceptions import APIError
+from .metadata import RequestTracer
+from .models import RequestTimings
+
+if TYPE_CHECKING:
+    from .client import XposedOrNot
+
+
+def origin(base_url: str) -> str:
+    """Return the scheme://host[:port]/ root of a base URL."""
+    return str(httpx.URL(base_url).copy_with(path="/", query=None, fragment=None))
+
+
+def _connect(http: httpx.Client, url: str) -> RequestTimings:
+    tracer = RequestTracer()
+    try:
+        http.request("HEAD", url, extensions={"trace": tracer})
+    except httpx.RequestError as e:
+        raise APIError(f"Warm-up of {url} failed: {str(e)}") from e
+    return tracer.timings()
+
+
+def warm_up(
+    client: "XposedOrNot", origins: Iterable[str], connections: int = 1
+) -> dict[str, list[RequestTimings]]:
+    """Open pooled connections to each origin.
+
+    Args:
+        client: The client whose connection pool is warmed.
+        origins: Host roots, e.g. "https://api.xposedornot.com/".
+        connections: Connections to open per host. Requests are sent
+                     concurrently so that each needs its own connection.
+
+    Returns:
+        Mapping of origin to the timings of its warm-up requests. Hosts with
+        a connection already pooled show no connect or tls time.
+
+    Raises:
+        APIError: If a host cannot be reached.
+    """
+    if connections < 1:
+        raise ValueError("connections must be at least 1")
+    http = client._client
+    targets = [url for url in origins for _ in range(connections)]
+    with ThreadPoolExecutor(max_workers=len(targets) or 1) as executor:
+        timings = list(executor.map(lambda url: _connect(http, url), targets))
+
+    result: dict[str, list[RequestTimings]] = {}
+    for url, timing in zip(targets, timings):
+        result.setdefault(url, []).append(timing)
+    return result
+
+
+class KeepAliveRefresher:
+    """Background thread re-warming a client's connections periodically.
+
+    Failures are ignored; the next round tries again.
+    """
+
+    def __init__(self, client: "XposedOrNot", interval: float, connections: int = 1):
+        """Start refreshing.
+
+        Args:
+            client: The client to keep warm.
+            interval: Seconds between rounds. Keep it below the client's
+                      KEEPALIVE_EXPIRY and the servers' idle timeout.
+            connections: Connections to keep open per host.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self._client = client
+        self._interval = interval
+        self._connections = connections
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="xposedornot-keepalive", daemon=True)
+        self._thread.start()
+
+    @property
+    def interval(self) -> float:
+        """Seconds between refresh rounds."""
+        return self._interval
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            try:
+                warm_up(self._client, self._client._warmup_origins(), self._connections)
+            except Exception:
+                # Best effort: an unreachable host is simply tried again
+                continue
+
+    def stop(self) -> None:
+        """Stop refreshing and wait for a round in progress to finish."""
+        self._stopped.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
@@ -0,0 +1,227 @@
+"""Monitoring a large watchlist of email addresses.
+
+WatchlistMonitor stores each watched address with the breaches it was
+last found in (in SQLite, so the state survives restarts and scales to
+hundreds of thousands of addresses). Rather than re-checking every address
+on each run, it re-checks addresses in order of how likely they are to
+have new exposures, given a catalog diff from CatalogSync:
+
+1. addresses on the domain of a new or changed breach,
+2. addresses never checked, or last checked longer than max_age ago,
+3. only with sweep=True, and if the catalog changed at all, the remaining
+   addresses, least recently checked first.
+
+The cost of a run therefore follows the volume of catalog changes (plus
+the addresses that fall due each day) rather than the size of the
+watchlist. Breaches without a domain reach the other addresses through
+the max_age re-checks, or sooner with a sweep.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from .catalog import normalize_domain
+from .exceptions import NotFoundError, ValidationError
+from .models import CatalogDiff, EmailBreachDetailedResponse, WatchlistAlert
+from .scheduler import Priority, context_with_priority
+from .utils import connect_sqlite, validate_email
+
+if TYPE_CHECKING:
+    from .client import XposedOrNot
+
+# Least recently checked first; never-checked addresses before all others
+_OLDEST_FIRST = "ORDER BY checked_at IS NOT NULL, checked_at"
+
+
+class WatchlistMonitor:
+    """Re-checks watched addresses that catalog changes may have affected.
+
+    Example:
+        >>> from xposedornot import CatalogSync, WatchlistMonitor, XposedOrNot
+        >>> xon = XposedOrNot(api_key="your-key")
+        >>> monitor = WatchlistMonitor(xon, "watchlist.sqlite")
+        >>> monitor.add(employee_addresses)
+        >>> diff = CatalogSync(xon, path="catalog.json").sync()
+        >>> for alert in monitor.run(diff, limit=5000):
+        ...     print(alert.email, alert.new_breaches)
+    """
+
+    DEFAULT_MAX_AGE = 30 * 86400.0  # Re-check every address at least monthly
+
+    def __init__(
+        self,
+        client: "XposedOrNot",
+        path: str | os.PathLike[str],
+        max_age: float = DEFAULT_MAX_AGE,
+        priority: Priority = Priority.BULK,
+    ):
+        """Initialize the monitor.
+
+        Args:
+            client: The client used for the checks.
+            path: Path of the SQLite database holding the watchlist.
+            max_age: Seconds after which an address is re-checked even if
+                     no catalog change points at it.
+            priority: Priority of the checks under the free-API rate limit.
+        """
+        self._client = client
+        self._max_age = max_age
+        self._priority = priority
+        self._conn = connect_sqlite(os.fspath(path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS watchlist ("
+            "email TEXT PRIMARY KEY, domain TEXT NOT NULL, breaches TEXT, checked_at REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS watchlist_domain ON watchlist (domain)")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS watchlist_checked_at ON watchlist (checked_at)"
+        )
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM watchlist").fetchone()[0])
+
+    def add(self, emails: Iterable[str]) -> int:
+        """Add addresses to the watchlist.
+
+        Returns:
+            Number of addresses that were not watched yet.
+
+        Raises:
+            ValidationError: If an address is invalid (nothing is added).
+        """
+        rows = []
+        for email in emails:
+            if not validate_email(email):
+                raise ValidationError(f"Invalid email format: {email}")
+            rows.append((email, normalize_domain(email.rpartition("@")[2])))
+
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO watchlist (email, domain) VALUES (?, ?)", rows
+            )
+            self._conn.execute("COMMIT")
+            return self._conn.total_changes - before
+
+    def remove(self, emails: Iterable[str]) -> None:
+        """Stop watching addresses."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "DELETE FROM watchlist WHERE email = ?", ((email,) for email in emails)
+            )
+            self._conn.execute("COMMIT")
+
+    def known_breaches(self, email: str) -> list[str] | None:
+        """Breaches an address was found in at its last check (None if never checked)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT breaches FROM watchlist WHERE email = ?", (email,)
+            ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return json.loads(row[0])  # type: ignore[no-any-return]
+
+    def plan(
+        self, diff: CatalogDiff | None = None, limit: int | None = None, sweep: bool = False
+    ) -> list[str]:
+        """Return the addresses a run would re-check, most likely affected first.
+
+        Args:
+            diff: Catalog changes since the previous run, if any.
+            limit: Maximum number of addresses.
+            sweep: If the catalog changed, also plan every other address,
+                   least recently checked first. Without a limit this
+                   re-checks the whole watchlist.
+        """
+        planned: dict[str, None] = {}
+
+        def take(query: str, params: tuple[object, ...] = ()) -> None:
+            with self._lock:
+                for (email,) in self._conn.execute(query, params):
+                    if limit is not None and len(planned) >= limit:
+                        return
+                    planned.setdefault(email)
+
+        domains = set()
+        if diff is not None:
+            for breach in diff.added + diff.changed:
+                if breach.domain:
+                    domains.add(normalize_domain(breach.domain))
+        for domain in sorted(domains):
+            take(
+                f"SELECT email FROM watchlist WHERE domain = ? OR domain LIKE ? {_OLDEST_FIRST}",
+                (domain, f"%.{domain}"),
+            )
+
+        take(
+            "SELECT email FROM watchlist WHERE checked_at IS NULL OR checked_at < ? "
+            + _OLDEST_FIRST,
+            (time.time() - self._max_age,),
+        )
+        if sweep and diff is not None and diff.has_changes:
+            take(f"SELECT email FROM watchlist {_OLDEST_FIRST}")
+
+        return list(planned)
+
+    def run(
+        self, diff: CatalogDiff | None = None, limit: int | None = None, sweep: bool = False
+    ) -> Iterator[WatchlistAlert]:
+        """Re-check the planned addresses and report new exposures.
+
+        Each address's state is saved as soon as it is checked, so a run
+        that stops early (e.g. on QuotaExceededError) loses no work. The
+        first check of an address only records its breaches.
+
+        Args:
+            diff: Catalog changes since the previous run, from CatalogSync.
+            limit: Maximum number of addresses to re-check.
+            sweep: Also re-check addresses not on a changed breach's domain
+                   (see plan()).
+
+        Yields:
+            A WatchlistAlert for each address found in new breaches.
+
+        Raises:
+            RateLimitError: If rate limit is exceeded after all retries.
+            QuotaExceededError: If the client's quota is used up.
+            APIError: For other API errors.
+        """
+        context = context_with_priority(self._priority)
+        for email in self.plan(diff, limit, sweep):
+            breaches = context.copy().run(self._check, email)
+            previous = self.known_breaches(email)
+            with self._lock:
+                self._conn.execute(
+                    "UPDATE watchlist SET breaches = ?, checked_at = ? WHERE email = ?",
+                    (json.dumps(breaches), time.time(), email),
+                )
+            if previous is None:
+                continue
+            known = {breach_id.casefold() for breach_id in previous}
+            new = [breach_id for breach_id in breaches if breach_id.casefold() not in known]
+            if new:
+                yield WatchlistAlert(email=email, new_breaches=new, breaches=breaches)
+
+    def _check(self, email: str) -> list[str]:
+        try:
+            # A cached result from before a new breach would hide it
+            result = self._client._email.check(email, refresh=True)
+        except NotFoundError:
+            return []
+        if isinstance(result, EmailBreachDetailedResponse):
+            return [breach.breach_id for breach in result.breaches]
+        return list(result.breaches)